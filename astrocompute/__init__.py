@@ -1,4 +1,18 @@
-from .constants import ARCS, AU, C_LIGHT, DEG, PI, PI2, RAD
+from .constants import (
+    ARCS,
+    AU,
+    C_LIGHT,
+    DEG,
+    GM_SUN,
+    K_GAUSS,
+    PI,
+    PI2,
+    RAD,
+)
+
+# Subpackages are imported on first attribute access, so that
+# ``import astrocompute`` stays cheap for short-lived processes.
+_SUBPACKAGES = ("backend", "library", "models")
 
 __all__ = [
     "PI",
@@ -8,4 +22,19 @@ __all__ = [
     "ARCS",
     "AU",
     "C_LIGHT",
+    "K_GAUSS",
+    "GM_SUN",
 ]
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        import importlib  # pylint: disable=import-outside-toplevel
+
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_SUBPACKAGES])
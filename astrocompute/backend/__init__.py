@@ -0,0 +1,120 @@
+"""
+This package selects the implementation of the columnar batch kernels.
+
+The kernels (coordinate conversions, matrix application, separations,
+sexagesimal conversions and orbit propagation over whole columns) have a
+pure Python implementation, which always works, and a NumPy implementation,
+which is much faster on large columns but needs NumPy.  Both take columns
+(any sequence of numbers) and return ``array('d')`` columns, exactly like
+the library functions of the same names.
+
+The backend is chosen when a kernel is first used, from the
+ASTROCOMPUTE_BACKEND environment variable: ``python``, ``numpy`` or
+``auto`` (the default), which picks NumPy when it is installed.  It can be
+changed at runtime with set_backend.  Importing this package imports
+neither NumPy nor the library modules, so processes that never call a
+kernel do not pay for them::
+
+    from astrocompute import backend
+
+    rs, thetas = backend.cartesian_to_polar_batch(xs, ys)
+"""
+
+# Only modules that the interpreter loads at startup anyway are imported
+# here; typing and importlib.util alone would double the import time.
+import os
+from types import ModuleType
+
+BACKEND_ENV = "ASTROCOMPUTE_BACKEND"
+
+FUNCTIONS = (
+    "apply_columns",
+    "cartesian_to_polar_batch",
+    "cartesian_to_spherical_batch",
+    "ddd_batch",
+    "dms_batch",
+    "polar_to_cartesian_batch",
+    "propagate_batch",
+    "separation_paired",
+    "spherical_to_cartesian_batch",
+)
+
+_MODULES = {
+    "python": "astrocompute.backend.pure_python",
+    "numpy": "astrocompute.backend.numpy_backend",
+}
+
+_REQUIREMENTS = {"numpy": "numpy"}
+
+_active: ModuleType | None = None
+
+
+def available_backends() -> list[str]:
+    """
+    List the backends whose requirements are installed.
+
+    The requirements are looked up without being imported.
+
+    :return: The names of the usable backends
+    """
+    import importlib.util  # pylint: disable=import-outside-toplevel
+
+    return [
+        name
+        for name in _MODULES
+        if name not in _REQUIREMENTS
+        or importlib.util.find_spec(_REQUIREMENTS[name]) is not None
+    ]
+
+
+def _resolve(name: str) -> str:
+    name = name.strip().lower()
+    if name == "auto":
+        return "numpy" if "numpy" in available_backends() else "python"
+
+    if name not in _MODULES:
+        raise ValueError(
+            f"Unknown backend {name!r}, expected one of "
+            f"{['auto', *_MODULES]}"
+        )
+
+    return name
+
+
+def set_backend(name: str) -> ModuleType:
+    """
+    Select and load a backend.
+
+    :param name: "python", "numpy" or "auto"
+    :return: The backend module
+    :raises: ValueError if the name is unknown
+    :raises: ImportError if the requirements of the backend are missing
+    """
+    import importlib  # pylint: disable=import-outside-toplevel
+
+    global _active  # pylint: disable=global-statement
+    _active = importlib.import_module(_MODULES[_resolve(name)])
+    return _active
+
+
+def get_backend() -> ModuleType:
+    """
+    Get the active backend, loading it on first use.
+
+    :return: The backend module; its NAME is "python" or "numpy"
+    """
+    if _active is None:
+        return set_backend(os.environ.get(BACKEND_ENV, "auto"))
+
+    return _active
+
+
+def __getattr__(name: str):
+    if name in FUNCTIONS:
+        return getattr(get_backend(), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *FUNCTIONS])
@@ -0,0 +1,432 @@
+"""
+This module is the NumPy backend.
+
+Every function gives the same results as the library function of the same
+name, up to floating point rounding, but computes whole columns with NumPy
+instead of one row at a time.  The rounded seconds of dms_batch are exactly
+those of the library, since a different rounding would move carries into
+the minutes and degrees.  Float64 columns are read without copying;
+results are copied into ``array('d')`` columns (and ``array('q')`` for the
+integer columns of dms_batch), so callers see the same types with either
+backend.
+"""
+
+from array import array
+from itertools import repeat
+from typing import Optional, Tuple
+
+import numpy as np
+
+from astrocompute.constants import GM_SUN
+from astrocompute.library.columns import Column, ColumnLike, validate_lengths
+from astrocompute.library.kepler import (
+    MAX_ITERATIONS,
+    TOLERANCE,
+    ColumnOrValue,
+    OrbitState,
+)
+from astrocompute.library.matrix3d import Mat3D
+
+NAME = "numpy"
+
+
+def _array(column: ColumnLike) -> np.ndarray:
+    if isinstance(column, array) and column.typecode == "d" and column:
+        return np.frombuffer(column, dtype=np.float64)
+
+    return np.asarray(column, dtype=np.float64)
+
+
+def _column(values: np.ndarray, typecode: str = "d") -> array:
+    dtype = np.float64 if typecode == "d" else np.int64
+    column = array(typecode)
+    column.frombytes(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+    return column
+
+
+def cartesian_to_polar_batch(
+    xs: ColumnLike, ys: ColumnLike
+) -> Tuple[Column, Column]:
+    """
+    Convert columns of Cartesian coordinates to polar coordinates.
+
+    :param xs: The x-coordinates
+    :param ys: The y-coordinates
+    :return: The radius and angle (in radians) columns
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(xs, ys)
+    x, y = _array(xs), _array(ys)
+
+    return _column(np.hypot(x, y)), _column(np.arctan2(y, x))
+
+
+def polar_to_cartesian_batch(
+    rs: ColumnLike, thetas: ColumnLike
+) -> Tuple[Column, Column]:
+    """
+    Convert columns of polar coordinates to Cartesian coordinates.
+
+    :param rs: The radii
+    :param thetas: The angles in radians
+    :return: The x and y coordinate columns
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(rs, thetas)
+    r, theta = _array(rs), _array(thetas)
+
+    return _column(r * np.cos(theta)), _column(r * np.sin(theta))
+
+
+def cartesian_to_spherical_batch(
+    xs: ColumnLike, ys: ColumnLike, zs: ColumnLike
+) -> Tuple[Column, Column, Column]:
+    """
+    Convert columns of Cartesian coordinates to spherical coordinates.
+
+    :param xs: The x-coordinates
+    :param ys: The y-coordinates
+    :param zs: The z-coordinates
+    :return: The radius, theta and phi columns
+    :raises: ValueError if the columns have different lengths
+    :raises: ZeroDivisionError if any point is the origin
+    """
+    validate_lengths(xs, ys, zs)
+    x, y, z = _array(xs), _array(ys), _array(zs)
+
+    r = np.hypot(np.hypot(x, y), z)
+    if np.any(r == 0.0):
+        raise ZeroDivisionError("float division by zero")
+
+    return (
+        _column(r),
+        _column(np.arccos(np.clip(z / r, -1.0, 1.0))),
+        _column(np.arctan2(y, x)),
+    )
+
+
+def spherical_to_cartesian_batch(
+    rs: ColumnLike, thetas: ColumnLike, phis: ColumnLike
+) -> Tuple[Column, Column, Column]:
+    """
+    Convert columns of spherical coordinates to Cartesian coordinates.
+
+    :param rs: The radii
+    :param thetas: The theta angles in radians
+    :param phis: The phi angles in radians
+    :return: The x, y and z coordinate columns
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(rs, thetas, phis)
+    r, theta, phi = _array(rs), _array(thetas), _array(phis)
+
+    r_cos_theta = r * np.cos(theta)
+    return (
+        _column(r_cos_theta * np.cos(phi)),
+        _column(r_cos_theta * np.sin(phi)),
+        _column(r * np.sin(theta)),
+    )
+
+
+def apply_columns(
+    matrix: Mat3D, xs: ColumnLike, ys: ColumnLike, zs: ColumnLike
+) -> Tuple[Column, Column, Column]:
+    """
+    Applies a matrix to vectors stored as coordinate columns.
+
+    :param matrix: The matrix
+    :param xs: The x-coordinates of the vectors
+    :param ys: The y-coordinates of the vectors
+    :param zs: The z-coordinates of the vectors
+    :return: The x, y and z columns of the transformed vectors
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(xs, ys, zs)
+    vectors = np.vstack([_array(xs), _array(ys), _array(zs)])
+    x, y, z = np.asarray(matrix.data, dtype=np.float64) @ vectors
+
+    return _column(x), _column(y), _column(z)
+
+
+def separation_paired(
+    thetas1: ColumnLike,
+    phis1: ColumnLike,
+    thetas2: ColumnLike,
+    phis2: ColumnLike,
+) -> Column:
+    """
+    Calculate the separations between two sets of positions row by row.
+
+    :param thetas1: The polar angles of the first positions
+    :param phis1: The azimuthal angles of the first positions
+    :param thetas2: The polar angles of the second positions
+    :param phis2: The azimuthal angles of the second positions
+    :return: The separations in radians
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(thetas1, phis1, thetas2, phis2)
+    theta1, theta2 = _array(thetas1), _array(thetas2)
+    dphi = _array(phis2) - _array(phis1)
+
+    sin_t1, cos_t1 = np.sin(theta1), np.cos(theta1)
+    sin_t2, cos_t2 = np.sin(theta2), np.cos(theta2)
+    sin_dphi, cos_dphi = np.sin(dphi), np.cos(dphi)
+
+    return _column(
+        np.arctan2(
+            np.hypot(
+                sin_t2 * sin_dphi, sin_t1 * cos_t2 - cos_t1 * sin_t2 * cos_dphi
+            ),
+            cos_t1 * cos_t2 + sin_t1 * sin_t2 * cos_dphi,
+        )
+    )
+
+
+def ddd_batch(ds: ColumnLike, ms: ColumnLike, ss: ColumnLike) -> Column:
+    """
+    Convert columns of degrees, minutes, seconds to decimal degrees
+
+    :param ds: degrees
+    :param ms: minutes
+    :param ss: seconds
+    :return: Angles in decimal representation
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(ds, ms, ss)
+    d, m, s = _array(ds), _array(ms), _array(ss)
+
+    magnitude = np.abs(d) + np.abs(m) / 60.0 + np.abs(s) / 3600.0
+    negative = (d < 0) | (m < 0) | (s < 0)
+
+    return _column(np.where(negative, -magnitude, magnitude))
+
+
+def _round(values: np.ndarray, precision: int) -> np.ndarray:
+    """
+    Round to a number of decimals exactly like the built-in round.
+
+    np.round rounds values * 10**precision half to even, so it differs from
+    round (which rounds the exact decimal value of every float) where the
+    scaled value is within rounding error of a half.  Only those rows are
+    rounded by round; for the others both give the same float.
+
+    :param values: The values
+    :param precision: The number of decimals
+    :return: The rounded values
+    """
+    if not 0 <= precision <= 15:
+        return np.fromiter(
+            map(round, values.tolist(), repeat(precision)),
+            np.float64,
+            len(values),
+        )
+
+    rounded = np.round(values, precision)
+    scaled = values * 10.0**precision
+    halfway = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-12 * np.maximum(
+        1.0, np.abs(scaled)
+    )
+    for i in np.flatnonzero(halfway).tolist():
+        rounded[i] = round(float(values[i]), precision)
+
+    return rounded
+
+
+def dms_batch(
+    dds: ColumnLike, precision: Optional[int] = None
+) -> Tuple[array, array, Column]:
+    """
+    Convert a column of decimal degrees to degrees, minutes, seconds
+
+    :param dds: Angles in decimal representation
+    :param precision: Round the seconds to this many decimals, carrying
+        60 seconds into the minutes and 60 minutes into the degrees
+    :return: Integer columns of degrees and minutes, and a column of seconds
+    """
+    dd = _array(dds)
+    magnitude = np.abs(dd)
+    degrees = np.trunc(magnitude)
+    fraction = magnitude - degrees
+    minutes = np.trunc(fraction * 60)
+    seconds = (fraction - minutes / 60) * 3600
+
+    if precision is not None:
+        seconds = _round(seconds, precision)
+        carry = seconds >= 60
+        seconds = np.where(carry, seconds - 60, seconds)
+        minutes = minutes + carry
+        carry = minutes == 60
+        minutes = np.where(carry, 0.0, minutes)
+        degrees = degrees + carry
+
+    negative = dd < 0
+    on_degrees = negative & (degrees != 0)
+    on_minutes = negative & ~on_degrees & (minutes != 0)
+    on_seconds = negative & ~on_degrees & ~on_minutes
+
+    return (
+        _column(np.where(on_degrees, -degrees, degrees), "q"),
+        _column(np.where(on_minutes, -minutes, minutes), "q"),
+        _column(np.where(on_seconds, -seconds, seconds)),
+    )
+
+
+def _odd_tail(x: np.ndarray, sign: float) -> np.ndarray:
+    # x - sin x (sign -1) or sinh x - x (sign 1); below |x| = 1 ten terms
+    # of the series reach double precision.
+    x2 = x * x
+    term = x * x2 / 6.0
+    total = term.copy()
+    for n in range(3, 23, 2):
+        term = term * (sign * x2 / ((n + 1) * (n + 2)))
+        total += term
+
+    direct = x - np.sin(x) if sign < 0 else np.sinh(x) - x
+    return np.where(np.abs(x) < 1.0, total, direct)
+
+
+def _solve(
+    anomaly: np.ndarray,
+    m: np.ndarray,
+    e: np.ndarray,
+    sign: float,
+    name: str,
+) -> np.ndarray:
+    """
+    Solve Kepler's equation by Newton's method, iterating only the rows
+    that have not converged yet.
+
+    :param anomaly: The starting values, updated in place
+    :param m: The mean anomalies
+    :param e: The eccentricities
+    :param sign: -1 for elliptic and 1 for hyperbolic orbits
+    :param name: The name of the anomaly for error messages
+    :return: The anomalies
+    :raises: ValueError if a row does not converge
+    """
+    # |1 - e| for both kinds of orbit
+    linear = sign * (e - 1.0)
+    sin_half = np.sin if sign < 0 else np.sinh
+
+    rows = np.arange(anomaly.size)
+    for _ in range(MAX_ITERATIONS):
+        x, k = anomaly[rows], e[rows]
+        half = sin_half(0.5 * x)
+        step = (linear[rows] * x + k * _odd_tail(x, sign) - m[rows]) / (
+            linear[rows] + 2.0 * k * half * half
+        )
+        x -= step
+        anomaly[rows] = x
+        rows = rows[np.abs(step) > TOLERANCE * np.maximum(1.0, np.abs(x))]
+        if not rows.size:
+            return anomaly
+
+    raise ValueError(
+        f"The {name} anomaly did not converge for M={m[rows[0]]!r}, "
+        f"e={e[rows[0]]!r}"
+    )
+
+
+def propagate_batch(
+    qs: ColumnOrValue,
+    es: ColumnOrValue,
+    inclinations: ColumnOrValue,
+    nodes: ColumnOrValue,
+    perihelion_arguments: ColumnOrValue,
+    perihelion_times: ColumnOrValue,
+    ts: ColumnOrValue,
+    gm: float = GM_SUN,
+) -> OrbitState:
+    """
+    Calculate the positions and velocities of bodies at times.
+
+    Every argument is a column or a single value that applies to every
+    row.  Elliptic, parabolic (e == 1) and hyperbolic orbits may be mixed.
+
+    :param qs: The perihelion distances in AU
+    :param es: The eccentricities
+    :param inclinations: The inclinations in radians
+    :param nodes: The longitudes of the ascending nodes in radians
+    :param perihelion_arguments: The arguments of perihelion in radians
+    :param perihelion_times: The times of perihelion passage in days
+    :param ts: The times in days
+    :param gm: The gravitational parameter in AU^3/day^2, the Sun's by
+        default
+    :return: The position (AU) and velocity (AU/day) columns
+    :raises: ValueError if the columns have different lengths, the
+        elements are invalid or an anomaly does not converge
+    """
+    values = (qs, es, inclinations, nodes, perihelion_arguments)
+    values += (perihelion_times, ts)
+    is_value = [isinstance(value, (int, float)) for value in values]
+    validate_lengths(*(v for v, single in zip(values, is_value) if not single))
+    q, e, inc, node, peri, t0, t = np.broadcast_arrays(
+        *(
+            np.atleast_1d(float(value) if single else _array(value))
+            for value, single in zip(values, is_value)
+        )
+    )
+
+    if np.any(q <= 0.0) or np.any(e < 0.0):
+        raise ValueError("Expected q > 0 and e >= 0 in every row")
+
+    dt = t - t0
+    u, v, vu, vv = (np.empty(q.shape) for _ in range(4))
+
+    for rows, sign in ((e < 1.0, -1.0), (e > 1.0, 1.0)):
+        if not np.any(rows):
+            continue
+
+        qr, er, dtr = q[rows], e[rows], dt[rows]
+        a = qr / (sign * (er - 1.0))
+        m = np.sqrt(gm / a) / a * dtr
+        if sign < 0:
+            m = m - 2 * np.pi * np.round(m / (2 * np.pi))
+            start = np.where(
+                er < 0.8,
+                m,
+                np.copysign(np.minimum(np.cbrt(6.0 * np.abs(m)), np.pi), m),
+            )
+            x = _solve(start, m, er, sign, "eccentric")
+            half = 2.0 * a * np.sin(0.5 * x) ** 2
+            sin_x, cos_x = np.sin(x), np.cos(x)
+        else:
+            am = np.abs(m)
+            start = np.minimum(np.log(2.0 * am / er + 1.8), np.cbrt(6.0 * am))
+            x = np.copysign(_solve(start, am, er, sign, "hyperbolic"), m)
+            half = 2.0 * a * np.sinh(0.5 * x) ** 2
+            sin_x, cos_x = np.sinh(x), np.cosh(x)
+
+        b_a = np.sqrt(sign * (er - 1.0) * (er + 1.0))
+        k = np.sqrt(gm * a) / (qr + er * half)
+        u[rows], v[rows] = qr - half, a * b_a * sin_x
+        vu[rows], vv[rows] = -k * sin_x, k * b_a * cos_x
+
+    rows = e == 1.0
+    if np.any(rows):
+        qr = q[rows]
+        w = np.sqrt(gm / (2.0 * qr))
+        tan_half = 2.0 * np.sinh(np.arcsinh(1.5 * w / qr * dt[rows]) / 3.0)
+        k = 2.0 * w / (1.0 + tan_half * tan_half)
+        u[rows], v[rows] = qr * (1.0 - tan_half * tan_half), 2.0 * qr * tan_half
+        vu[rows], vv[rows] = -k * tan_half, k
+
+    cos_i, sin_i = np.cos(inc), np.sin(inc)
+    cos_n, sin_n = np.cos(node), np.sin(node)
+    cos_w, sin_w = np.cos(peri), np.sin(peri)
+    p = (
+        cos_w * cos_n - sin_w * cos_i * sin_n,
+        cos_w * sin_n + sin_w * cos_i * cos_n,
+        sin_w * sin_i,
+    )
+    r = (
+        -sin_w * cos_n - cos_w * cos_i * sin_n,
+        -sin_w * sin_n + cos_w * cos_i * cos_n,
+        cos_w * sin_i,
+    )
+
+    return OrbitState(
+        *(_column(u * pk + v * rk) for pk, rk in zip(p, r)),
+        *(_column(vu * pk + vv * rk) for pk, rk in zip(p, r)),
+    )
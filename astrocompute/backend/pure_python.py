@@ -0,0 +1,30 @@
+"""
+This module is the pure Python backend.
+
+It exposes the batch functions of the library modules unchanged.
+"""
+
+from astrocompute.library.coordinate_transform import (
+    cartesian_to_polar_batch,
+    cartesian_to_spherical_batch,
+    polar_to_cartesian_batch,
+    spherical_to_cartesian_batch,
+)
+from astrocompute.library.kepler import propagate_batch
+from astrocompute.library.mathmatics import ddd_batch, dms_batch
+from astrocompute.library.matrix3d import apply_columns
+from astrocompute.library.separation import separation_paired
+
+NAME = "python"
+
+__all__ = [
+    "apply_columns",
+    "cartesian_to_polar_batch",
+    "cartesian_to_spherical_batch",
+    "ddd_batch",
+    "dms_batch",
+    "polar_to_cartesian_batch",
+    "propagate_batch",
+    "separation_paired",
+    "spherical_to_cartesian_batch",
+]
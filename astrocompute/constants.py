@@ -5,3 +5,5 @@ DEG = 180.0 / PI
 ARCS = 3600.0 * 180.0 / PI
 AU = 149597870.0  # Astronomical unit in km
 C_LIGHT = 173.14  # Speed of light in AU/day
+K_GAUSS = 0.01720209895  # Gaussian gravitational constant
+GM_SUN = K_GAUSS * K_GAUSS  # Gravitational parameter of the Sun in AU^3/day^2
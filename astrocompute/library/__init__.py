@@ -0,0 +1,30 @@
+"""
+The library modules are imported on first attribute access, e.g.
+``astrocompute.library.separation``, so importing the package itself does
+not import any of them.
+"""
+
+import importlib
+
+
+def __getattr__(name: str):
+    if not name.startswith("_"):
+        module = f"{__name__}.{name}"
+        try:
+            return importlib.import_module(module)
+        except ModuleNotFoundError as err:
+            if err.name != module:
+                raise
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    import pkgutil  # pylint: disable=import-outside-toplevel
+
+    return sorted(
+        [
+            *globals(),
+            *(module.name for module in pkgutil.iter_modules(__path__)),
+        ]
+    )
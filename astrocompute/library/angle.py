@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 65536
 
 
 class AngleFormat(Enum):
@@ -57,10 +61,11 @@ class AngleSerializer:
         :param angle:
         :return:
         """
-        d, m, s = dms(angle.alpha)
         if angle.format == AngleFormat.Dd:
             return f"{angle.alpha:0.{self.precision}f}"
 
+        d, m, s = dms(angle.alpha)
+
         if angle.format == AngleFormat.DMM:
             return f"{d} {m:02d}"
 
@@ -75,3 +80,111 @@ class AngleSerializer:
             return f"{d} {m:02d} {s:0.{self.precision}f}"
 
         raise ValueError("Invalid AngleFormat")
+
+    def _template(self, angle_format: AngleFormat) -> str:
+        # Fields: 0 degrees, 1 minutes, 2 seconds, 3 decimal minutes,
+        # 4 whole seconds; the same layouts as serialize.
+        if angle_format == AngleFormat.DMM:
+            return "{0} {1:02d}"
+
+        if angle_format == AngleFormat.DMMm:
+            return f"{{0}} {{3:0.{self.precision}f}}"
+
+        if angle_format == AngleFormat.DMMSS:
+            return "{0} {1:02d} {4:02d}"
+
+        if angle_format == AngleFormat.DMMSSs:
+            return f"{{0}} {{1:02d}} {{2:0.{self.precision}f}}"
+
+        raise ValueError("Invalid AngleFormat")
+
+    def _records(
+        self, alphas: Iterable[float], angle_format: AngleFormat
+    ) -> str:
+        width = self.width
+
+        if angle_format == AngleFormat.Dd:
+            # No decomposition needed, the padding is part of the format.
+            record = f"{{:>{width}.{self.precision}f}}\n".format
+            return "".join(map(record, alphas))
+
+        template = self._template(angle_format).format
+        records = []
+        for alpha in alphas:
+            d = int(alpha)
+            minutes = (alpha - d) * 60
+            m = int(minutes)
+            s = (minutes - m) * 60
+            records.append(template(d, m, s, m + s / 60, int(s)).rjust(width))
+
+        records.append("")
+        return "\n".join(records)
+
+    def iter_records(
+        self,
+        alphas: Iterable[float],
+        angle_format: AngleFormat,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        Serialize many angles to fixed-width records, one chunk at a time
+
+        Every record is right-aligned to the serializer width and ends with
+        a newline.  The values are formatted exactly as serialize formats
+        an Angle with the same value and format.
+
+        :param alphas: The angles in decimal degrees
+        :param angle_format: The format of every record
+        :param chunk_size: The number of records per chunk
+        :return: An iterator over the chunks of records
+        :raises: ValueError if chunk_size is smaller than 1 or a value does
+            not fit in the width
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        iterator = iter(alphas)
+        offset = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+
+            text = self._records(chunk, angle_format)
+            if len(text) != len(chunk) * (self.width + 1):
+                self._raise_overflow(text, offset)
+
+            yield text
+            offset += len(chunk)
+
+    def _raise_overflow(self, text: str, offset: int) -> None:
+        for row, record in enumerate(text.splitlines()):
+            if len(record) > self.width:
+                raise ValueError(
+                    f"Angle {offset + row} serializes to {record.strip()!r}, "
+                    f"which is wider than {self.width} characters"
+                )
+
+    def write(
+        self,
+        alphas: Iterable[float],
+        angle_format: AngleFormat,
+        stream: TextIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Write many angles to a text stream as fixed-width records
+
+        :param alphas: The angles in decimal degrees
+        :param angle_format: The format of every record
+        :param stream: The file or buffer to write to
+        :param chunk_size: The number of records per write
+        :return: The number of records written
+        :raises: ValueError if a value does not fit in the width
+        """
+        count = 0
+        for text in self.iter_records(alphas, angle_format, chunk_size):
+            stream.write(text)
+            count += len(text) // (self.width + 1)
+
+        return count
@@ -0,0 +1,237 @@
+"""
+This module provides a streaming parser for columns of angle text.
+
+It is the inverse of AngleSerializer: every value is parsed according to
+one AngleFormat, e.g. ``12.34`` (Dd), ``-12 20`` (DMM), ``-12 20.40``
+(DMMm), ``12 -20 24`` (DMMSS) or ``0 -20 24.50`` (DMMSSs).  The fields may
+be separated by spaces, tabs or colons.  As with mathmatics.ddd an angle is
+negative if any of its fields is, so both ``-0 20 24.5`` and ``0 -20 24.5``
+are -0.34 degrees.
+
+Values are parsed in columnar chunks.  Each chunk is first parsed with a
+single regular expression pass; only chunks with malformed values fall back
+to parsing value by value.  A malformed value is reported on its chunk and
+stored as nan, so the output stays aligned with the input rows.
+"""
+
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Union
+
+from astrocompute.library.angle import AngleFormat
+from astrocompute.library.columns import Column, to_column
+from astrocompute.library.point_parser import MalformedLine
+
+_SIGN = r"([+-]?)"
+_SEP = r"[ \t:]+"
+_DEGREES = _SIGN + r"(\d+)"
+_MINUTES = _SIGN + r"([0-5]?\d)"
+_SECONDS = _MINUTES
+# Rounded output of the serializer can reach 60, e.g. 59.999 as "60.00".
+_DECIMAL = _SIGN + r"([0-5]?\d(?:\.\d*)?|60(?:\.0*)?)"
+
+_FIELDS = {
+    AngleFormat.DMM: (_DEGREES, _MINUTES),
+    AngleFormat.DMMm: (_DEGREES, _DECIMAL),
+    AngleFormat.DMMSS: (_DEGREES, _MINUTES, _SECONDS),
+    AngleFormat.DMMSSs: (_DEGREES, _MINUTES, _DECIMAL),
+}
+
+_PATTERNS: Dict[AngleFormat, Pattern] = {
+    angle_format: re.compile(_SEP.join(fields))
+    for angle_format, fields in _FIELDS.items()
+}
+
+_BLOCK_PATTERNS: Dict[AngleFormat, Pattern] = {
+    angle_format: re.compile("^" + _SEP.join(fields) + "$", re.MULTILINE)
+    for angle_format, fields in _FIELDS.items()
+}
+
+
+@dataclass
+class AngleChunk:
+    """
+    A chunk of parsed angles in decimal degrees.
+
+    Malformed values are nan in ``values`` and described in ``errors``.
+    """
+
+    values: Column
+    errors: List[MalformedLine] = field(default_factory=list)
+
+
+def parse_angle(text: str, angle_format: AngleFormat) -> float:
+    """
+    Parse the text of one angle.
+
+    :param text: The text, e.g. as produced by AngleSerializer.serialize
+    :param angle_format: The format of the text
+    :return: The angle in decimal degrees
+    :raises: ValueError if the text is not an angle in the given format
+    """
+    text = text.strip()
+    if angle_format == AngleFormat.Dd:
+        return float(text)
+
+    pattern = _PATTERNS.get(angle_format)
+    if pattern is None:
+        raise ValueError("Invalid AngleFormat")
+
+    match = pattern.fullmatch(text)
+    if not match:
+        raise ValueError(f"Not a {angle_format.value} angle")
+
+    groups = match.groups()
+    magnitude = float(groups[1]) + float(groups[3]) / 60.0
+    if len(groups) == 6:
+        magnitude += float(groups[5]) / 3600.0
+
+    return -magnitude if "-" in groups[0::2] else magnitude
+
+
+def _parse_block(
+    texts: List[str], angle_format: AngleFormat
+) -> Optional[Column]:
+    """
+    Parse a batch of values in one pass.
+
+    :param texts: The stripped values of the batch
+    :param angle_format: The format of the values
+    :return: The parsed angles, or None if the batch has malformed values
+    """
+    if angle_format == AngleFormat.Dd:
+        try:
+            return to_column(map(float, texts))
+        except ValueError:
+            return None
+
+    block = "\n".join(texts)
+    if block.count("\n") != len(texts) - 1:
+        return None
+
+    found = _BLOCK_PATTERNS[angle_format].findall(block)
+    if len(found) != len(texts):
+        return None
+
+    if len(found[0]) == 4:
+        return to_column(
+            [
+                (
+                    -(float(d) + float(m) / 60.0)
+                    if "-" in (ds, ms)
+                    else float(d) + float(m) / 60.0
+                )
+                for ds, d, ms, m in found
+            ]
+        )
+
+    return to_column(
+        [
+            (
+                -(float(d) + float(m) / 60.0 + float(s) / 3600.0)
+                if "-" in (ds, ms, ss)
+                else float(d) + float(m) / 60.0 + float(s) / 3600.0
+            )
+            for ds, d, ms, m, ss, s in found
+        ]
+    )
+
+
+def _parse_values(
+    texts: List[str], angle_format: AngleFormat, first_line: int
+) -> AngleChunk:
+    """
+    Parse a batch of values one at a time, reporting malformed values.
+
+    :param texts: The stripped values of the batch
+    :param angle_format: The format of the values
+    :param first_line: The line number of the first value of the batch
+    :return: The parsed chunk
+    """
+    values = []
+    errors = []
+
+    for line_number, text in enumerate(texts, start=first_line):
+        try:
+            values.append(parse_angle(text, angle_format))
+        except ValueError as err:
+            values.append(math.nan)
+            errors.append(MalformedLine(line_number, text, str(err)))
+
+    return AngleChunk(to_column(values), errors)
+
+
+def iter_angle_chunks(
+    texts: Iterable[str],
+    angle_format: AngleFormat,
+    chunk_size: int = 65536,
+) -> Iterator[AngleChunk]:
+    """
+    Parse angle text into chunks of decimal degrees.
+
+    Line numbers in the reported errors start at 1.
+
+    :param texts: The values to parse, consumed lazily
+    :param angle_format: The format of the values
+    :param chunk_size: The number of values per chunk
+    :return: An iterator over the parsed chunks
+    :raises: ValueError if chunk_size is smaller than 1 or angle_format is
+        not an AngleFormat
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if not isinstance(angle_format, AngleFormat):
+        raise ValueError("Invalid AngleFormat")
+
+    iterator = iter(texts)
+    first_line = 1
+
+    while batch := list(islice(iterator, chunk_size)):
+        stripped = list(map(str.strip, batch))
+
+        values = _parse_block(stripped, angle_format)
+        if values is not None:
+            yield AngleChunk(values)
+        else:
+            yield _parse_values(stripped, angle_format, first_line)
+
+        first_line += len(batch)
+
+
+def parse_angles(texts: Iterable[str], angle_format: AngleFormat) -> AngleChunk:
+    """
+    Parse a whole column of angle text.
+
+    :param texts: The values to parse
+    :param angle_format: The format of the values
+    :return: All parsed angles and errors
+    """
+    result = AngleChunk(to_column(()))
+    for chunk in iter_angle_chunks(texts, angle_format):
+        result.values.extend(chunk.values)
+        result.errors.extend(chunk.errors)
+
+    return result
+
+
+def read_angle_chunks(
+    path: Union[str, os.PathLike],
+    angle_format: AngleFormat,
+    chunk_size: int = 65536,
+    encoding: str = "utf-8",
+) -> Iterator[AngleChunk]:
+    """
+    Parse a text file with one angle per line into chunks.
+
+    :param path: The path of the file
+    :param angle_format: The format of the values
+    :param chunk_size: The number of values per chunk
+    :param encoding: The encoding of the file
+    :return: An iterator over the parsed chunks
+    """
+    with open(path, encoding=encoding) as stream:
+        yield from iter_angle_chunks(stream, angle_format, chunk_size)
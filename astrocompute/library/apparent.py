@@ -0,0 +1,280 @@
+"""
+This module computes apparent positions, corrected for light-time and
+aberration.
+
+A target is seen where it was when the light now arriving left it: the
+light-time tau solves tau = |r(t - tau) - o(t)| / c, where r is the
+position of the target and o that of the observer.  The equation is
+iterated from tau = 0 until tau changes by less than a tolerance.  The
+apparent direction is then shifted towards the observer's velocity
+(aberration); with the velocity of the Earth this is the annual
+aberration.  Positions are in AU, times in days and velocities in AU/day,
+so that C_LIGHT applies; the frame (heliocentric or barycentric) is the
+caller's.
+
+apparent_positions_batch corrects many targets at once.  Every target
+iterates only until its own light-time has converged, and the positions
+of all unconverged targets are requested from the target function in one
+call per iteration, so a vectorized function (such as orbit_target, which
+uses the active backend) computes them together::
+
+    target = orbit_target(qs, es, incs, nodes, peris, t0s)
+    apparent = apparent_positions_batch(target, ts, earth, earth_velocity)
+"""
+
+import math
+from array import array
+from itertools import repeat
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from astrocompute import backend
+from astrocompute.constants import C_LIGHT, GM_SUN
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    empty_column,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.kepler import ColumnOrValue
+from astrocompute.library.vector import Vector3D
+
+TOLERANCE = 1e-12
+MAX_ITERATIONS = 10
+
+Columns3D = Tuple[ColumnLike, ColumnLike, ColumnLike]
+TargetFunction = Callable[[Sequence[int], Column], Columns3D]
+
+
+class ApparentPositions(NamedTuple):
+    x: Column
+    y: Column
+    z: Column
+    light_times: Column
+    iterations: array
+
+
+def _aberrate(
+    x: float, y: float, z: float, vx: float, vy: float, vz: float
+) -> Vector3D:
+    """
+    Apply the relativistic aberration formula to a position vector.
+
+    :param x: The x-coordinate of the position relative to the observer
+    :param y: The y-coordinate of the position relative to the observer
+    :param z: The z-coordinate of the position relative to the observer
+    :param vx: The x-component of the observer's velocity in AU/day
+    :param vy: The y-component of the observer's velocity in AU/day
+    :param vz: The z-component of the observer's velocity in AU/day
+    :return: The position in the apparent direction, of the same length
+    """
+    distance = math.hypot(x, y, z)
+    if distance == 0.0:
+        return x, y, z
+
+    bx, by, bz = vx / C_LIGHT, vy / C_LIGHT, vz / C_LIGHT
+    inverse_gamma = math.sqrt(1.0 - (bx * bx + by * by + bz * bz))
+    cosine = (x * bx + y * by + z * bz) / distance
+    scale = distance * (1.0 + cosine / (1.0 + inverse_gamma))
+    denominator = 1.0 + cosine
+
+    return (
+        (x * inverse_gamma + scale * bx) / denominator,
+        (y * inverse_gamma + scale * by) / denominator,
+        (z * inverse_gamma + scale * bz) / denominator,
+    )
+
+
+def aberration(position: Vector3D, velocity: Vector3D) -> Vector3D:
+    """
+    Shift a position towards the velocity of the observer.
+
+    The relativistic formula is used, so the result stays exact for any
+    speed below C_LIGHT; to first order the direction moves by v/c times
+    the sine of the angle between the position and the velocity.
+
+    :param position: The position relative to the observer in AU
+    :param velocity: The velocity of the observer in AU/day
+    :return: The position in the apparent direction, of the same length
+    """
+    return _aberrate(*position, *velocity)
+
+
+def light_time(
+    target: Callable[[float], Vector3D],
+    observer: Vector3D,
+    t: float,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> Tuple[Vector3D, float]:
+    """
+    Correct the position of a target for light-time.
+
+    :param target: A function of time that returns the target's position
+    :param observer: The observer's position at t
+    :param t: The time of observation in days
+    :param tol: The convergence tolerance of the light-time in days
+    :param max_iterations: The maximum number of evaluations of target
+    :return: The position of the target at t - tau relative to the
+        observer, and the light-time tau
+    :raises: ValueError if the light-time does not converge
+    """
+    ox, oy, oz = observer
+    tau = 0.0
+    for _ in range(max_iterations):
+        x, y, z = target(t - tau)
+        relative = (x - ox, y - oy, z - oz)
+        tau, previous = math.hypot(*relative) / C_LIGHT, tau
+        if abs(tau - previous) <= tol:
+            return relative, tau
+
+    raise ValueError(f"The light-time did not converge at t={t!r}")
+
+
+def apparent_position(
+    target: Callable[[float], Vector3D],
+    observer: Vector3D,
+    observer_velocity: Vector3D,
+    t: float,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> Vector3D:
+    """
+    Calculate the apparent position of a target, corrected for light-time
+    and aberration.
+
+    :param target: A function of time that returns the target's position
+    :param observer: The observer's position at t
+    :param observer_velocity: The observer's velocity at t in AU/day
+    :param t: The time of observation in days
+    :param tol: The convergence tolerance of the light-time in days
+    :param max_iterations: The maximum number of evaluations of target
+    :return: The apparent position relative to the observer
+    :raises: ValueError if the light-time does not converge
+    """
+    relative, _ = light_time(target, observer, t, tol, max_iterations)
+    return _aberrate(*relative, *observer_velocity)
+
+
+def _expand(values: ColumnOrValue, size: int) -> Sequence[float]:
+    if isinstance(values, (int, float)):
+        return list(repeat(float(values), size))
+
+    return values
+
+
+def apparent_positions_batch(
+    target: TargetFunction,
+    ts: ColumnLike,
+    observer: Tuple[ColumnOrValue, ColumnOrValue, ColumnOrValue],
+    observer_velocity: Optional[
+        Tuple[ColumnOrValue, ColumnOrValue, ColumnOrValue]
+    ] = None,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> ApparentPositions:
+    """
+    Calculate the apparent positions of many targets.
+
+    target is called with the indices of the targets that are still
+    iterating and a column of their retarded times, and returns the x, y
+    and z columns of their positions at those times.  Single values in the
+    observer's position or velocity apply to every row.
+
+    :param target: The target function
+    :param ts: The time of observation of every target in days
+    :param observer: The x, y and z of the observer's position at ts
+    :param observer_velocity: The x, y and z of the observer's velocity at
+        ts in AU/day, or None to skip the aberration correction
+    :param tol: The convergence tolerance of the light-times in days
+    :param max_iterations: The maximum number of evaluations per target
+    :return: The apparent positions relative to the observer, the
+        light-times and the number of evaluations of every target
+    :raises: ValueError if the columns have different lengths or a
+        light-time does not converge
+    """
+    size = len(ts)
+    ox, oy, oz = (_expand(value, size) for value in observer)
+    velocity: List[Sequence[float]] = []
+    if observer_velocity is not None:
+        velocity = [_expand(value, size) for value in observer_velocity]
+    validate_lengths(ts, ox, oy, oz, *velocity)
+
+    xs, ys, zs, taus = (empty_column(size) for _ in range(4))
+    iterations = array("q", bytes(8 * size))
+
+    rows: List[int] = list(range(size))
+    for _ in range(max_iterations):
+        if not rows:
+            break
+
+        times = to_column([ts[i] - taus[i] for i in rows])
+        positions = zip(rows, *target(rows, times))
+        rows = []
+        for i, x, y, z in positions:
+            x, y, z = x - ox[i], y - oy[i], z - oz[i]
+            tau = math.hypot(x, y, z) / C_LIGHT
+            iterations[i] += 1
+            if abs(tau - taus[i]) > tol:
+                rows.append(i)
+            elif velocity:
+                vx, vy, vz = velocity
+                x, y, z = _aberrate(x, y, z, vx[i], vy[i], vz[i])
+            xs[i], ys[i], zs[i], taus[i] = x, y, z, tau
+
+    if rows:
+        raise ValueError(
+            f"The light-time did not converge for {len(rows)} targets, "
+            f"e.g. row {rows[0]}"
+        )
+
+    return ApparentPositions(xs, ys, zs, taus, iterations)
+
+
+def orbit_target(
+    qs: ColumnLike,
+    es: ColumnLike,
+    inclinations: ColumnLike,
+    nodes: ColumnLike,
+    perihelion_arguments: ColumnLike,
+    perihelion_times: ColumnLike,
+    gm: float = GM_SUN,
+) -> TargetFunction:
+    """
+    Get a target function for bodies on two-body orbits.
+
+    The positions are computed by propagate_batch of the active backend.
+
+    :param qs: The perihelion distances in AU
+    :param es: The eccentricities
+    :param inclinations: The inclinations in radians
+    :param nodes: The longitudes of the ascending nodes in radians
+    :param perihelion_arguments: The arguments of perihelion in radians
+    :param perihelion_times: The times of perihelion passage in days
+    :param gm: The gravitational parameter in AU^3/day^2
+    :return: The target function
+    :raises: ValueError if the columns have different lengths
+    """
+    columns = [
+        to_column(column)
+        for column in (
+            qs,
+            es,
+            inclinations,
+            nodes,
+            perihelion_arguments,
+            perihelion_times,
+        )
+    ]
+    size = validate_lengths(*columns)
+
+    def target(rows: Sequence[int], ts: Column) -> Columns3D:
+        selected = columns
+        if len(rows) != size:
+            selected = [
+                array("d", map(column.__getitem__, rows)) for column in columns
+            ]
+
+        return backend.propagate_batch(*selected, ts, gm=gm)[:3]
+
+    return target
@@ -0,0 +1,595 @@
+"""
+This module provides a binary columnar file format for coordinate catalogs.
+
+A catalog file holds the rows of one kind of coordinates (2D/3D points or
+vectors, polar or spherical coordinates) as float64 or float32 columns,
+optionally with a name per row.  Text dumps such as the ones read by
+point_parser have to be parsed number by number; a catalog is opened with
+mmap, so opening it only reads the header and the chunk headers, and the
+columns are read straight from the page cache when they are accessed.
+
+Layout (all integers and floats little-endian)::
+
+    header   magic "ACCATLG\\0", version (u16), dtype ("d" or "f"),
+             has names (bool), kind (12 bytes ASCII), rows (u64)
+    chunk*   rows (u64), then every column as rows floats, then, if the
+             catalog has names, rows + 1 name offsets (i64) and the UTF-8
+             name bytes; each part is padded to 8 bytes
+
+Writes append whole chunks and update the row count in the header after
+each chunk, so a catalog can be extended in chunks (also by reopening it
+with append=True) and a crash while writing a chunk leaves the rows of the
+earlier chunks readable.  A chunk that does not fit in the file (and any
+chunk after it) is ignored on reading and dropped on appending.  A row
+without a name (None, rather than "") is stored as a negative offset,
+-1 - offset.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from enum import Enum
+from itertools import repeat
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+from astrocompute.library.polar_array import PolarArray
+from astrocompute.library.spherical_array import SphericalArray
+from astrocompute.models import Polar, Spherical, Vector2D, Vector3D
+
+MAGIC = b"ACCATLG\x00"
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 65536
+
+_HEADER = struct.Struct("<8sHc?12sQ")
+_ROWS = struct.Struct("<Q")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+CatalogArray = Union[PointArray2D, PointArray3D, PolarArray, SphericalArray]
+PathLike = Union[str, os.PathLike]
+
+
+class CatalogKind(Enum):
+    POINT2D = "point2d"
+    POINT3D = "point3d"
+    VECTOR2D = "vector2d"
+    VECTOR3D = "vector3d"
+    POLAR = "polar"
+    SPHERICAL = "spherical"
+
+
+_COLUMNS: Dict[CatalogKind, Tuple[str, ...]] = {
+    CatalogKind.POINT2D: ("x", "y"),
+    CatalogKind.POINT3D: ("x", "y", "z"),
+    CatalogKind.VECTOR2D: ("x", "y"),
+    CatalogKind.VECTOR3D: ("x", "y", "z"),
+    CatalogKind.POLAR: ("r", "theta"),
+    CatalogKind.SPHERICAL: ("r", "theta", "phi"),
+}
+
+_ROW_TYPES = {
+    CatalogKind.POINT2D: Point2D,
+    CatalogKind.POINT3D: Point3D,
+    CatalogKind.VECTOR2D: Vector2D,
+    CatalogKind.VECTOR3D: Vector3D,
+    CatalogKind.POLAR: Polar,
+    CatalogKind.SPHERICAL: Spherical,
+}
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _little_endian(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(_padded(len(data)) - len(data))
+
+
+def _read_header(header: bytes) -> Tuple[CatalogKind, str, bool, int]:
+    """
+    Unpack and validate a catalog header.
+
+    :param header: The first bytes of the file
+    :return: The kind, dtype, whether the rows have names and the row count
+    :raises: ValueError if the header is not a supported catalog header
+    """
+    if len(header) < _HEADER.size:
+        raise ValueError("Not a catalog file: header too short")
+
+    magic, version, dtype, has_names, kind, rows = _HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError("Not a catalog file: bad magic")
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported catalog version {version}")
+
+    return (
+        CatalogKind(kind.rstrip(b"\x00").decode("ascii")),
+        dtype.decode("ascii"),
+        has_names,
+        rows,
+    )
+
+
+class CatalogWriter:
+    """
+    Writes a catalog file chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        kind: CatalogKind,
+        dtype: str = "d",
+        names: bool = False,
+        append: bool = False,
+    ):
+        """
+        Create a catalog file, or open one for appending.
+
+        :param path: The path of the file
+        :param kind: The kind of coordinates
+        :param dtype: The column type, "d" (float64) or "f" (float32)
+        :param names: Whether every row has a name
+        :param append: Whether to append to an existing file instead of
+            replacing it; the file must have the same kind, dtype and names
+        :raises: ValueError if dtype is invalid or the existing file does
+            not match
+        """
+        if dtype not in ("d", "f"):
+            raise ValueError(f"dtype must be 'd' or 'f', got {dtype!r}")
+
+        self.kind = CatalogKind(kind)
+        self.dtype = dtype
+        self.has_names = names
+
+        if append and os.path.exists(path) and os.path.getsize(path):
+            with Catalog(path) as existing:
+                layout = (existing.kind, existing.dtype, existing.has_names)
+                self.rows, end = len(existing), existing._end
+
+            if layout != (self.kind, dtype, names):
+                raise ValueError(
+                    "Cannot append to a catalog of a different layout, "
+                    f"got {layout}"
+                )
+
+            # Drop a partly written chunk left behind by an earlier writer,
+            # or a chunk cut off by truncating the file, and count only the
+            # readable rows.  end never lies beyond the end of the file, so
+            # truncate cannot extend it with zeros.
+            self._stream = open(path, "r+b")
+            self._stream.truncate(end)
+            self._write_header()
+        else:
+            self._stream = open(path, "wb")
+            self.rows = 0
+            self._write_header()
+
+    def __enter__(self) -> "CatalogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_header(self) -> None:
+        self._stream.seek(0)
+        self._stream.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                self.dtype.encode("ascii"),
+                self.has_names,
+                self.kind.value.encode("ascii"),
+                self.rows,
+            )
+        )
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """
+        The names of the coordinate columns.
+        """
+        return _COLUMNS[self.kind]
+
+    def write_chunk(
+        self,
+        *columns: ColumnLike,
+        names: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        """
+        Append a chunk of rows.
+
+        :param columns: One column per coordinate, in the order of columns
+        :param names: The names of the rows; only for catalogs with names,
+            where None stores unnamed rows
+        :raises: ValueError if the number or lengths of the columns or names
+            do not match the catalog
+        """
+        if len(columns) != len(self.columns):
+            raise ValueError(
+                f"Expected {len(self.columns)} columns, got {len(columns)}"
+            )
+
+        if names is not None and not self.has_names:
+            raise ValueError("The catalog has no names")
+
+        rows = validate_lengths(*columns)
+        if self.has_names:
+            names = list(repeat(None, rows) if names is None else names)
+            if len(names) != rows:
+                raise ValueError(f"Expected {rows} names, got {len(names)}")
+
+        parts = [_ROWS.pack(rows)]
+        for column in columns:
+            values = array(self.dtype, column)
+            parts.append(_pad(_little_endian(values)))
+
+        if self.has_names:
+            offsets, blob = array("q", [0]), bytearray()
+            for name in names:
+                if name is not None:
+                    blob += name.encode("utf-8")
+                    offsets.append(len(blob))
+                else:
+                    offsets.append(-1 - len(blob))
+            parts.append(_little_endian(offsets))
+            parts.append(_pad(bytes(blob)))
+
+        self._stream.seek(0, os.SEEK_END)
+        self._stream.write(b"".join(parts))
+        self.rows += rows
+        self._write_header()
+
+    def write(
+        self, data: CatalogArray, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        Append the rows of a container in chunks.
+
+        :param data: A point array, PolarArray or SphericalArray
+        :param chunk_size: The number of rows per chunk
+        :raises: ValueError if chunk_size is smaller than 1
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        columns = [getattr(data, column) for column in self.columns]
+        names = getattr(data, "names", None) if self.has_names else None
+
+        for start in range(0, len(data), chunk_size):
+            stop = start + chunk_size
+            self.write_chunk(
+                *(column[start:stop] for column in columns),
+                names=names[start:stop] if names is not None else None,
+            )
+
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+        if not self._stream.closed:
+            self._stream.close()
+
+
+class Catalog:
+    """
+    A read-only, memory-mapped catalog file.
+
+    Rows are read lazily: opening the catalog reads only the header and the
+    chunk headers.  Column views returned by iter_chunks point into the
+    mapping and must be released before close is called.
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        Open a catalog file.
+
+        :param path: The path of the file
+        :raises: ValueError if the file is not a supported catalog
+        """
+        with open(path, "rb") as stream:
+            if os.fstat(stream.fileno()).st_size < _HEADER.size:
+                raise ValueError("Not a catalog file: header too short")
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.kind, self.dtype, self.has_names, rows = _read_header(
+                self._mmap
+            )
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        self._itemsize = array(self.dtype).itemsize
+        self._value = struct.Struct("<" + self.dtype)
+        self._starts: List[int] = []
+        self._offsets: List[int] = []
+        self._rows = 0
+
+        # A chunk that does not fit in the file (a truncated file, or one
+        # cut off while the chunk was written) and the chunks after it are
+        # not read.
+        offset = _HEADER.size
+        while self._rows < rows:
+            end = self._chunk_end(offset)
+            if end < 0:
+                break
+            self._starts.append(self._rows)
+            self._offsets.append(offset)
+            self._rows += _ROWS.unpack_from(self._mmap, offset)[0]
+            offset = end
+
+        self._end = offset
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __repr__(self) -> str:
+        return f"Catalog(kind={self.kind.value}, size={len(self)})"
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        self._mmap.close()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """
+        The names of the coordinate columns.
+        """
+        return _COLUMNS[self.kind]
+
+    def _stride(self, rows: int) -> int:
+        return _padded(rows * self._itemsize)
+
+    def _names_offset(self, offset: int, rows: int) -> int:
+        return offset + _ROWS.size + len(self.columns) * self._stride(rows)
+
+    def _chunk_end(self, offset: int) -> int:
+        """
+        Get the end of the chunk at an offset.
+
+        :param offset: The offset of the chunk
+        :return: The offset after the chunk, or -1 if the chunk does not fit
+            in the file
+        """
+        size = len(self._mmap)
+        if offset + _ROWS.size > size:
+            return -1
+
+        (rows,) = _ROWS.unpack_from(self._mmap, offset)
+        end = self._names_offset(offset, rows)
+        if self.has_names:
+            if end + 8 * (rows + 1) > size:
+                return -1
+
+            (last,) = struct.unpack_from("<q", self._mmap, end + 8 * rows)
+            end += 8 * (rows + 1) + _padded(last if last >= 0 else -1 - last)
+
+        return end if end <= size else -1
+
+    def _chunk(self, index: int) -> Tuple[int, int, int]:
+        """
+        Get the first row, row count and offset of a chunk.
+        """
+        start = self._starts[index]
+        stop = (
+            self._starts[index + 1]
+            if index + 1 < len(self._starts)
+            else self._rows
+        )
+        return start, stop - start, self._offsets[index]
+
+    def _view(self, offset: int, rows: int) -> Union[memoryview, array]:
+        data = memoryview(self._mmap)[offset : offset + rows * self._itemsize]
+        if _LITTLE_ENDIAN:
+            return data.cast(self.dtype)
+
+        values = array(self.dtype)
+        values.frombytes(data)
+        values.byteswap()
+        return values
+
+    def iter_chunks(self) -> Iterator[Tuple[int, Tuple[memoryview, ...]]]:
+        """
+        Iterate over the stored chunks without copying.
+
+        :return: An iterator over (first row, columns) pairs, where the
+            columns are views of the mapped file in the order of columns
+        """
+        for index in range(len(self._starts)):
+            start, rows, offset = self._chunk(index)
+            first = offset + _ROWS.size
+            stride = self._stride(rows)
+            yield start, tuple(
+                self._view(first + k * stride, rows)
+                for k in range(len(self.columns))
+            )
+
+    def column(self, name: str) -> Column:
+        """
+        Read a whole coordinate column.
+
+        :param name: The name of the column, e.g. "x" or "theta"
+        :return: A float64 copy of the column
+        :raises: ValueError if the catalog has no such column
+        """
+        if name not in self.columns:
+            raise ValueError(
+                f"No column {name!r} in a {self.kind.value} catalog"
+            )
+
+        k = self.columns.index(name)
+        result = array(self.dtype)
+        for index in range(len(self._starts)):
+            _, rows, offset = self._chunk(index)
+            first = offset + _ROWS.size + k * self._stride(rows)
+            with memoryview(self._mmap) as data:
+                result.frombytes(data[first : first + rows * self._itemsize])
+
+        if not _LITTLE_ENDIAN:
+            result.byteswap()
+
+        return to_column(result)
+
+    def _locate(self, index: int) -> Tuple[int, int, int]:
+        if index < 0:
+            index += self._rows
+
+        if not 0 <= index < self._rows:
+            raise IndexError("catalog index out of range")
+
+        chunk = bisect_right(self._starts, index) - 1
+        start, rows, offset = self._chunk(chunk)
+        return index - start, rows, offset
+
+    def __getitem__(self, index: int) -> Any:
+        row, rows, offset = self._locate(index)
+        first = offset + _ROWS.size + row * self._itemsize
+        stride = self._stride(rows)
+        values = [
+            self._value.unpack_from(self._mmap, first + k * stride)[0]
+            for k in range(len(self.columns))
+        ]
+
+        if self.kind == CatalogKind.POINT2D:
+            return Point2D(*values, self.name(index))
+
+        return _ROW_TYPES[self.kind](*values)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._rows):
+            yield self[index]
+
+    def name(self, index: int) -> Optional[str]:
+        """
+        Get the name of a row.
+
+        :param index: The index of the row
+        :return: The name, or None if the row is unnamed or the catalog has
+            no names
+        """
+        row, rows, offset = self._locate(index)
+        if not self.has_names:
+            return None
+
+        table = self._names_offset(offset, rows)
+        begin, end = struct.unpack_from("<qq", self._mmap, table + 8 * row)
+        if end < 0:
+            return None
+
+        blob = table + 8 * (rows + 1)
+        begin = begin if begin >= 0 else -1 - begin
+        return self._mmap[blob + begin : blob + end].decode("utf-8")
+
+    def names(self) -> Optional[List[Optional[str]]]:
+        """
+        Read the names of all rows.
+
+        :return: The names, or None if the catalog has no names
+        """
+        if not self.has_names:
+            return None
+
+        return [self.name(index) for index in range(self._rows)]
+
+    def to_array(self) -> CatalogArray:
+        """
+        Read the whole catalog into its columnar container.
+
+        :return: A PointArray2D, PointArray3D, PolarArray or SphericalArray
+        :raises: ValueError for vector catalogs, which have no container;
+            use column instead
+        """
+        columns = [self.column(name) for name in self.columns]
+
+        if self.kind == CatalogKind.POINT2D:
+            return PointArray2D(*columns, names=self.names())
+        if self.kind == CatalogKind.POINT3D:
+            return PointArray3D(*columns, names=self.names())
+        if self.kind == CatalogKind.POLAR:
+            return PolarArray(*columns)
+        if self.kind == CatalogKind.SPHERICAL:
+            return SphericalArray(*columns)
+
+        raise ValueError(f"No container for a {self.kind.value} catalog")
+
+
+def write_catalog(
+    path: PathLike,
+    data: CatalogArray,
+    dtype: str = "d",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write a columnar container to a new catalog file.
+
+    Point arrays with names are written with a name column.
+
+    :param path: The path of the file
+    :param data: A point array, PolarArray or SphericalArray
+    :param dtype: The column type, "d" (float64) or "f" (float32)
+    :param chunk_size: The number of rows per chunk
+    :return: The number of rows written
+    :raises: ValueError if data is not a supported container
+    """
+    kinds = {
+        PointArray2D: CatalogKind.POINT2D,
+        PointArray3D: CatalogKind.POINT3D,
+        PolarArray: CatalogKind.POLAR,
+        SphericalArray: CatalogKind.SPHERICAL,
+    }
+    kind = kinds.get(type(data))
+    if kind is None:
+        raise ValueError(f"Cannot write a {type(data).__name__} catalog")
+
+    names = getattr(data, "names", None) is not None
+    with CatalogWriter(path, kind, dtype, names) as writer:
+        writer.write(data, chunk_size)
+        return writer.rows
+
+
+def read_catalog(path: PathLike) -> CatalogArray:
+    """
+    Read a whole catalog file into its columnar container.
+
+    :param path: The path of the file
+    :return: A PointArray2D, PointArray3D, PolarArray or SphericalArray
+    """
+    with Catalog(path) as catalog:
+        return catalog.to_array()
@@ -0,0 +1,384 @@
+"""
+This module approximates functions of time by piecewise Chebyshev series.
+
+An ephemeris that is evaluated again and again for the same body and time
+range (a long position series, a numerical integration, a propagation with
+perturbations) can be replaced by a ChebyshevEphemeris.  The time range is
+split into segments of fixed length; on every segment each coordinate is
+approximated by a Chebyshev series fitted at the Chebyshev nodes, so the
+error is close to the best possible one for the degree.  Positions and
+velocities are then evaluated by Clenshaw's recurrence in a few
+microseconds, independently of the cost of the original function::
+
+    ephemeris = ChebyshevEphemeris.fit(position, t0, t1, 8.0, degree=12)
+    x, y, z = ephemeris.position(t)
+
+The coefficients are kept in one float64 array and can be saved to and
+loaded from a small binary file.  Its layout (little-endian) is::
+
+    header   magic "ACCHEBY\\0", version (u16), degree (u16),
+             dimension (u16), 2 bytes padding, start (f64),
+             segment length (f64), segments (u64)
+    data     segments * dimension * (degree + 1) coefficients (f64),
+             segment by segment and coordinate by coordinate
+"""
+
+import math
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, List, Sequence, Tuple, Union
+
+from astrocompute.library.columns import Column, ColumnLike, to_column
+
+MAGIC = b"ACCHEBY\x00"
+VERSION = 1
+DEFAULT_DEGREE = 12
+
+# The relative rounding error, in segments, within which a time range counts
+# as a whole number of segments and an epoch after the end is still accepted.
+_SLACK = 1e-9
+
+_HEADER = struct.Struct("<8sHHH2xddQ")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+PathLike = Union[str, os.PathLike]
+TimeFunction = Callable[[float], Union[float, Sequence[float]]]
+
+
+def clenshaw(
+    coefficients: Sequence[float], x: float, start: int = 0, stop: int = -1
+) -> Tuple[float, float]:
+    """
+    Evaluate a Chebyshev series and its derivative by Clenshaw's recurrence.
+
+    :param coefficients: The coefficients c0, c1, ... of the series
+        c0 T0(x) + c1 T1(x) + ...
+    :param x: The argument in [-1, 1]
+    :param start: The index of c0 within coefficients
+    :param stop: The index after the last coefficient, all by default
+    :return: The value and the derivative with respect to x
+    """
+    if stop < 0:
+        stop = len(coefficients)
+
+    two_x = x + x
+    b1 = b2 = d1 = d2 = 0.0
+    for c in coefficients[stop - 1 : start : -1]:
+        d1, d2 = b1 + b1 + two_x * d1 - d2, d1
+        b1, b2 = c + two_x * b1 - b2, b1
+
+    return coefficients[start] + x * b1 - b2, b1 + x * d1 - d2
+
+
+def _chebyshev_fit(
+    values: Sequence[float], cosines: List[List[float]]
+) -> List[float]:
+    """
+    Get the coefficients of the series that interpolates values given at
+    the Chebyshev nodes.
+
+    :param values: The values at the nodes
+    :param cosines: cos(pi * j * (k + 1/2) / n) for every degree j and node k
+    :return: The coefficients c0, c1, ...
+    """
+    scale = 2.0 / len(values)
+    coefficients = [
+        scale * math.fsum(value * cosine for value, cosine in zip(values, row))
+        for row in cosines
+    ]
+    coefficients[0] *= 0.5
+    return coefficients
+
+
+def _little_endian(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+class ChebyshevEphemeris:
+    """
+    A function of time approximated by Chebyshev series on fixed segments.
+
+    The series of segment i cover [start + i * segment_length,
+    start + (i + 1) * segment_length]; the end of the last segment is the
+    end of the ephemeris.  Epochs up to a relative 1e-9 of the time range
+    after the end are still evaluated on the last segment, so that the end
+    of a range that fit rounded down to whole segments can be evaluated.
+    Coordinates are returned as tuples of dimension floats, velocities in
+    coordinate units per time unit.
+    """
+
+    def __init__(
+        self,
+        start: float,
+        segment_length: float,
+        degree: int,
+        dimension: int,
+        coefficients: ColumnLike,
+    ):
+        """
+        Create an ephemeris from its coefficients.
+
+        :param start: The start of the time range
+        :param segment_length: The length of a segment
+        :param degree: The degree of the series
+        :param dimension: The number of coordinates
+        :param coefficients: The coefficients, segment by segment and
+            coordinate by coordinate
+        :raises: ValueError if the parameters do not describe whole segments
+        """
+        if segment_length <= 0.0 or degree < 0 or dimension < 1:
+            raise ValueError(
+                "Expected segment_length > 0, degree >= 0 and dimension >= 1"
+            )
+
+        self.coefficients = to_column(coefficients)
+        per_segment = dimension * (degree + 1)
+        if not self.coefficients or len(self.coefficients) % per_segment:
+            raise ValueError(
+                f"Expected a positive multiple of {per_segment} coefficients, "
+                f"got {len(self.coefficients)}"
+            )
+
+        self.start = float(start)
+        self.segment_length = float(segment_length)
+        self.degree = degree
+        self.dimension = dimension
+        self.segments = len(self.coefficients) // per_segment
+
+    @property
+    def end(self) -> float:
+        return self.start + self.segments * self.segment_length
+
+    def __repr__(self) -> str:
+        return (
+            f"ChebyshevEphemeris(start={self.start!r}, end={self.end!r}, "
+            f"segments={self.segments}, degree={self.degree}, "
+            f"dimension={self.dimension})"
+        )
+
+    @classmethod
+    def fit(
+        cls,
+        function: TimeFunction,
+        start: float,
+        end: float,
+        segment_length: float,
+        degree: int = DEFAULT_DEGREE,
+    ) -> "ChebyshevEphemeris":
+        """
+        Fit Chebyshev series to a function of time.
+
+        The function is called degree + 1 times per segment.  The last
+        segment ends at or after end, unless the range is a whole number of
+        segments up to a relative 1e-9; then it may end that little before
+        end, and the ephemeris still accepts epochs up to end.
+
+        :param function: A function of time that returns a coordinate or a
+            sequence of coordinates
+        :param start: The start of the time range
+        :param end: The end of the time range
+        :param segment_length: The length of a segment
+        :param degree: The degree of the series
+        :return: The ephemeris
+        :raises: ValueError if the time range is empty, the segment length
+            is not positive, the degree is negative or the function returns
+            different numbers of coordinates
+        """
+        if not end > start or segment_length <= 0.0 or degree < 0:
+            raise ValueError(
+                "Expected end > start, segment_length > 0 and degree >= 0"
+            )
+
+        n = degree + 1
+        angles = [math.pi * (k + 0.5) / n for k in range(n)]
+        nodes = [math.cos(angle) for angle in angles]
+        cosines = [[math.cos(j * angle) for angle in angles] for j in range(n)]
+
+        # A range that is a whole number of segments up to rounding must not
+        # get an extra segment; _locate accepts the epochs it leaves out.
+        ratio = (end - start) / segment_length
+        segments = max(1, math.ceil(ratio * (1.0 - _SLACK)))
+        half = 0.5 * segment_length
+
+        coefficients = array("d")
+        dimension = 0
+        for segment in range(segments):
+            middle = start + segment * segment_length + half
+            samples = [function(middle + half * node) for node in nodes]
+            if isinstance(samples[0], (int, float)):
+                samples = [(sample,) for sample in samples]
+
+            dimension = dimension or len(samples[0])
+            if any(len(sample) != dimension for sample in samples):
+                raise ValueError(
+                    f"Expected {dimension} coordinates from the function"
+                )
+            for axis in zip(*samples):
+                coefficients.extend(_chebyshev_fit(axis, cosines))
+
+        return cls(start, segment_length, degree, dimension, coefficients)
+
+    def _locate(self, t: float) -> Tuple[int, float]:
+        """
+        Find the coefficients and the scaled time of an epoch.
+
+        :param t: The epoch
+        :return: The offset of the segment's coefficients and the time
+            scaled to [-1, 1]
+        :raises: ValueError if the epoch is outside the time range
+        """
+        position = (t - self.start) / self.segment_length
+        if not 0.0 <= position <= self.segments * (1.0 + 2.0 * _SLACK):
+            raise ValueError(
+                f"Epoch {t!r} is outside [{self.start!r}, {self.end!r}]"
+            )
+
+        segment = min(int(position), self.segments - 1)
+
+        return (
+            segment * self.dimension * (self.degree + 1),
+            2.0 * (position - segment) - 1.0,
+        )
+
+    def state(self, t: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """
+        Evaluate the coordinates and their rates of change at an epoch.
+
+        :param t: The epoch
+        :return: The coordinates and the velocities
+        :raises: ValueError if the epoch is outside the time range
+        """
+        offset, x = self._locate(t)
+        n = self.degree + 1
+        scale = 2.0 / self.segment_length
+        values = [
+            clenshaw(self.coefficients, x, start, start + n)
+            for start in range(offset, offset + self.dimension * n, n)
+        ]
+
+        return (
+            tuple(value for value, _ in values),
+            tuple(scale * derivative for _, derivative in values),
+        )
+
+    def position(self, t: float) -> Tuple[float, ...]:
+        """
+        Evaluate the coordinates at an epoch.
+
+        :param t: The epoch
+        :return: The coordinates
+        :raises: ValueError if the epoch is outside the time range
+        """
+        return self.state(t)[0]
+
+    def velocity(self, t: float) -> Tuple[float, ...]:
+        """
+        Evaluate the rates of change of the coordinates at an epoch.
+
+        :param t: The epoch
+        :return: The velocities
+        :raises: ValueError if the epoch is outside the time range
+        """
+        return self.state(t)[1]
+
+    def state_batch(
+        self, ts: ColumnLike
+    ) -> Tuple[Tuple[Column, ...], Tuple[Column, ...]]:
+        """
+        Evaluate the coordinates and their rates of change at many epochs.
+
+        :param ts: The epochs
+        :return: A column per coordinate and a column per velocity
+        :raises: ValueError if an epoch is outside the time range
+        """
+        states = list(map(self.state, ts))
+        if not states:
+            empty = tuple(array("d") for _ in range(self.dimension))
+            return empty, tuple(array("d") for _ in range(self.dimension))
+
+        positions, velocities = zip(*states)
+        return (
+            tuple(map(to_column, zip(*positions))),
+            tuple(map(to_column, zip(*velocities))),
+        )
+
+    def position_batch(self, ts: ColumnLike) -> Tuple[Column, ...]:
+        """
+        Evaluate the coordinates at many epochs.
+
+        :param ts: The epochs
+        :return: A column per coordinate
+        :raises: ValueError if an epoch is outside the time range
+        """
+        return self.state_batch(ts)[0]
+
+    def velocity_batch(self, ts: ColumnLike) -> Tuple[Column, ...]:
+        """
+        Evaluate the rates of change of the coordinates at many epochs.
+
+        :param ts: The epochs
+        :return: A column per velocity
+        :raises: ValueError if an epoch is outside the time range
+        """
+        return self.state_batch(ts)[1]
+
+    def save(self, path: PathLike) -> None:
+        """
+        Write the ephemeris to a binary file.
+
+        :param path: The path of the file
+        """
+        with open(path, "wb") as stream:
+            stream.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    self.degree,
+                    self.dimension,
+                    self.start,
+                    self.segment_length,
+                    self.segments,
+                )
+            )
+            stream.write(_little_endian(self.coefficients))
+
+    @classmethod
+    def load(cls, path: PathLike) -> "ChebyshevEphemeris":
+        """
+        Read an ephemeris from a binary file written by save.
+
+        :param path: The path of the file
+        :return: The ephemeris
+        :raises: ValueError if the file is not a supported ephemeris file
+        """
+        with open(path, "rb") as stream:
+            header = stream.read(_HEADER.size)
+            data = stream.read()
+
+        if len(header) < _HEADER.size:
+            raise ValueError("Not an ephemeris file: header too short")
+
+        magic, version, degree, dimension, start, length, segments = (
+            _HEADER.unpack(header)
+        )
+        if magic != MAGIC:
+            raise ValueError("Not an ephemeris file: bad magic")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported ephemeris version {version}")
+
+        if len(data) != 8 * segments * dimension * (degree + 1):
+            raise ValueError("Ephemeris file is truncated")
+
+        coefficients = array("d")
+        coefficients.frombytes(data)
+        if not _LITTLE_ENDIAN:
+            coefficients.byteswap()
+
+        return cls(start, length, degree, dimension, coefficients)
@@ -0,0 +1,56 @@
+"""
+This module provides helpers for working with coordinate columns.
+
+A column is a contiguous buffer of float64 values (an ``array('d')``).
+Batch functions across the library accept any sequence of numbers as
+input and return columns, so large catalogs can be processed without
+allocating a Python object per row.
+"""
+
+from array import array
+from typing import Iterable, Sequence, Sized
+
+Column = array
+ColumnLike = Sequence[float]
+
+
+def to_column(values: Iterable[float]) -> Column:
+    """
+    Convert an iterable of numbers to a float64 column.
+
+    Columns that are already ``array('d')`` are returned unchanged.
+
+    :param values: The values to convert
+    :return: The values as a float64 column
+    """
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+
+    return array("d", values)
+
+
+def empty_column(size: int) -> Column:
+    """
+    Allocate a zero filled float64 column.
+
+    :param size: The number of elements
+    :return: A column of the given size
+    """
+    return array("d", bytes(8 * size))
+
+
+def validate_lengths(*columns: Sized) -> int:
+    """
+    Validate that all columns have the same length.
+
+    :param columns: A variable number of columns
+    :return: The common length
+    :raises: ValueError if the columns have different lengths
+    """
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"Columns must have the same length, got {sorted(lengths)}"
+        )
+
+    return lengths.pop() if lengths else 0
@@ -1,5 +1,24 @@
+"""
+This module provides conversions between Cartesian, polar and spherical
+coordinates.
+
+Each conversion comes in two forms: a scalar function that converts a single
+model instance, and a ``*_batch`` function that converts whole coordinate
+columns in one call and returns columns (see
+:mod:`astrocompute.library.columns`).  The scalar functions share the batch
+formulas, so both forms produce identical results.
+"""
+
 import math
+from operator import mul, truediv
+from typing import Tuple
 
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
 from astrocompute.models import (
     Point2D,
     Point3D,
@@ -8,8 +27,90 @@ from astrocompute.models import (
 )
 
 
+def cartesian_to_polar_batch(
+    xs: ColumnLike, ys: ColumnLike
+) -> Tuple[Column, Column]:
+    """
+    Convert columns of Cartesian coordinates to polar coordinates.
+
+    :param xs: The x-coordinates
+    :param ys: The y-coordinates
+    :return: The radius and angle (in radians) columns
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(xs, ys)
+
+    rs = to_column(map(math.hypot, xs, ys))
+    thetas = to_column(map(math.atan2, ys, xs))
+
+    return rs, thetas
+
+
+def polar_to_cartesian_batch(
+    rs: ColumnLike, thetas: ColumnLike
+) -> Tuple[Column, Column]:
+    """
+    Convert columns of polar coordinates to Cartesian coordinates.
+
+    :param rs: The radii
+    :param thetas: The angles in radians
+    :return: The x and y coordinate columns
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(rs, thetas)
+
+    xs = to_column(map(mul, rs, map(math.cos, thetas)))
+    ys = to_column(map(mul, rs, map(math.sin, thetas)))
+
+    return xs, ys
+
+
+def cartesian_to_spherical_batch(
+    xs: ColumnLike, ys: ColumnLike, zs: ColumnLike
+) -> Tuple[Column, Column, Column]:
+    """
+    Convert columns of Cartesian coordinates to spherical coordinates.
+
+    :param xs: The x-coordinates
+    :param ys: The y-coordinates
+    :param zs: The z-coordinates
+    :return: The radius, theta and phi columns
+    :raises: ValueError if the columns have different lengths
+    :raises: ZeroDivisionError if any point is the origin
+    """
+    validate_lengths(xs, ys, zs)
+
+    rs = to_column(map(math.hypot, xs, ys, zs))
+    thetas = to_column(map(math.acos, map(truediv, zs, rs)))
+    phis = to_column(map(math.atan2, ys, xs))
+
+    return rs, thetas, phis
+
+
+def spherical_to_cartesian_batch(
+    rs: ColumnLike, thetas: ColumnLike, phis: ColumnLike
+) -> Tuple[Column, Column, Column]:
+    """
+    Convert columns of spherical coordinates to Cartesian coordinates.
+
+    :param rs: The radii
+    :param thetas: The theta angles in radians
+    :param phis: The phi angles in radians
+    :return: The x, y and z coordinate columns
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(rs, thetas, phis)
+
+    r_cos_theta = to_column(map(mul, rs, map(math.cos, thetas)))
+    xs = to_column(map(mul, r_cos_theta, map(math.cos, phis)))
+    ys = to_column(map(mul, r_cos_theta, map(math.sin, phis)))
+    zs = to_column(map(mul, rs, map(math.sin, thetas)))
+
+    return xs, ys, zs
+
+
 def cartesian_to_polar(point: Point2D) -> Polar:
-    r = math.sqrt(point.x**2 + point.y**2)
+    r = math.hypot(point.x, point.y)
     theta = math.atan2(point.y, point.x)
     return Polar(r, theta)
 
@@ -21,14 +122,15 @@ def polar_to_cartesian(polar: Polar) -> Point2D:
 
 
 def cartesian_to_spherical(point: Point3D) -> Spherical:
-    r = math.sqrt(point.x**2 + point.y**2 + point.z**2)
+    r = math.hypot(point.x, point.y, point.z)
     theta = math.acos(point.z / r)
     phi = math.atan2(point.y, point.x)
     return Spherical(r, theta, phi)
 
 
 def spherical_to_cartesian(spherical: Spherical) -> Point3D:
-    x = spherical.r * math.cos(spherical.theta) * math.cos(spherical.phi)
-    y = spherical.r * math.cos(spherical.theta) * math.sin(spherical.phi)
+    r_cos_theta = spherical.r * math.cos(spherical.theta)
+    x = r_cos_theta * math.cos(spherical.phi)
+    y = r_cos_theta * math.sin(spherical.phi)
     z = spherical.r * math.sin(spherical.theta)
     return Point3D(x, y, z)
@@ -0,0 +1,288 @@
+"""
+This module provides a process pool for running batch transforms in parallel.
+
+A batch transform is any function that takes coordinate columns and returns
+one column, or a tuple of columns, with one value per input row, e.g.
+coordinate_transform.cartesian_to_spherical_batch,
+separation.separation_paired or, bound to a matrix with functools.partial,
+matrix3d.apply_columns.  BatchExecutor.map_columns splits the rows into
+chunks and runs the transform on the chunks in worker processes.
+
+The input and output columns live in shared memory.  Workers receive only
+the names of the shared blocks and the bounds of their chunk, read their
+rows from the input block and write their results straight into the output
+block, so no coordinates are pickled in either direction.  Every chunk has
+a fixed place in the output, which makes the result independent of the
+number of workers and of the order in which chunks finish.
+
+Output columns that the transform returns as arrays keep their typecode
+(e.g. the 'q' degree and minute columns of mathmatics.dms_batch); other
+sequences become float64 columns.  The typecodes of the first chunk apply
+to the whole result.
+
+The transform must be picklable, i.e. a module level function or a partial
+of one.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+
+DEFAULT_CHUNK_SIZE = 65536
+
+Columns = Tuple[Column, ...]
+Transform = Callable[..., Union[ColumnLike, Sequence[ColumnLike]]]
+
+
+def _outputs(result: Union[ColumnLike, Sequence[ColumnLike]]) -> Columns:
+    """
+    Normalize the result of a transform to a tuple of columns.
+
+    Arrays keep their typecode; other sequences become float64 columns.
+    """
+    if not isinstance(result, tuple):
+        result = (result,)
+
+    return tuple(
+        column if isinstance(column, array) else to_column(column)
+        for column in result
+    )
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        # Only the creating process may unlink the block (Python 3.13+).
+        return SharedMemory(name, track=False)
+    except TypeError:
+        return SharedMemory(name)
+
+
+def _block_size(size: int, typecodes: str) -> int:
+    return size * sum(array(typecode).itemsize for typecode in typecodes)
+
+
+def _read(
+    buffer: memoryview, size: int, typecodes: str, start: int, stop: int
+) -> Columns:
+    """
+    Copy the rows [start, stop) of the columns of a shared block.
+
+    The columns are stored one after the other, each with size items of its
+    typecode.  The block may be larger than its columns, e.g. rounded to
+    whole pages.
+    """
+    columns = []
+    offset = 0
+    for typecode in typecodes:
+        column = array(typecode)
+        item = column.itemsize
+        column.frombytes(buffer[offset + item * start : offset + item * stop])
+        columns.append(column)
+        offset += item * size
+
+    return tuple(columns)
+
+
+def _write(buffer: memoryview, size: int, start: int, outputs: Columns) -> None:
+    offset = 0
+    for column in outputs:
+        item = column.itemsize
+        begin = offset + item * start
+        buffer[begin : begin + item * len(column)] = memoryview(column).cast(
+            "B"
+        )
+        offset += item * size
+
+
+def _validate_outputs(outputs: Columns, rows: int, count: int) -> None:
+    if len(outputs) != count or any(len(c) != rows for c in outputs):
+        raise ValueError(
+            f"Expected {count} output columns of {rows} rows, got "
+            f"{[len(column) for column in outputs]}"
+        )
+
+
+def _run_chunk(
+    transform: Transform,
+    input_name: str,
+    output_name: str,
+    size: int,
+    inputs: int,
+    typecodes: str,
+    start: int,
+    stop: int,
+) -> None:
+    """
+    Run a transform on one chunk of a shared input block.
+
+    :param transform: The batch transform
+    :param input_name: The name of the shared input block
+    :param output_name: The name of the shared output block
+    :param size: The number of rows of every column
+    :param inputs: The number of input columns
+    :param typecodes: The typecodes of the output columns
+    :param start: The first row of the chunk
+    :param stop: The row after the last row of the chunk
+    """
+    source, target = _attach(input_name), _attach(output_name)
+    try:
+        results = _outputs(
+            transform(*_read(source.buf, size, "d" * inputs, start, stop))
+        )
+        _validate_outputs(results, stop - start, len(typecodes))
+        _write(
+            target.buf,
+            size,
+            start,
+            tuple(
+                (
+                    column
+                    if column.typecode == typecode
+                    else array(typecode, column)
+                )
+                for column, typecode in zip(results, typecodes)
+            ),
+        )
+    finally:
+        source.close()
+        target.close()
+
+
+class BatchExecutor:
+    """
+    A pool of worker processes for batch transforms over columns.
+
+    The pool is started on first use and reused until close is called; the
+    executor can also be used as a context manager.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        :param workers: The number of worker processes, or None for one per
+            CPU
+        :param chunk_size: The number of rows per chunk
+        :raises: ValueError if workers or chunk_size is smaller than 1
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "BatchExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchExecutor(workers={self.workers}, "
+            f"chunk_size={self.chunk_size})"
+        )
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def map_columns(
+        self, transform: Transform, *columns: ColumnLike
+    ) -> Union[Column, Columns]:
+        """
+        Run a batch transform over columns in parallel.
+
+        The first chunk is transformed in the calling process, which also
+        determines the number of output columns; the remaining chunks are
+        transformed by the workers.  Inputs with no more than one chunk
+        never reach the workers.
+
+        :param transform: A picklable batch transform
+        :param columns: The input columns, all of the same length
+        :return: The output column, or the tuple of output columns, as
+            returned by the transform for the whole input
+        :raises: ValueError if no columns are given, the columns have
+            different lengths or the transform does not return one value
+            per row
+        """
+        if not columns:
+            raise ValueError("At least one input column is required")
+
+        size = validate_lengths(*columns)
+        step = self.chunk_size
+        first = _outputs(
+            transform(*(to_column(column[:step]) for column in columns))
+        )
+        rows = min(size, step)
+        _validate_outputs(first, rows, len(first))
+
+        if size > step:
+            outputs = self._map_shared(transform, columns, size, first)
+        else:
+            outputs = first
+
+        return outputs if len(outputs) > 1 else outputs[0]
+
+    def _map_shared(
+        self,
+        transform: Transform,
+        columns: Sequence[ColumnLike],
+        size: int,
+        first: Columns,
+    ) -> Columns:
+        step = self.chunk_size
+        typecodes = "".join(column.typecode for column in first)
+        source = SharedMemory(create=True, size=8 * size * len(columns))
+        target = SharedMemory(create=True, size=_block_size(size, typecodes))
+
+        try:
+            _write(source.buf, size, 0, tuple(map(to_column, columns)))
+
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers)
+
+            futures = [
+                self._pool.submit(
+                    _run_chunk,
+                    transform,
+                    source.name,
+                    target.name,
+                    size,
+                    len(columns),
+                    typecodes,
+                    start,
+                    min(start + step, size),
+                )
+                for start in range(step, size, step)
+            ]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+            _write(target.buf, size, 0, first)
+            return _read(target.buf, size, typecodes, 0, size)
+        finally:
+            source.close()
+            source.unlink()
+            target.close()
+            target.unlink()
@@ -0,0 +1,280 @@
+"""
+This module provides a k-d tree spatial index for 2D and 3D points.
+
+The tree is built once from coordinate columns (or from Point2D/Point3D
+instances and point arrays) and then answers k-nearest-neighbour,
+fixed-radius and axis-aligned box queries in roughly logarithmic time
+instead of comparing every pair of points.
+
+The tree is implicit: the points are reordered so that each subrange is
+split at its median along an axis that cycles with the depth.  Small
+subranges are scanned directly.  Query results refer to points by their
+index in the original input.
+"""
+
+import heapq
+import math
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from astrocompute.library.columns import (
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+
+Coordinates = Sequence[float]
+Neighbour = Tuple[float, int]
+
+
+class KDTree:
+    """
+    A k-d tree over a fixed set of points.
+    """
+
+    def __init__(self, *columns: ColumnLike, leaf_size: int = 16):
+        """
+        Build the tree from coordinate columns.
+
+        :param columns: One column per axis, e.g. xs, ys[, zs]
+        :param leaf_size: The largest subrange that is scanned directly
+        :raises: ValueError if no columns are given, the columns have
+            different lengths or leaf_size is smaller than 1
+        """
+        if not columns:
+            raise ValueError("At least one coordinate column is required")
+
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1")
+
+        validate_lengths(*columns)
+
+        self.dimension = len(columns)
+        self.leaf_size = leaf_size
+        self._columns = [to_column(column) for column in columns]
+        self._points: List[Tuple[float, ...]] = list(zip(*self._columns))
+        self._index: List[int] = list(range(len(self._points)))
+        self._build(0, len(self._index), 0)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    @staticmethod
+    def from_points(
+        points: Iterable[Union[Point2D, Point3D]], leaf_size: int = 16
+    ) -> "KDTree":
+        """
+        Build a tree from Point2D or Point3D instances.
+
+        :param points: The points, all of the same dimension
+        :param leaf_size: The largest subrange that is scanned directly
+        :return: The tree
+        """
+        points = list(points)
+        if points and isinstance(points[0], Point3D):
+            return KDTree(
+                [p.x for p in points],
+                [p.y for p in points],
+                [p.z for p in points],
+                leaf_size=leaf_size,
+            )
+
+        return KDTree(
+            [p.x for p in points], [p.y for p in points], leaf_size=leaf_size
+        )
+
+    @staticmethod
+    def from_point_array(
+        points: Union[PointArray2D, PointArray3D], leaf_size: int = 16
+    ) -> "KDTree":
+        """
+        Build a tree from a columnar point array.
+
+        :param points: The point array
+        :param leaf_size: The largest subrange that is scanned directly
+        :return: The tree
+        """
+        if isinstance(points, PointArray3D):
+            return KDTree(points.x, points.y, points.z, leaf_size=leaf_size)
+
+        return KDTree(points.x, points.y, leaf_size=leaf_size)
+
+    def _build(self, lo: int, hi: int, depth: int) -> None:
+        if hi - lo <= self.leaf_size:
+            return
+
+        column = self._columns[depth % self.dimension]
+        self._index[lo:hi] = sorted(self._index[lo:hi], key=column.__getitem__)
+
+        mid = (lo + hi) // 2
+        self._build(lo, mid, depth + 1)
+        self._build(mid + 1, hi, depth + 1)
+
+    def _validate(self, point: Coordinates) -> Tuple[float, ...]:
+        point = tuple(point)
+        if len(point) != self.dimension:
+            raise ValueError(
+                f"Expected a point with {self.dimension} coordinates, "
+                f"got {len(point)}"
+            )
+
+        return point
+
+    def query(self, point: Coordinates, k: int = 1) -> List[Neighbour]:
+        """
+        Find the k nearest neighbours of a point.
+
+        :param point: The coordinates of the query point
+        :param k: The number of neighbours
+        :return: (distance, index) pairs, nearest first
+        :raises: ValueError if k is smaller than 1
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        heap: List[Tuple[float, int]] = []
+        self._nearest(0, len(self._index), 0, self._validate(point), k, heap)
+
+        return sorted((-distance, index) for distance, index in heap)
+
+    def _consider(
+        self, index: int, point: Tuple[float, ...], k: int, heap: List
+    ) -> None:
+        distance = math.dist(self._points[index], point)
+        if len(heap) < k:
+            heapq.heappush(heap, (-distance, index))
+        elif distance < -heap[0][0]:
+            heapq.heapreplace(heap, (-distance, index))
+
+    def _nearest(
+        self,
+        lo: int,
+        hi: int,
+        depth: int,
+        point: Tuple[float, ...],
+        k: int,
+        heap: List,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        if hi - lo <= self.leaf_size:
+            for index in self._index[lo:hi]:
+                self._consider(index, point, k, heap)
+            return
+
+        mid = (lo + hi) // 2
+        self._consider(self._index[mid], point, k, heap)
+
+        axis = depth % self.dimension
+        delta = point[axis] - self._points[self._index[mid]][axis]
+        if delta < 0:
+            near, far = (lo, mid), (mid + 1, hi)
+        else:
+            near, far = (mid + 1, hi), (lo, mid)
+
+        self._nearest(*near, depth + 1, point, k, heap)
+        if len(heap) < k or abs(delta) < -heap[0][0]:
+            self._nearest(*far, depth + 1, point, k, heap)
+
+    def query_radius(self, point: Coordinates, radius: float) -> List[int]:
+        """
+        Find all points within a distance of a point.
+
+        :param point: The coordinates of the query point
+        :param radius: The search radius (inclusive)
+        :return: The indices of the points, in ascending order
+        """
+        point = self._validate(point)
+        lower = tuple(c - radius for c in point)
+        upper = tuple(c + radius for c in point)
+
+        return sorted(
+            index
+            for index in self._box(0, len(self._index), 0, lower, upper)
+            if math.dist(self._points[index], point) <= radius
+        )
+
+    def query_box(self, lower: Coordinates, upper: Coordinates) -> List[int]:
+        """
+        Find all points inside an axis-aligned box.
+
+        :param lower: The lower corner of the box (inclusive)
+        :param upper: The upper corner of the box (inclusive)
+        :return: The indices of the points, in ascending order
+        """
+        return sorted(
+            self._box(
+                0,
+                len(self._index),
+                0,
+                self._validate(lower),
+                self._validate(upper),
+            )
+        )
+
+    def _box(
+        self,
+        lo: int,
+        hi: int,
+        depth: int,
+        lower: Tuple[float, ...],
+        upper: Tuple[float, ...],
+    ) -> Iterable[int]:
+        # pylint: disable=too-many-arguments
+        points = self._points
+        stack = [(lo, hi, depth)]
+
+        while stack:
+            lo, hi, depth = stack.pop()
+
+            if hi - lo <= self.leaf_size:
+                for index in self._index[lo:hi]:
+                    if _inside(points[index], lower, upper):
+                        yield index
+                continue
+
+            mid = (lo + hi) // 2
+            index = self._index[mid]
+            if _inside(points[index], lower, upper):
+                yield index
+
+            axis = depth % self.dimension
+            split = points[index][axis]
+            if lower[axis] <= split:
+                stack.append((lo, mid, depth + 1))
+            if upper[axis] >= split:
+                stack.append((mid + 1, hi, depth + 1))
+
+    def query_batch(
+        self, *columns: ColumnLike, k: int = 1
+    ) -> List[List[Neighbour]]:
+        """
+        Find the k nearest neighbours of many query points.
+
+        :param columns: One column of query coordinates per axis
+        :param k: The number of neighbours
+        :return: For every query point, (distance, index) pairs nearest first
+        """
+        validate_lengths(*columns)
+        return [self.query(point, k) for point in zip(*columns)]
+
+    def query_radius_batch(
+        self, *columns: ColumnLike, radius: float
+    ) -> List[List[int]]:
+        """
+        Find all points within a distance of many query points.
+
+        :param columns: One column of query coordinates per axis
+        :param radius: The search radius (inclusive)
+        :return: For every query point, the indices in ascending order
+        """
+        validate_lengths(*columns)
+        return [self.query_radius(point, radius) for point in zip(*columns)]
+
+
+def _inside(
+    point: Tuple[float, ...],
+    lower: Tuple[float, ...],
+    upper: Tuple[float, ...],
+) -> bool:
+    return all(lo <= c <= hi for c, lo, hi in zip(point, lower, upper))
@@ -0,0 +1,404 @@
+"""
+This module solves Kepler's equation and propagates two-body orbits.
+
+Orbits are described by perihelion-based elements, which are defined for
+elliptic, parabolic and hyperbolic orbits alike: the perihelion distance q,
+the eccentricity e, the inclination, the longitude of the ascending node,
+the argument of perihelion and the time of perihelion passage.  Distances
+are in AU, times in days and angles in radians; the angles refer to
+whichever reference plane the elements were given in (usually the
+ecliptic), and so do the resulting state vectors.
+
+The solvers work element-wise: every row iterates only until its own
+anomaly has converged.  propagate_batch broadcasts single values against
+columns, so the same call propagates many bodies to one epoch, one body to
+many epochs, or many bodies each to its own epoch::
+
+    state = propagate_batch(qs, es, incs, nodes, peris, t0s, t)
+
+A faster implementation of propagate_batch is provided by the NumPy
+backend (astrocompute.backend).
+"""
+
+import math
+from itertools import repeat
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+from astrocompute.constants import GM_SUN
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.vector import Vector3D
+
+ColumnOrValue = Union[float, ColumnLike]
+
+TOLERANCE = 1e-14
+MAX_ITERATIONS = 50
+
+
+class OrbitalElements(NamedTuple):
+    q: float
+    e: float
+    inclination: float
+    node: float
+    perihelion_argument: float
+    perihelion_time: float
+
+
+class OrbitState(NamedTuple):
+    x: Column
+    y: Column
+    z: Column
+    vx: Column
+    vy: Column
+    vz: Column
+
+
+def _not_converged(anomaly: str, mean_anomaly: float, e: float) -> ValueError:
+    return ValueError(
+        f"The {anomaly} anomaly did not converge for M={mean_anomaly!r}, "
+        f"e={e!r}"
+    )
+
+
+def _is_value(value: ColumnOrValue) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _broadcast(*values: ColumnOrValue) -> Tuple[int, List[Iterable[float]]]:
+    """
+    Repeat single values to the common length of the columns.
+
+    :param values: Columns and single values
+    :return: The common length (1 if there are no columns) and an iterable
+        for every value
+    :raises: ValueError if the columns have different lengths
+    """
+    columns = [value for value in values if not _is_value(value)]
+    size = validate_lengths(*columns) if columns else 1
+
+    return size, [
+        repeat(value, size) if _is_value(value) else value for value in values
+    ]
+
+
+def _odd_tail(x: float, sign: float) -> float:
+    """
+    Calculate x - sin x (sign -1) or sinh x - x (sign 1) without the
+    cancellation of the direct formulas for small x.
+
+    :param x: The argument
+    :param sign: -1 or 1
+    :return: The sum of the terms of the series of sin x or sinh x
+        beyond x, times -sign for sin x
+    """
+    if abs(x) >= 1.0:
+        return x - math.sin(x) if sign < 0 else math.sinh(x) - x
+
+    x2 = x * x
+    term = total = x * x2 / 6.0
+    n = 3
+    while abs(term) > 1e-17 * abs(total):
+        term *= sign * x2 / ((n + 1) * (n + 2))
+        total += term
+        n += 2
+
+    return total
+
+
+def eccentric_anomaly(
+    mean_anomaly: float,
+    e: float,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> float:
+    """
+    Solve Kepler's equation M = E - e sin E of an elliptic orbit.
+
+    Newton's method starts from M for e < 0.8.  Otherwise it starts from
+    the cube root of 6M (capped at pi), the solution for e = 1 near the
+    perihelion, and evaluates the equation as (1 - e) E + e (E - sin E),
+    which keeps nearly parabolic orbits accurate.
+
+    :param mean_anomaly: The mean anomaly M in radians
+    :param e: The eccentricity, 0 <= e < 1
+    :param tol: The convergence tolerance, relative to max(1, |E|)
+    :param max_iterations: The maximum number of Newton steps
+    :return: The eccentric anomaly E in radians, in [-pi, pi]
+    :raises: ValueError if e is out of range or E does not converge
+    """
+    if not 0.0 <= e < 1.0:
+        raise ValueError(f"Elliptic orbits need 0 <= e < 1, got {e!r}")
+
+    m = math.remainder(mean_anomaly, 2 * math.pi)
+    sin, cos = math.sin, math.cos
+
+    if e < 0.8:
+        anomaly = m
+        for _ in range(max_iterations):
+            step = (anomaly - e * sin(anomaly) - m) / (1.0 - e * cos(anomaly))
+            anomaly -= step
+            if abs(step) <= tol * max(1.0, abs(anomaly)):
+                return anomaly
+    else:
+        anomaly = math.copysign(min(math.cbrt(6.0 * abs(m)), math.pi), m)
+        for _ in range(max_iterations):
+            half = sin(0.5 * anomaly)
+            step = ((1.0 - e) * anomaly + e * _odd_tail(anomaly, -1.0) - m) / (
+                (1.0 - e) + 2.0 * e * half * half
+            )
+            anomaly -= step
+            if abs(step) <= tol * max(1.0, abs(anomaly)):
+                return anomaly
+
+    raise _not_converged("eccentric", mean_anomaly, e)
+
+
+def hyperbolic_anomaly(
+    mean_anomaly: float,
+    e: float,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> float:
+    """
+    Solve Kepler's equation M = e sinh H - H of a hyperbolic orbit.
+
+    The equation is evaluated as (e - 1) H + e (sinh H - H), which keeps
+    nearly parabolic orbits accurate.
+
+    :param mean_anomaly: The mean anomaly M
+    :param e: The eccentricity, e > 1
+    :param tol: The convergence tolerance, relative to max(1, |H|)
+    :param max_iterations: The maximum number of Newton steps
+    :return: The hyperbolic anomaly H
+    :raises: ValueError if e is out of range or H does not converge
+    """
+    if not e > 1.0:
+        raise ValueError(f"Hyperbolic orbits need e > 1, got {e!r}")
+
+    m = abs(mean_anomaly)
+    sinh = math.sinh
+
+    # Both starting values lie beyond the root for the orbits they suit,
+    # from where Newton's method converges monotonically.
+    anomaly = min(math.log(2.0 * m / e + 1.8), math.cbrt(6.0 * m))
+    for _ in range(max_iterations):
+        half = sinh(0.5 * anomaly)
+        step = ((e - 1.0) * anomaly + e * _odd_tail(anomaly, 1.0) - m) / (
+            (e - 1.0) + 2.0 * e * half * half
+        )
+        anomaly -= step
+        if abs(step) <= tol * max(1.0, abs(anomaly)):
+            return math.copysign(anomaly, mean_anomaly)
+
+    raise _not_converged("hyperbolic", mean_anomaly, e)
+
+
+def parabolic_anomaly(mean_anomaly: float) -> float:
+    """
+    Solve Barker's equation M = B + B^3 / 3 of a parabolic orbit.
+
+    The cubic is solved in closed form, B = 2 sinh(asinh(3M / 2) / 3).
+
+    :param mean_anomaly: The parabolic mean anomaly
+        M = sqrt(GM / (2 q^3)) (t - T)
+    :return: B = tan(v / 2), where v is the true anomaly
+    """
+    return 2.0 * math.sinh(math.asinh(1.5 * mean_anomaly) / 3.0)
+
+
+def eccentric_anomaly_batch(
+    mean_anomalies: ColumnLike,
+    es: ColumnOrValue,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> Column:
+    """
+    Solve Kepler's equation of elliptic orbits for columns of values.
+
+    :param mean_anomalies: The mean anomalies in radians
+    :param es: The eccentricities, or a single eccentricity
+    :param tol: The convergence tolerance, relative to max(1, |E|)
+    :param max_iterations: The maximum number of Newton steps
+    :return: The eccentric anomalies in radians
+    :raises: ValueError if the columns have different lengths, an
+        eccentricity is out of range or an anomaly does not converge
+    """
+    _, (ms, es) = _broadcast(mean_anomalies, es)
+
+    return to_column(
+        [eccentric_anomaly(m, e, tol, max_iterations) for m, e in zip(ms, es)]
+    )
+
+
+def hyperbolic_anomaly_batch(
+    mean_anomalies: ColumnLike,
+    es: ColumnOrValue,
+    tol: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> Column:
+    """
+    Solve Kepler's equation of hyperbolic orbits for columns of values.
+
+    :param mean_anomalies: The mean anomalies
+    :param es: The eccentricities, or a single eccentricity
+    :param tol: The convergence tolerance, relative to max(1, |H|)
+    :param max_iterations: The maximum number of Newton steps
+    :return: The hyperbolic anomalies
+    :raises: ValueError if the columns have different lengths, an
+        eccentricity is out of range or an anomaly does not converge
+    """
+    _, (ms, es) = _broadcast(mean_anomalies, es)
+
+    return to_column(
+        [hyperbolic_anomaly(m, e, tol, max_iterations) for m, e in zip(ms, es)]
+    )
+
+
+def _orbital_plane(
+    gm: float, q: float, e: float, dt: float
+) -> Tuple[float, float, float, float]:
+    """
+    Get the state in the orbital plane, with x towards the perihelion.
+
+    :param gm: The gravitational parameter in AU^3/day^2
+    :param q: The perihelion distance in AU
+    :param e: The eccentricity
+    :param dt: The time since perihelion passage in days
+    :return: The position (x, y) and velocity (vx, vy)
+    :raises: ValueError if q is not positive or e is negative
+    """
+    if q <= 0.0 or e < 0.0:
+        raise ValueError(f"Expected q > 0 and e >= 0, got q={q!r}, e={e!r}")
+
+    if e < 1.0:
+        a = q / (1.0 - e)
+        ecc = eccentric_anomaly(math.sqrt(gm / a) / a * dt, e)
+        cos_e, sin_e = math.cos(ecc), math.sin(ecc)
+        # 2 a sin^2(E / 2) avoids the cancellation in a (cos E - e).
+        half = 2.0 * a * math.sin(0.5 * ecc) ** 2
+        b = a * math.sqrt((1.0 - e) * (1.0 + e))
+        k = math.sqrt(gm * a) / (q + e * half)
+        return q - half, b * sin_e, -k * sin_e, k * b / a * cos_e
+
+    if e > 1.0:
+        a = q / (e - 1.0)
+        hyp = hyperbolic_anomaly(math.sqrt(gm / a) / a * dt, e)
+        cosh_h, sinh_h = math.cosh(hyp), math.sinh(hyp)
+        half = 2.0 * a * math.sinh(0.5 * hyp) ** 2
+        b = a * math.sqrt((e - 1.0) * (e + 1.0))
+        k = math.sqrt(gm * a) / (q + e * half)
+        return q - half, b * sinh_h, -k * sinh_h, k * b / a * cosh_h
+
+    tan_half = parabolic_anomaly(math.sqrt(gm / (2.0 * q)) / q * dt)
+    k = math.sqrt(gm / (2.0 * q)) / (1.0 + tan_half * tan_half)
+    return (
+        q * (1.0 - tan_half * tan_half),
+        2.0 * q * tan_half,
+        -2.0 * k * tan_half,
+        2.0 * k,
+    )
+
+
+def _gaussian_vectors(
+    inclination: float, node: float, perihelion_argument: float
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Get the unit vectors P (towards the perihelion) and Q (90 degrees ahead
+    of it in the orbital plane) in the reference frame.
+
+    :param inclination: The inclination in radians
+    :param node: The longitude of the ascending node in radians
+    :param perihelion_argument: The argument of perihelion in radians
+    :return: The components px, py, pz, qx, qy, qz
+    """
+    cos_i, sin_i = math.cos(inclination), math.sin(inclination)
+    cos_n, sin_n = math.cos(node), math.sin(node)
+    cos_w, sin_w = math.cos(perihelion_argument), math.sin(perihelion_argument)
+
+    return (
+        cos_w * cos_n - sin_w * cos_i * sin_n,
+        cos_w * sin_n + sin_w * cos_i * cos_n,
+        sin_w * sin_i,
+        -sin_w * cos_n - cos_w * cos_i * sin_n,
+        -sin_w * sin_n + cos_w * cos_i * cos_n,
+        cos_w * sin_i,
+    )
+
+
+def propagate(
+    elements: OrbitalElements, t: float, gm: float = GM_SUN
+) -> Tuple[Vector3D, Vector3D]:
+    """
+    Calculate the position and velocity of a body at a time.
+
+    :param elements: The orbital elements of the body
+    :param t: The time in days, on the same scale as the perihelion time
+    :param gm: The gravitational parameter in AU^3/day^2, the Sun's by
+        default
+    :return: The position in AU and the velocity in AU/day
+    :raises: ValueError if the elements are invalid or the anomaly does not
+        converge
+    """
+    state = propagate_batch(*elements, t, gm=gm)
+    return (state.x[0], state.y[0], state.z[0]), (
+        state.vx[0],
+        state.vy[0],
+        state.vz[0],
+    )
+
+
+def propagate_batch(
+    qs: ColumnOrValue,
+    es: ColumnOrValue,
+    inclinations: ColumnOrValue,
+    nodes: ColumnOrValue,
+    perihelion_arguments: ColumnOrValue,
+    perihelion_times: ColumnOrValue,
+    ts: ColumnOrValue,
+    gm: float = GM_SUN,
+) -> OrbitState:
+    """
+    Calculate the positions and velocities of bodies at times.
+
+    Every argument is a column or a single value that applies to every
+    row.  Elliptic, parabolic (e == 1) and hyperbolic orbits may be mixed.
+
+    :param qs: The perihelion distances in AU
+    :param es: The eccentricities
+    :param inclinations: The inclinations in radians
+    :param nodes: The longitudes of the ascending nodes in radians
+    :param perihelion_arguments: The arguments of perihelion in radians
+    :param perihelion_times: The times of perihelion passage in days
+    :param ts: The times in days
+    :param gm: The gravitational parameter in AU^3/day^2, the Sun's by
+        default
+    :return: The position (AU) and velocity (AU/day) columns
+    :raises: ValueError if the columns have different lengths, the
+        elements are invalid or an anomaly does not converge
+    """
+    orientation = (inclinations, nodes, perihelion_arguments)
+    size, (qs, es, *angles, t0s, ts) = _broadcast(
+        qs, es, *orientation, perihelion_times, ts
+    )
+    # The orientation of a single orbit is computed once, not once per row.
+    if all(map(_is_value, orientation)):
+        vectors = repeat(_gaussian_vectors(*orientation), size)
+    else:
+        vectors = map(_gaussian_vectors, *angles)
+
+    columns: Tuple[List[float], ...] = ([], [], [], [], [], [])
+    x, y, z, vx, vy, vz = (column.append for column in columns)
+    for q, e, t0, t, (px, py, pz, qx, qy, qz) in zip(qs, es, t0s, ts, vectors):
+        u, v, vu, vv = _orbital_plane(gm, q, e, t - t0)
+        x(u * px + v * qx)
+        y(u * py + v * qy)
+        z(u * pz + v * qz)
+        vx(vu * px + vv * qx)
+        vy(vu * py + vv * qy)
+        vz(vu * pz + vv * qz)
+
+    return OrbitState(*map(to_column, columns))
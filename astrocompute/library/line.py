@@ -0,0 +1,296 @@
+"""
+This module provides a precomputed representation of lines in 2D space.
+
+A Line2D stores the coefficients of ``a*x + b*y + c = 0`` normalized so that
+``a**2 + b**2 == 1``.  They are computed once, when the line is created, and
+afterwards every query (intercepts, side of line, distance to a point,
+parallel and perpendicular tests, intersections) takes constant time.  The
+``*_batch`` methods answer the same queries for columns of points.
+
+A line created from two points keeps their orientation: points to the left
+of the direction from the first point to the second are on the positive
+side.
+
+The tolerances of the distance tests (side, contains, same_line and
+side_batch) are relative: a distance is compared with tol times the largest
+of 1 and the magnitudes of c and of the point's coordinates, since the
+rounding error of a*x + b*y + c grows with them.  The angle tests compare
+sines and cosines, which need no scaling.
+"""
+
+import math
+from itertools import repeat
+from operator import add, mul
+from typing import List, Optional
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.point import Point2D, _validate_points
+
+DEFAULT_TOLERANCE = 1e-12
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _scale(c: float, x: float, y: float) -> float:
+    return max(1.0, abs(c), abs(x), abs(y))
+
+
+class Line2D:
+    """
+    A line in 2D space with normalized coefficients.
+    """
+
+    __slots__ = ("a", "b", "c")
+
+    def __init__(self, a: float, b: float, c: float):
+        """
+        Initialize the Line2D from the coefficients of a*x + b*y + c = 0.
+
+        :param a: The x coefficient
+        :param b: The y coefficient
+        :param c: The constant term
+        :raises: ValueError if a and b are both zero
+        """
+        norm = math.hypot(a, b)
+        if norm == 0.0:
+            raise ValueError("a and b cannot both be zero")
+
+        self.a = a / norm
+        self.b = b / norm
+        self.c = c / norm
+
+    def __repr__(self):
+        return f"Line2D(a={self.a}, b={self.b}, c={self.c})"
+
+    @staticmethod
+    def from_points(p: Point2D, q: Point2D) -> "Line2D":
+        """
+        Create the line through two points.
+
+        :param p: The first point
+        :param q: The second point
+        :return: The line through the points
+        :raises: ValueError if the points are None or the same point
+        """
+        _validate_points(p, q)
+
+        if Point2D.same_point(p, q):
+            raise ValueError("p and q must be distinct points")
+
+        return Line2D(p.y - q.y, q.x - p.x, p.x * q.y - q.x * p.y)
+
+    @staticmethod
+    def from_slope_intercept(slope: float, y_intercept: float) -> "Line2D":
+        """
+        Create the line y = slope * x + y_intercept.
+
+        :param slope: The slope
+        :param y_intercept: The y-intercept
+        :return: The line
+        """
+        return Line2D(-slope, 1.0, -y_intercept)
+
+    @property
+    def is_vertical(self) -> bool:
+        return self.b == 0.0
+
+    @property
+    def is_horizontal(self) -> bool:
+        return self.a == 0.0
+
+    @property
+    def slope(self) -> float:
+        """
+        The slope of the line, nan if the line is vertical.
+        """
+        return float("nan") if self.is_vertical else -self.a / self.b
+
+    @property
+    def y_intercept(self) -> float:
+        """
+        The y-intercept of the line.
+
+        As with Point2D.y_intercept, a vertical line yields inf when it is
+        the y-axis and nan otherwise.
+        """
+        if self.is_vertical:
+            return float("inf") if self.c == 0.0 else float("nan")
+
+        return -self.c / self.b
+
+    @property
+    def x_intercept(self) -> float:
+        """
+        The x-intercept of the line.
+
+        A horizontal line yields inf when it is the x-axis and nan otherwise.
+        """
+        if self.is_horizontal:
+            return float("inf") if self.c == 0.0 else float("nan")
+
+        return -self.c / self.a
+
+    def signed_distance(self, point: Point2D) -> float:
+        """
+        Calculate the signed distance from the line to a point.
+
+        :param point: The point
+        :return: The distance, positive on the left side of the line
+        """
+        return self.a * point.x + self.b * point.y + self.c
+
+    def distance(self, point: Point2D) -> float:
+        """
+        Calculate the distance from the line to a point.
+
+        :param point: The point
+        :return: The distance
+        """
+        return abs(self.signed_distance(point))
+
+    def side(self, point: Point2D, tol: float = DEFAULT_TOLERANCE) -> int:
+        """
+        Determine on which side of the line a point is.
+
+        :param point: The point
+        :param tol: Points closer to the line than this, relative to the
+            size of the coordinates, are on it
+        :return: 1 for the left side, -1 for the right side, 0 on the line
+        """
+        distance = self.signed_distance(point)
+        if abs(distance) <= tol * _scale(self.c, point.x, point.y):
+            return 0
+
+        return _sign(distance)
+
+    def contains(self, point: Point2D, tol: float = DEFAULT_TOLERANCE) -> bool:
+        """
+        Check if a point is on the line.
+
+        :param point: The point
+        :param tol: The largest distance still considered on the line,
+            relative to the size of the coordinates
+        :return: True if the point is on the line, False otherwise
+        """
+        return self.distance(point) <= tol * _scale(self.c, point.x, point.y)
+
+    def is_parallel(
+        self, other: "Line2D", tol: float = DEFAULT_TOLERANCE
+    ) -> bool:
+        """
+        Check if two lines are parallel.
+
+        As with Point2D.are_parallel, a line is parallel to itself.
+
+        :param other: The other line
+        :param tol: The largest sine of the angle between parallel lines
+        :return: True if the lines are parallel, False otherwise
+        """
+        return abs(self.a * other.b - self.b * other.a) <= tol
+
+    def is_perpendicular(
+        self, other: "Line2D", tol: float = DEFAULT_TOLERANCE
+    ) -> bool:
+        """
+        Check if two lines are perpendicular.
+
+        :param other: The other line
+        :param tol: The largest cosine of the angle between perpendicular lines
+        :return: True if the lines are perpendicular, False otherwise
+        """
+        return abs(self.a * other.a + self.b * other.b) <= tol
+
+    def same_line(
+        self, other: "Line2D", tol: float = DEFAULT_TOLERANCE
+    ) -> bool:
+        """
+        Check if two lines are the same, regardless of orientation.
+
+        :param other: The other line
+        :param tol: The tolerance of the comparison, relative to the size
+            of the constant terms for their difference
+        :return: True if the lines are the same, False otherwise
+        """
+        orientation = 1.0 if self.a * other.a + self.b * other.b > 0 else -1.0
+        return self.is_parallel(other, tol) and (
+            abs(self.c - orientation * other.c)
+            <= tol * _scale(self.c, other.c, 0.0)
+        )
+
+    def intersection(
+        self, other: "Line2D", tol: float = DEFAULT_TOLERANCE
+    ) -> Optional[Point2D]:
+        """
+        Calculate the intersection point of two lines.
+
+        :param other: The other line
+        :param tol: The tolerance used to detect parallel lines
+        :return: The intersection point, or None if the lines are parallel
+        """
+        determinant = self.a * other.b - self.b * other.a
+        if abs(determinant) <= tol:
+            return None
+
+        return Point2D(
+            (self.b * other.c - other.b * self.c) / determinant,
+            (other.a * self.c - self.a * other.c) / determinant,
+        )
+
+    def signed_distance_batch(self, xs: ColumnLike, ys: ColumnLike) -> Column:
+        """
+        Calculate the signed distances from the line to many points.
+
+        :param xs: The x-coordinates of the points
+        :param ys: The y-coordinates of the points
+        :return: The signed distances, positive on the left side of the line
+        """
+        validate_lengths(xs, ys)
+
+        return to_column(
+            map(
+                add,
+                map(
+                    add,
+                    map(mul, repeat(self.a), xs),
+                    map(mul, repeat(self.b), ys),
+                ),
+                repeat(self.c),
+            )
+        )
+
+    def distance_batch(self, xs: ColumnLike, ys: ColumnLike) -> Column:
+        """
+        Calculate the distances from the line to many points.
+
+        :param xs: The x-coordinates of the points
+        :param ys: The y-coordinates of the points
+        :return: The distances
+        """
+        return to_column(map(abs, self.signed_distance_batch(xs, ys)))
+
+    def side_batch(
+        self, xs: ColumnLike, ys: ColumnLike, tol: float = DEFAULT_TOLERANCE
+    ) -> List[int]:
+        """
+        Determine on which side of the line many points are.
+
+        :param xs: The x-coordinates of the points
+        :param ys: The y-coordinates of the points
+        :param tol: Points closer to the line than this, relative to the
+            size of the coordinates, are on it
+        :return: 1 for the left side, -1 for the right side, 0 on the line
+        """
+        c = self.c
+        return [
+            0 if abs(distance) <= tol * _scale(c, x, y) else _sign(distance)
+            for distance, x, y in zip(
+                self.signed_distance_batch(xs, ys), xs, ys
+            )
+        ]
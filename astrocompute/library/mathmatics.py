@@ -2,9 +2,24 @@
 The module mathmatics.py provides (among others) the two functions:
 
 frac and modulo
+
+ddd and dms convert between decimal degrees and degrees, minutes, seconds.
+The sign of a negative angle is carried by its first non-zero component,
+e.g. -0.5 degrees is (0, -30, 0.0).  ddd_batch and dms_batch convert whole
+columns with the same rules.
 """
 
-from typing import Tuple
+from array import array
+from itertools import repeat
+from operator import sub
+from typing import Optional, Tuple
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
 
 
 def frac(x: float) -> float:
@@ -47,11 +62,13 @@ def ddd(d: int, m: int, s: float) -> float:
     )
 
 
-def dms(dd: float) -> Tuple[int, int, float]:
+def dms(dd: float, precision: Optional[int] = None) -> Tuple[int, int, float]:
     """
     Convert decimal degrees to degrees, minutes, seconds
 
     :param dd: Angle in decimal representation
+    :param precision: Round the seconds to this many decimals, carrying
+        60 seconds into the minutes and 60 minutes into the degrees
     :return: Tuple of degrees, minutes, seconds
     """
     sign = -1 if dd < 0 else 1
@@ -60,6 +77,15 @@ def dms(dd: float) -> Tuple[int, int, float]:
     m = int((dd - d) * 60)
     s = (dd - d - m / 60) * 3600
 
+    if precision is not None:
+        s = round(s, precision)
+        if s >= 60:
+            s -= 60
+            m += 1
+            if m == 60:
+                m = 0
+                d += 1
+
     if sign == -1:
         if d != 0:
             d = -d
@@ -69,3 +95,71 @@ def dms(dd: float) -> Tuple[int, int, float]:
             s = -s
 
     return d, m, s
+
+
+def ddd_batch(ds: ColumnLike, ms: ColumnLike, ss: ColumnLike) -> Column:
+    """
+    Convert columns of degrees, minutes, seconds to decimal degrees
+
+    Every row gives the same result as ddd.
+
+    :param ds: degrees
+    :param ms: minutes
+    :param ss: seconds
+    :return: Angles in decimal representation
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(ds, ms, ss)
+
+    return to_column(
+        [
+            (
+                -(abs(d) + abs(m) / 60.0 + abs(s) / 3600.0)
+                if d < 0 or m < 0 or s < 0
+                else d + m / 60.0 + s / 3600.0
+            )
+            for d, m, s in zip(ds, ms, ss)
+        ]
+    )
+
+
+def dms_batch(
+    dds: ColumnLike, precision: Optional[int] = None
+) -> Tuple[array, array, Column]:
+    """
+    Convert a column of decimal degrees to degrees, minutes, seconds
+
+    Every row gives the same result as dms.
+
+    :param dds: Angles in decimal representation
+    :param precision: Round the seconds to this many decimals, carrying
+        60 seconds into the minutes and 60 minutes into the degrees
+    :return: Integer columns of degrees and minutes, and a column of seconds
+    """
+    # Every step is a pass over a whole column; the rare rows that need a
+    # carry or a sign are fixed up afterwards.
+    dds = to_column(dds)
+    magnitudes = list(map(abs, dds))
+    degrees = list(map(int, magnitudes))
+    fractions = list(map(sub, magnitudes, degrees))
+    minutes = [int(f * 60) for f in fractions]
+    seconds = [(f - m / 60) * 3600 for f, m in zip(fractions, minutes)]
+
+    if precision is not None:
+        seconds = list(map(round, seconds, repeat(precision)))
+        for i in [i for i, s in enumerate(seconds) if s >= 60]:
+            seconds[i] -= 60
+            minutes[i] += 1
+            if minutes[i] == 60:
+                minutes[i] = 0
+                degrees[i] += 1
+
+    for i in [i for i, dd in enumerate(dds) if dd < 0]:
+        if degrees[i] != 0:
+            degrees[i] = -degrees[i]
+        elif minutes[i] != 0:
+            minutes[i] = -minutes[i]
+        else:
+            seconds[i] = -seconds[i]
+
+    return array("q", degrees), array("q", minutes), to_column(seconds)
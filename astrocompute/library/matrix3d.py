@@ -1,4 +1,17 @@
-from typing import List
+import math
+from functools import reduce
+from itertools import repeat
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.vector import Vector3D
+
+MatrixStack = Union["Mat3D", Sequence["Mat3D"]]
 
 
 class Mat3D:
@@ -42,17 +55,76 @@ def multiply(m1: Mat3D, m2: Mat3D) -> Mat3D:
     :param m2: Second matrix
     :return: The product of the two matrices
     """
+    (a11, a12, a13), (a21, a22, a23), (a31, a32, a33) = m1.data
+    (b11, b12, b13), (b21, b22, b23), (b31, b32, b33) = m2.data
     return Mat3D(
         [
             [
-                sum(m1.data[i][k] * m2.data[k][j] for k in range(3))
-                for j in range(3)
-            ]
-            for i in range(3)
+                a11 * b11 + a12 * b21 + a13 * b31,
+                a11 * b12 + a12 * b22 + a13 * b32,
+                a11 * b13 + a12 * b23 + a13 * b33,
+            ],
+            [
+                a21 * b11 + a22 * b21 + a23 * b31,
+                a21 * b12 + a22 * b22 + a23 * b32,
+                a21 * b13 + a22 * b23 + a23 * b33,
+            ],
+            [
+                a31 * b11 + a32 * b21 + a33 * b31,
+                a31 * b12 + a32 * b22 + a33 * b32,
+                a31 * b13 + a32 * b23 + a33 * b33,
+            ],
         ]
     )
 
 
+def compose(*matrices: Mat3D) -> Mat3D:
+    """
+    Multiplies a chain of 3x3 matrices from left to right.
+
+    :param matrices: The matrices, leftmost first
+    :return: The product of the matrices
+    :raises: ValueError if no matrices are given
+    """
+    if not matrices:
+        raise ValueError("At least one matrix is required")
+
+    return reduce(multiply, matrices)
+
+
+def rotation_x(angle: float) -> Mat3D:
+    """
+    Creates the matrix of a rotation of the coordinate frame about the x-axis.
+
+    :param angle: The rotation angle in radians
+    :return: The rotation matrix
+    """
+    c, s = math.cos(angle), math.sin(angle)
+    return Mat3D([[1.0, 0.0, 0.0], [0.0, c, s], [0.0, -s, c]])
+
+
+def rotation_y(angle: float) -> Mat3D:
+    """
+    Creates the matrix of a rotation of the coordinate frame about the y-axis.
+
+    :param angle: The rotation angle in radians
+    :return: The rotation matrix
+    """
+    c, s = math.cos(angle), math.sin(angle)
+    return Mat3D([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+
+
+def rotation_z(angle: float) -> Mat3D:
+    """
+    Creates the matrix of a rotation of the coordinate frame about the z-axis.
+
+    :param angle: The rotation angle in radians
+    :return: The rotation matrix
+    """
+    c, s = math.cos(angle), math.sin(angle)
+    return Mat3D([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
 def determinant(matrix: Mat3D) -> float:
     """
     Calculates the determinant of the 3x3 matrix.
@@ -74,3 +146,131 @@ def transpose(matrix: Mat3D) -> Mat3D:
     :return: The transposed matrix
     """
     return Mat3D([[matrix.data[j][i] for j in range(3)] for i in range(3)])
+
+
+def _stack(matrices: MatrixStack, size: int) -> Iterable[Mat3D]:
+    """
+    Get an iterable of matrices, repeating a single matrix size times.
+
+    :param matrices: A matrix or a stack of matrices
+    :param size: The number of matrices to produce for a single matrix
+    :return: An iterable over the matrices
+    :raises: ValueError if the stack does not have size matrices
+    """
+    if isinstance(matrices, Mat3D):
+        return repeat(matrices, size)
+
+    if len(matrices) != size:
+        raise ValueError(f"Expected {size} matrices, got {len(matrices)}")
+
+    return matrices
+
+
+def apply(matrix: Mat3D, vector: Vector3D) -> Vector3D:
+    """
+    Multiplies a 3x3 matrix with a column vector.
+
+    :param matrix: The matrix
+    :param vector: The vector
+    :return: The transformed vector
+    """
+    (a11, a12, a13), (a21, a22, a23), (a31, a32, a33) = matrix.data
+    x, y, z = vector
+    return (
+        a11 * x + a12 * y + a13 * z,
+        a21 * x + a22 * y + a23 * z,
+        a31 * x + a32 * y + a33 * z,
+    )
+
+
+def apply_batch(
+    matrices: MatrixStack, vectors: Sequence[Vector3D]
+) -> List[Vector3D]:
+    """
+    Applies a matrix, or a stack of matrices, to a block of vectors.
+
+    A single matrix is applied to every vector.  A stack must contain one
+    matrix per vector and the i-th matrix is applied to the i-th vector.
+
+    :param matrices: A matrix or a stack of N matrices
+    :param vectors: A block of N vectors
+    :return: The transformed vectors
+    :raises: ValueError if the stack and the block differ in length
+    """
+    if not isinstance(matrices, Mat3D):
+        return list(map(apply, _stack(matrices, len(vectors)), vectors))
+
+    (a11, a12, a13), (a21, a22, a23), (a31, a32, a33) = matrices.data
+    return [
+        (
+            a11 * x + a12 * y + a13 * z,
+            a21 * x + a22 * y + a23 * z,
+            a31 * x + a32 * y + a33 * z,
+        )
+        for x, y, z in vectors
+    ]
+
+
+def apply_columns(
+    matrix: Mat3D, xs: ColumnLike, ys: ColumnLike, zs: ColumnLike
+) -> Tuple[Column, Column, Column]:
+    """
+    Applies a matrix to vectors stored as coordinate columns.
+
+    :param matrix: The matrix
+    :param xs: The x-coordinates of the vectors
+    :param ys: The y-coordinates of the vectors
+    :param zs: The z-coordinates of the vectors
+    :return: The x, y and z columns of the transformed vectors
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(xs, ys, zs)
+    (a11, a12, a13), (a21, a22, a23), (a31, a32, a33) = matrix.data
+
+    return (
+        to_column([a11 * x + a12 * y + a13 * z for x, y, z in zip(xs, ys, zs)]),
+        to_column([a21 * x + a22 * y + a23 * z for x, y, z in zip(xs, ys, zs)]),
+        to_column([a31 * x + a32 * y + a33 * z for x, y, z in zip(xs, ys, zs)]),
+    )
+
+
+def multiply_batch(m1: MatrixStack, m2: MatrixStack) -> List[Mat3D]:
+    """
+    Multiplies two stacks of 3x3 matrices element by element.
+
+    Either operand may be a single matrix, which is then multiplied with
+    every matrix of the other stack.
+
+    :param m1: First matrix or stack of matrices
+    :param m2: Second matrix or stack of matrices
+    :return: The products of the matrices
+    :raises: ValueError if the stacks differ in length
+    """
+    if isinstance(m1, Mat3D) and isinstance(m2, Mat3D):
+        return [multiply(m1, m2)]
+
+    size = len(m2) if isinstance(m1, Mat3D) else len(m1)
+    return list(map(multiply, _stack(m1, size), _stack(m2, size)))
+
+
+def determinant_batch(matrices: Sequence[Mat3D]) -> Column:
+    """
+    Calculates the determinants of a stack of 3x3 matrices.
+
+    :param matrices: The matrices
+    :return: The determinants of the matrices
+    """
+    return to_column(map(determinant, matrices))
+
+
+def transpose_batch(matrices: Sequence[Mat3D]) -> List[Mat3D]:
+    """
+    Transposes a stack of 3x3 matrices.
+
+    :param matrices: The matrices
+    :return: The transposed matrices
+    """
+    return [
+        Mat3D([list(column) for column in zip(*matrix.data)])
+        for matrix in matrices
+    ]
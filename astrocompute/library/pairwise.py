@@ -0,0 +1,391 @@
+"""
+This module provides pairwise distances between two sets of points.
+
+Point3D.distance and PointArray3D.distance compare points one pair at a
+time or row by row.  The functions here compare every point of one set with
+every point of another (or of the same) set.  The distance matrix is
+computed in tiles of whole rows; the number of rows per tile is chosen so
+that a tile fits in a memory budget, so even sets of 10**5 points can be
+processed without allocating the full matrix.
+
+Three outputs are offered: the full matrix (distance_matrix), the upper
+triangle of a set against itself (condensed_distances, in the same order as
+scipy.spatial.distance.pdist) and the sparse list of pairs closer than a
+threshold (distances_within).  iter_distance_tiles streams the full matrix
+tile by tile for any other reduction.
+
+The tiles can be computed in worker processes.  The second set is sent to
+every worker once; after that only the rows of a tile travel to a worker
+and only its results travel back.  Since pure Python arithmetic is bound to
+one core, this is the only way to use more than one.  For small thresholds
+a KDTree answers fixed-radius queries without comparing every pair.
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import compress, islice, repeat
+from math import dist
+from operator import le
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from astrocompute.library.columns import Column, to_column
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+
+Points = Union[PointArray2D, PointArray3D, Iterable[Union[Point2D, Point3D]]]
+Columns = Tuple[Column, ...]
+Point = Tuple[float, ...]
+
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
+
+# The second set of points, installed once per worker process.
+_TARGET: Optional[List[Point]] = None
+
+
+class SparseDistances(NamedTuple):
+    """
+    The pairs of points closer than a threshold, in coordinate format.
+
+    The i-th pair is (rows[i], columns[i]) at distance distances[i]; rows
+    index the first set and columns the second.
+    """
+
+    rows: array
+    columns: array
+    distances: Column
+
+
+def _columns(points: Points) -> Columns:
+    if isinstance(points, PointArray3D):
+        return points.x, points.y, points.z
+
+    if isinstance(points, PointArray2D):
+        return points.x, points.y
+
+    points = list(points)
+    if points and isinstance(points[0], Point3D):
+        return _columns(PointArray3D.from_points(points))
+
+    return _columns(PointArray2D.from_points(points))
+
+
+def _validate(p: Points, q: Optional[Points]) -> Tuple[Columns, Columns]:
+    p_columns = _columns(p)
+    q_columns = p_columns if q is None else _columns(q)
+
+    if len(p_columns) != len(q_columns):
+        raise ValueError(
+            "Point sets must have the same dimension, "
+            f"got {len(p_columns)} and {len(q_columns)}"
+        )
+
+    return p_columns, q_columns
+
+
+def rows_per_tile(columns: int, memory_budget: int) -> int:
+    """
+    Calculate how many rows of distances fit in a memory budget.
+
+    :param columns: The number of distances per row
+    :param memory_budget: The largest size of a tile in bytes
+    :return: The number of rows per tile, at least 1
+    :raises: ValueError if memory_budget is smaller than 1
+    """
+    if memory_budget < 1:
+        raise ValueError("memory_budget must be at least 1")
+
+    return max(1, memory_budget // (8 * max(1, columns)))
+
+
+def _row(point: Point, target: List[Point], start: int) -> Column:
+    return to_column(
+        map(
+            dist,
+            islice(target, start, None) if start else target,
+            repeat(point),
+        )
+    )
+
+
+def _distance_rows(
+    block: Columns, start: int, target: List[Point], upper: bool
+) -> List[Column]:
+    """
+    Calculate the distances of a block of rows to the target points.
+
+    :param block: The coordinate columns of the rows
+    :param start: The index of the first row
+    :param target: The coordinates of the target points
+    :param upper: Whether row i only holds the distances to targets j > i
+    :return: One column of distances per row
+    """
+    return [
+        _row(point, target, start + k + 1 if upper else 0)
+        for k, point in enumerate(zip(*block))
+    ]
+
+
+def _pairs_within(
+    block: Columns,
+    start: int,
+    target: List[Point],
+    upper: bool,
+    threshold: float,
+) -> SparseDistances:
+    rows, columns, distances = array("q"), array("q"), to_column(())
+
+    for i, row in enumerate(_distance_rows(block, start, target, upper), start):
+        offset = i + 1 if upper else 0
+        hits = list(compress(range(len(row)), map(le, row, repeat(threshold))))
+        if hits:
+            rows.extend(repeat(i, len(hits)))
+            columns.extend(j + offset for j in hits)
+            distances.extend(row[j] for j in hits)
+
+    return SparseDistances(rows, columns, distances)
+
+
+def _install_target(target: List[Point]) -> None:
+    global _TARGET
+    _TARGET = target
+
+
+def _worker_rows(block: Columns, start: int, upper: bool) -> List[Column]:
+    return _distance_rows(block, start, _TARGET, upper)
+
+
+def _worker_pairs(
+    block: Columns, start: int, upper: bool, threshold: float
+) -> SparseDistances:
+    return _pairs_within(block, start, _TARGET, upper, threshold)
+
+
+def _iter_tiles(
+    source: Columns,
+    target: Columns,
+    upper: bool,
+    memory_budget: int,
+    workers: Optional[int],
+    task: Callable,
+    worker_task: Callable,
+    *args,
+) -> Iterator[Tuple[int, object]]:
+    """
+    Run a task over tiles of rows, in order, optionally in worker processes.
+
+    :return: An iterator over (first row, task result) pairs
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    # Up to two tiles per worker are in flight (see _run_tiles), and all of
+    # them together must fit in the budget.
+    workers = workers or 1
+    in_flight = 2 * workers if workers > 1 else 1
+    step = rows_per_tile(len(target[0]), memory_budget)
+    step = max(1, step // in_flight)
+
+    return _run_tiles(
+        source,
+        list(zip(*target)),
+        upper,
+        step,
+        workers,
+        task,
+        worker_task,
+        args,
+    )
+
+
+def _run_tiles(
+    source: Columns,
+    target: List[Point],
+    upper: bool,
+    step: int,
+    workers: int,
+    task: Callable,
+    worker_task: Callable,
+    args: tuple,
+) -> Iterator[Tuple[int, object]]:
+    starts = range(0, len(source[0]), step)
+
+    def block(start: int) -> Columns:
+        return tuple(column[start : start + step] for column in source)
+
+    if workers == 1:
+        for start in starts:
+            yield start, task(block(start), start, target, upper, *args)
+        return
+
+    with ProcessPoolExecutor(
+        workers, initializer=_install_target, initargs=(target,)
+    ) as executor:
+        # At most one tile per worker is queued behind the running ones,
+        # so at most 2 * workers tiles are in flight.
+        pending: Deque[Tuple[int, Future]] = deque()
+        for start in starts:
+            pending.append(
+                (
+                    start,
+                    executor.submit(
+                        worker_task, block(start), start, upper, *args
+                    ),
+                )
+            )
+            if len(pending) >= 2 * workers:
+                first, future = pending.popleft()
+                yield first, future.result()
+
+        while pending:
+            first, future = pending.popleft()
+            yield first, future.result()
+
+
+def iter_distance_tiles(
+    p: Points,
+    q: Optional[Points] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[int, List[Column]]]:
+    """
+    Calculate the distances between every pair of two sets of points.
+
+    The distance matrix is produced in tiles of whole rows.  The tiles are
+    sized so that all tiles in flight at a time (one, or two per worker)
+    together take at most memory_budget bytes, unless a single row is
+    larger.
+
+    :param p: The first points (the rows)
+    :param q: The second points (the columns), or None to use p
+    :param memory_budget: The largest size of all tiles in flight in bytes
+    :param workers: The number of worker processes, or None to compute the
+        tiles in the calling process
+    :return: An iterator over (first row, rows) pairs, where every row holds
+        the distances of one first point to all second points
+    :raises: ValueError if the sets have different dimensions, or
+        memory_budget or workers is smaller than 1
+    """
+    source, target = _validate(p, q)
+    return _iter_tiles(
+        source,
+        target,
+        False,
+        memory_budget,
+        workers,
+        _distance_rows,
+        _worker_rows,
+    )
+
+
+def distance_matrix(
+    p: Points,
+    q: Optional[Points] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: Optional[int] = None,
+) -> List[Column]:
+    """
+    Calculate the full matrix of distances between two sets of points.
+
+    The result takes 8 * len(p) * len(q) bytes; use condensed_distances,
+    distances_within or iter_distance_tiles for large sets.
+
+    :param p: The first points (the rows)
+    :param q: The second points (the columns), or None to use p
+    :param memory_budget: The largest size of all tiles in flight in bytes
+    :param workers: The number of worker processes, or None
+    :return: One column of distances per first point
+    """
+    matrix: List[Column] = []
+    for _, rows in iter_distance_tiles(p, q, memory_budget, workers):
+        matrix.extend(rows)
+
+    return matrix
+
+
+def condensed_distances(
+    p: Points,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: Optional[int] = None,
+) -> Column:
+    """
+    Calculate the distances between every pair of distinct points of a set.
+
+    The distance between points i < j of n is at index
+    n * i - i * (i + 1) // 2 + j - i - 1, as with scipy's pdist.  Only the
+    upper triangle is computed, which halves the work of the full matrix.
+
+    :param p: The points
+    :param memory_budget: The largest size of all tiles in flight in bytes
+    :param workers: The number of worker processes, or None
+    :return: The n * (n - 1) / 2 distances
+    :raises: ValueError if memory_budget or workers is smaller than 1
+    """
+    source = _columns(p)
+    result = to_column(())
+    for _, rows in _iter_tiles(
+        source,
+        source,
+        True,
+        memory_budget,
+        workers,
+        _distance_rows,
+        _worker_rows,
+    ):
+        for row in rows:
+            result.extend(row)
+
+    return result
+
+
+def distances_within(
+    p: Points,
+    q: Optional[Points] = None,
+    threshold: float = 0.0,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: Optional[int] = None,
+) -> SparseDistances:
+    """
+    Find all pairs of two sets of points that are close to each other.
+
+    Only the pairs within the threshold are kept, so the result is as large
+    as the number of close pairs and not as the distance matrix.  If q is
+    None, each pair of distinct points of p is reported once with
+    row < column.
+
+    :param p: The first points
+    :param q: The second points, or None to pair p with itself
+    :param threshold: The largest distance of a pair (inclusive)
+    :param memory_budget: The largest size of all tiles in flight in bytes
+    :param workers: The number of worker processes, or None
+    :return: The close pairs, ordered by row and then column
+    :raises: ValueError if the sets have different dimensions, or
+        memory_budget or workers is smaller than 1
+    """
+    source, target = _validate(p, q)
+    result = SparseDistances(array("q"), array("q"), to_column(()))
+
+    for _, tile in _iter_tiles(
+        source,
+        target,
+        q is None,
+        memory_budget,
+        workers,
+        _pairs_within,
+        _worker_pairs,
+        threshold,
+    ):
+        for column, values in zip(result, tile):
+            column.extend(values)
+
+    return result
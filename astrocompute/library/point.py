@@ -11,6 +11,15 @@ import re
 from dataclasses import dataclass
 from typing import Optional, Union
 
+from astrocompute.library.vector import cross_product, triple_product
+
+_POINT2D_PATTERN = re.compile(
+    r"Point2D\(x=(.*), y=(.*), name=(.*)\)|\((.*), (.*)\)"
+)
+_POINT3D_PATTERN = re.compile(
+    r"Point3D\(x=(.*), y=(.*), z=(.*)\)|\((.*), (.*), (.*)\)"
+)
+
 
 def _get_infinite_value(positive: Optional[bool] = True) -> float:
     """
@@ -124,9 +133,7 @@ class Point2D:
 
     @staticmethod
     def parse(repr_str: str) -> "Point2D":
-        match = re.match(
-            r"Point2D\(x=(.*), y=(.*), name=(.*)\)|\((.*), (.*)\)", repr_str
-        )
+        match = _POINT2D_PATTERN.match(repr_str)
 
         if not match:
             raise ValueError(f"Invalid Point2D representation: {repr_str}")
@@ -157,7 +164,7 @@ class Point2D:
         """
         _validate_points(p, q)
 
-        if Point2D().same_point(p, q):
+        if Point2D.same_point(p, q):
             return 0
 
         return math.sqrt((q.x - p.x) ** 2 + (q.y - p.y) ** 2)
@@ -173,7 +180,7 @@ class Point2D:
         """
         _validate_points(p, q)
 
-        if not Point2D().are_distinct(p, q):
+        if not Point2D.are_distinct(p, q):
             return p  # both points are the same so just return the first one
 
         return Point2D((p.x + q.x) / 2, (p.y + q.y) / 2)
@@ -190,10 +197,10 @@ class Point2D:
         """
         _validate_points(p, q)
 
-        if Point2D().is_vertical(p, q):
+        if Point2D.is_vertical(p, q):
             return float("nan")
 
-        if Point2D().is_horizontal(p, q):
+        if Point2D.is_horizontal(p, q):
             return 0.0
 
         return (q.y - p.y) / (q.x - p.x)
@@ -289,7 +296,7 @@ class Point2D:
         """
         _validate_points(p, q, r, s)
 
-        if Point2D().same_line(p, q, r, s):
+        if Point2D.same_line(p, q, r, s):
             return True  # Every line is considered parallel to itself.
 
         m1 = Point2D.slope(p, q)
@@ -315,18 +322,29 @@ class Point2D:
         return Point2D.slope(p, q) * Point2D.slope(r, s) == -1
 
     @staticmethod
-    def are_collinear(p: "Point2D", q: "Point2D", r: "Point2D") -> bool:
+    def are_collinear(
+        p: "Point2D", q: "Point2D", r: "Point2D", tol: float = 0.0
+    ) -> bool:
         """
         Check if three points are collinear.
 
         :param p: First point
         :param q: Second point
         :param r: Third point
+        :param tol: The largest sine of the angle between q - p and r - p
+            that still counts as collinear, 0 for an exact test
         :return: True if the points are collinear, False otherwise
         """
         _validate_points(p, q, r)
 
-        return (r.y - p.y) * (q.x - p.x) == (q.y - p.y) * (r.x - p.x)
+        ux, uy = q.x - p.x, q.y - p.y
+        vx, vy = r.x - p.x, r.y - p.y
+        if tol == 0.0:
+            return vy * ux == uy * vx
+
+        return abs(ux * vy - uy * vx) <= tol * math.hypot(ux, uy) * math.hypot(
+            vx, vy
+        )
 
     @staticmethod
     def create_from_coordinates(x: float, y: float) -> "Point2D":
@@ -383,9 +401,7 @@ class Point3D:
 
     @staticmethod
     def parse(repr_str: str) -> "Point3D":
-        match = re.match(
-            r"Point3D\(x=(.*), y=(.*), z=(.*)\)|\((.*), (.*), (.*)\)", repr_str
-        )
+        match = _POINT3D_PATTERN.match(repr_str)
         if match:
             x, y, z = map(
                 float,
@@ -410,32 +426,35 @@ class Point3D:
         return Point3D((p.x + q.x) / 2, (p.y + q.y) / 2, (p.z + q.z) / 2)
 
     @staticmethod
-    def are_collinear(p: "Point3D", q: "Point3D", r: "Point3D") -> bool:
+    def are_collinear(
+        p: "Point3D", q: "Point3D", r: "Point3D", tol: float = 0.0
+    ) -> bool:
         """
         Check if three points are collinear.
 
         :param p: First point
         :param q: Second point
         :param r: Third point
+        :param tol: The largest sine of the angle between q - p and r - p
+            that still counts as collinear, 0 for an exact test
         :return: True if the points are collinear, False otherwise
         """
         # Calculate vectors
         v1 = (q.x - p.x, q.y - p.y, q.z - p.z)
-        v2 = (r.x - q.x, r.y - q.y, r.z - q.z)
-
-        # Calculate cross product
-        cross_product = (
-            v1[1] * v2[2] - v1[2] * v2[1],
-            v1[2] * v2[0] - v1[0] * v2[2],
-            v1[0] * v2[1] - v1[1] * v2[0],
-        )
+        v2 = (r.x - p.x, r.y - p.y, r.z - p.z)
 
-        # If cross product is (0, 0, 0), the points are collinear
-        return cross_product == (0, 0, 0)
+        # If the cross product is (0, 0, 0), the points are collinear
+        return math.hypot(*cross_product(v1, v2)) <= tol * math.hypot(
+            *v1
+        ) * math.hypot(*v2)
 
     @staticmethod
     def are_coplanar(
-        p: "Point3D", q: "Point3D", r: "Point3D", s: "Point3D"
+        p: "Point3D",
+        q: "Point3D",
+        r: "Point3D",
+        s: "Point3D",
+        tol: float = 0.0,
     ) -> bool:
         """
         Check if four points are coplanar.
@@ -444,6 +463,9 @@ class Point3D:
         :param q: Second point
         :param r: Third point
         :param s: Fourth point
+        :param tol: The largest scalar triple product, relative to the
+            lengths of the three vectors from p, that still counts as
+            coplanar, 0 for an exact test
         :return: True if the points are coplanar, False otherwise
         """
         # Calculate vectors
@@ -451,15 +473,10 @@ class Point3D:
         v2 = (r.x - p.x, r.y - p.y, r.z - p.z)
         v3 = (s.x - p.x, s.y - p.y, s.z - p.z)
 
-        # Calculate scalar triple product
-        scalar_triple_product = (
-            v1[0] * (v2[1] * v3[2] - v2[2] * v3[1])
-            - v1[1] * (v2[0] * v3[2] - v2[2] * v3[0])
-            + v1[2] * (v2[0] * v3[1] - v2[1] * v3[0])
-        )
-
-        # If scalar triple product is 0, the points are coplanar
-        return scalar_triple_product == 0
+        # If the scalar triple product is 0, the points are coplanar
+        return abs(triple_product(v1, v2, v3)) <= tol * math.hypot(
+            *v1
+        ) * math.hypot(*v2) * math.hypot(*v3)
 
     @staticmethod
     def are_cocircular(p: "Point3D", q: "Point3D", r: "Point3D") -> bool:
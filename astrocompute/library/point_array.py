@@ -0,0 +1,509 @@
+"""
+This module provides columnar containers for large collections of points.
+
+A PointArray2D stores its x and y coordinates (and a PointArray3D its x, y
+and z coordinates) in contiguous float64 columns instead of one Point2D or
+Point3D instance per point.  A million 3D points take 24 MB.
+
+The static methods mirror the ones on Point2D and Point3D but operate on
+whole arrays at once, pairing the points row by row.  Wherever a second
+array is expected, a single point may be passed instead; it is then compared
+against every row.
+"""
+
+import math
+from itertools import repeat
+from operator import add, eq, mul, sub
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.point import Point2D, Point3D
+
+Names = Optional[Sequence[Optional[str]]]
+
+
+def _half(value: float) -> float:
+    return value / 2
+
+
+def _column(
+    points: Union["PointArray2D", "PointArray3D", Point2D, Point3D],
+    axis: str,
+    size: int,
+) -> Iterable[float]:
+    """
+    Get a coordinate column, repeating the coordinate of a single point.
+
+    :param points: A point array or a single point
+    :param axis: The coordinate name ("x", "y" or "z")
+    :param size: The number of rows to produce for a single point
+    :return: An iterable over the coordinate values
+    """
+    if isinstance(points, (Point2D, Point3D)):
+        return repeat(getattr(points, axis), size)
+
+    if len(points) != size:
+        raise ValueError(
+            f"Point arrays must have the same length, got {size} and {len(points)}"
+        )
+
+    return getattr(points, axis)
+
+
+def _validate_names(names: Names, size: int) -> Optional[List[Optional[str]]]:
+    if names is None:
+        return None
+
+    names = list(names)
+    if len(names) != size:
+        raise ValueError(f"Expected {size} names, got {len(names)}")
+
+    return names
+
+
+class PointArray2D:
+    """
+    A structure-of-arrays container for 2D points.
+    """
+
+    __slots__ = ("x", "y", "names")
+
+    def __init__(
+        self, x: ColumnLike = (), y: ColumnLike = (), names: Names = None
+    ):
+        self.x: Column = to_column(x)
+        self.y: Column = to_column(y)
+        self.names = _validate_names(names, validate_lengths(self.x, self.y))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int) -> Point2D:
+        name = self.names[index] if self.names is not None else None
+        return Point2D(self.x[index], self.y[index], name)
+
+    def __iter__(self) -> Iterator[Point2D]:
+        names = self.names if self.names is not None else repeat(None)
+        return map(Point2D, self.x, self.y, names)
+
+    def __repr__(self) -> str:
+        return f"PointArray2D(size={len(self)})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the coordinate columns.
+        """
+        return self.x.itemsize * (len(self.x) + len(self.y))
+
+    def append(self, point: Point2D) -> None:
+        """
+        Append a point to the array.
+
+        :param point: The point to append
+        """
+        if self.names is None and point.name is not None:
+            self.names = [None] * len(self)
+
+        self.x.append(point.x)
+        self.y.append(point.y)
+
+        if self.names is not None:
+            self.names.append(point.name)
+
+    @staticmethod
+    def from_points(points: Iterable[Point2D]) -> "PointArray2D":
+        """
+        Create a PointArray2D from Point2D instances.
+
+        :param points: The points
+        :return: The point array
+        """
+        result = PointArray2D()
+        for point in points:
+            result.append(point)
+
+        return result
+
+    @staticmethod
+    def dx(p: "PointArray2D", q: Union["PointArray2D", Point2D]) -> Column:
+        """
+        Calculate the differences in x-coordinates between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The differences in x-coordinates
+        """
+        return to_column(map(sub, _column(q, "x", len(p)), p.x))
+
+    @staticmethod
+    def dy(p: "PointArray2D", q: Union["PointArray2D", Point2D]) -> Column:
+        """
+        Calculate the differences in y-coordinates between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The differences in y-coordinates
+        """
+        return to_column(map(sub, _column(q, "y", len(p)), p.y))
+
+    @staticmethod
+    def same_point(
+        p: "PointArray2D", q: Union["PointArray2D", Point2D]
+    ) -> List[bool]:
+        """
+        Check which pairs of points are the same.
+
+        :param p: The first points
+        :param q: The second points
+        :return: True for every pair of identical points
+        """
+        qx = _column(q, "x", len(p))
+        qy = _column(q, "y", len(p))
+
+        return [a == c and b == d for a, b, c, d in zip(p.x, p.y, qx, qy)]
+
+    @staticmethod
+    def distance(
+        p: "PointArray2D", q: Union["PointArray2D", Point2D]
+    ) -> Column:
+        """
+        Calculate the distances between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The distances
+        """
+        return to_column(
+            map(math.hypot, PointArray2D.dx(p, q), PointArray2D.dy(p, q))
+        )
+
+    @staticmethod
+    def midpoint(
+        p: "PointArray2D", q: Union["PointArray2D", Point2D]
+    ) -> "PointArray2D":
+        """
+        Calculate the midpoints between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The midpoints
+        """
+        size = len(p)
+        return PointArray2D(
+            map(_half, map(add, p.x, _column(q, "x", size))),
+            map(_half, map(add, p.y, _column(q, "y", size))),
+        )
+
+    @staticmethod
+    def slope(p: "PointArray2D", q: Union["PointArray2D", Point2D]) -> Column:
+        """
+        Calculate the slopes of the lines through the points.
+
+        Vertical lines have a slope of nan, as with Point2D.slope.  Pairs of
+        identical points do not define a line and also yield nan.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The slopes
+        """
+        nan = float("nan")
+        return to_column(
+            (delta_y / delta_x if delta_x != 0 else nan)
+            for delta_x, delta_y in zip(
+                PointArray2D.dx(p, q), PointArray2D.dy(p, q)
+            )
+        )
+
+    @staticmethod
+    def y_intercept(
+        p: "PointArray2D", q: Union["PointArray2D", Point2D]
+    ) -> Column:
+        """
+        Calculate the y-intercepts of the lines through the points.
+
+        Vertical lines yield inf when they lie on the y-axis and nan
+        otherwise, as with Point2D.y_intercept.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The y-intercepts
+        """
+        qx = _column(q, "x", len(p))
+        intercepts = Column("d")
+        for px, py, other_x, m in zip(p.x, p.y, qx, PointArray2D.slope(p, q)):
+            if math.isnan(m):
+                on_axis = px == 0.0 and other_x == 0.0
+                intercepts.append(float("inf") if on_axis else float("nan"))
+            else:
+                intercepts.append(py - m * px)
+
+        return intercepts
+
+    @staticmethod
+    def are_collinear(
+        p: "PointArray2D",
+        q: Union["PointArray2D", Point2D],
+        r: Union["PointArray2D", Point2D],
+        tol: float = 0.0,
+    ) -> List[bool]:
+        """
+        Check which triples of points are collinear.
+
+        With a tolerance, a triple counts as collinear if the sine of the
+        angle between q - p and r - p is at most tol.
+
+        :param p: The first points
+        :param q: The second points
+        :param r: The third points
+        :param tol: The tolerance, 0 for an exact test
+        :return: True for every collinear triple
+        """
+        qx, qy = PointArray2D.dx(p, q), PointArray2D.dy(p, q)
+        rx, ry = PointArray2D.dx(p, r), PointArray2D.dy(p, r)
+
+        if tol == 0.0:
+            return list(map(eq, map(mul, ry, qx), map(mul, qy, rx)))
+
+        hypot = math.hypot
+        return [
+            abs(ux * vy - uy * vx) <= tol * hypot(ux, uy) * hypot(vx, vy)
+            for ux, uy, vx, vy in zip(qx, qy, rx, ry)
+        ]
+
+
+class PointArray3D:
+    """
+    A structure-of-arrays container for 3D points.
+    """
+
+    __slots__ = ("x", "y", "z", "names")
+
+    def __init__(
+        self,
+        x: ColumnLike = (),
+        y: ColumnLike = (),
+        z: ColumnLike = (),
+        names: Names = None,
+    ):
+        self.x: Column = to_column(x)
+        self.y: Column = to_column(y)
+        self.z: Column = to_column(z)
+        self.names = _validate_names(
+            names, validate_lengths(self.x, self.y, self.z)
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int) -> Point3D:
+        return Point3D(self.x[index], self.y[index], self.z[index])
+
+    def __iter__(self) -> Iterator[Point3D]:
+        return map(Point3D, self.x, self.y, self.z)
+
+    def __repr__(self) -> str:
+        return f"PointArray3D(size={len(self)})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the coordinate columns.
+        """
+        return self.x.itemsize * (len(self.x) + len(self.y) + len(self.z))
+
+    def name(self, index: int) -> Optional[str]:
+        """
+        Get the name of a point.
+
+        :param index: The index of the point
+        :return: The name, or None if the point is unnamed
+        """
+        return self.names[index] if self.names is not None else None
+
+    def append(self, point: Point3D, name: Optional[str] = None) -> None:
+        """
+        Append a point to the array.
+
+        :param point: The point to append
+        :param name: An optional name for the point
+        """
+        if self.names is None and name is not None:
+            self.names = [None] * len(self)
+
+        self.x.append(point.x)
+        self.y.append(point.y)
+        self.z.append(point.z)
+
+        if self.names is not None:
+            self.names.append(name)
+
+    @staticmethod
+    def from_points(points: Iterable[Point3D]) -> "PointArray3D":
+        """
+        Create a PointArray3D from Point3D instances.
+
+        :param points: The points
+        :return: The point array
+        """
+        result = PointArray3D()
+        for point in points:
+            result.append(point)
+
+        return result
+
+    @staticmethod
+    def dx(p: "PointArray3D", q: Union["PointArray3D", Point3D]) -> Column:
+        """
+        Calculate the differences in x-coordinates between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The differences in x-coordinates
+        """
+        return to_column(map(sub, _column(q, "x", len(p)), p.x))
+
+    @staticmethod
+    def dy(p: "PointArray3D", q: Union["PointArray3D", Point3D]) -> Column:
+        """
+        Calculate the differences in y-coordinates between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The differences in y-coordinates
+        """
+        return to_column(map(sub, _column(q, "y", len(p)), p.y))
+
+    @staticmethod
+    def dz(p: "PointArray3D", q: Union["PointArray3D", Point3D]) -> Column:
+        """
+        Calculate the differences in z-coordinates between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The differences in z-coordinates
+        """
+        return to_column(map(sub, _column(q, "z", len(p)), p.z))
+
+    @staticmethod
+    def distance(
+        p: "PointArray3D", q: Union["PointArray3D", Point3D]
+    ) -> Column:
+        """
+        Calculate the distances between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The distances
+        """
+        return to_column(
+            map(
+                math.hypot,
+                PointArray3D.dx(p, q),
+                PointArray3D.dy(p, q),
+                PointArray3D.dz(p, q),
+            )
+        )
+
+    @staticmethod
+    def midpoint(
+        p: "PointArray3D", q: Union["PointArray3D", Point3D]
+    ) -> "PointArray3D":
+        """
+        Calculate the midpoints between the points.
+
+        :param p: The first points
+        :param q: The second points
+        :return: The midpoints
+        """
+        size = len(p)
+        return PointArray3D(
+            map(_half, map(add, p.x, _column(q, "x", size))),
+            map(_half, map(add, p.y, _column(q, "y", size))),
+            map(_half, map(add, p.z, _column(q, "z", size))),
+        )
+
+    @staticmethod
+    def are_collinear(
+        p: "PointArray3D",
+        q: Union["PointArray3D", Point3D],
+        r: Union["PointArray3D", Point3D],
+        tol: float = 0.0,
+    ) -> List[bool]:
+        """
+        Check which triples of points are collinear.
+
+        With a tolerance, a triple counts as collinear if the sine of the
+        angle between q - p and r - p is at most tol, i.e. if
+        |u x v| <= tol * |u| * |v|; this does not depend on the scale of
+        the coordinates.
+
+        :param p: The first points
+        :param q: The second points
+        :param r: The third points
+        :param tol: The tolerance, 0 for an exact test
+        :return: True for every collinear triple
+        """
+        hypot = math.hypot
+        return [
+            hypot(uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
+            <= tol * hypot(ux, uy, uz) * hypot(vx, vy, vz)
+            for ux, uy, uz, vx, vy, vz in zip(
+                PointArray3D.dx(p, q),
+                PointArray3D.dy(p, q),
+                PointArray3D.dz(p, q),
+                PointArray3D.dx(p, r),
+                PointArray3D.dy(p, r),
+                PointArray3D.dz(p, r),
+            )
+        ]
+
+    @staticmethod
+    def are_coplanar(
+        p: "PointArray3D",
+        q: Union["PointArray3D", Point3D],
+        r: Union["PointArray3D", Point3D],
+        s: Union["PointArray3D", Point3D],
+        tol: float = 0.0,
+    ) -> List[bool]:
+        """
+        Check which quadruples of points are coplanar.
+
+        With a tolerance, a quadruple counts as coplanar if the scalar
+        triple product of u = q - p, v = r - p and w = s - p satisfies
+        |u . (v x w)| <= tol * |u| * |v| * |w|, i.e. if the volume spanned
+        by the vectors is small relative to their lengths; this does not
+        depend on the scale of the coordinates.
+
+        :param p: The first points
+        :param q: The second points
+        :param r: The third points
+        :param s: The fourth points
+        :param tol: The tolerance, 0 for an exact test
+        :return: True for every coplanar quadruple
+        """
+        hypot = math.hypot
+        return [
+            abs(
+                ux * (vy * wz - vz * wy)
+                - uy * (vx * wz - vz * wx)
+                + uz * (vx * wy - vy * wx)
+            )
+            <= tol * hypot(ux, uy, uz) * hypot(vx, vy, vz) * hypot(wx, wy, wz)
+            for ux, uy, uz, vx, vy, vz, wx, wy, wz in zip(
+                PointArray3D.dx(p, q),
+                PointArray3D.dy(p, q),
+                PointArray3D.dz(p, q),
+                PointArray3D.dx(p, r),
+                PointArray3D.dy(p, r),
+                PointArray3D.dz(p, r),
+                PointArray3D.dx(p, s),
+                PointArray3D.dy(p, s),
+                PointArray3D.dz(p, s),
+            )
+        ]
@@ -0,0 +1,293 @@
+"""
+This module provides a streaming parser for text dumps of points.
+
+Every line holds one point in one of the representations produced by
+Point2D and Point3D: ``Point2D(x=1.0, y=2.0, name=None)``, ``(1.0, 2.0)``,
+``Point3D(x=1.0, y=2.0, z=3.0)`` or ``(1.0, 2.0, 3.0)``.  Lines are read
+lazily and the parsed points are yielded in columnar chunks.
+
+The dimension of the stream is detected once, from the first valid line.
+Each chunk is first parsed with a single regular expression pass over the
+whole batch of lines; only batches that mix representations or contain
+malformed lines fall back to parsing line by line.  Blank lines are skipped,
+and lines that cannot be parsed (including points of the other dimension)
+are reported on the chunk instead of aborting the stream.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from astrocompute.library.columns import to_column
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+
+PointArray = Union[PointArray2D, PointArray3D]
+
+_REPR_2D = re.compile(r"Point2D\(x=([^,]*), y=([^,]*), name=(.*)\)")
+_TUPLE_2D = re.compile(r"\(([^,]*),([^,]*)\)")
+_REPR_3D = re.compile(r"Point3D\(x=([^,]*), y=([^,]*), z=([^,]*)\)")
+_TUPLE_3D = re.compile(r"\(([^,]*),([^,]*),([^,]*)\)")
+
+
+_BLOCK_PATTERNS = {
+    2: (
+        re.compile(
+            r"^Point2D\(x=([^,\n]*), y=([^,\n]*), name=(.*)\)$", re.MULTILINE
+        ),
+        re.compile(r"^\(([^,\n]*),([^,\n]*)\)$", re.MULTILINE),
+    ),
+    3: (
+        re.compile(
+            r"^Point3D\(x=([^,\n]*), y=([^,\n]*), z=([^,\n]*)\)$",
+            re.MULTILINE,
+        ),
+        re.compile(r"^\(([^,\n]*),([^,\n]*),([^,\n]*)\)$", re.MULTILINE),
+    ),
+}
+
+
+@dataclass
+class MalformedLine:
+    line_number: int
+    text: str
+    reason: str
+
+
+@dataclass
+class PointChunk:
+    """
+    A chunk of parsed points.
+
+    ``points`` is None only for chunks read before the first valid line of
+    the stream, while its dimension is still unknown.
+    """
+
+    points: Optional[PointArray]
+    errors: List[MalformedLine] = field(default_factory=list)
+
+
+def _to_name(text: str) -> Optional[str]:
+    return None if text == "None" else text.strip("'\"")
+
+
+def _parse_2d(text: str) -> Tuple[float, float, Optional[str]]:
+    """
+    Parse the text of a 2D point.
+
+    :param text: A stripped line
+    :return: The x and y coordinates and the name
+    :raises: ValueError if the text is not a 2D point
+    """
+    match = _REPR_2D.fullmatch(text)
+    if match:
+        x, y, name = match.groups()
+        return float(x), float(y), _to_name(name)
+
+    match = _TUPLE_2D.fullmatch(text)
+    if match:
+        x, y = match.groups()
+        return float(x), float(y), None
+
+    raise ValueError("Not a Point2D representation")
+
+
+def _parse_3d(text: str) -> Tuple[float, float, float]:
+    """
+    Parse the text of a 3D point.
+
+    :param text: A stripped line
+    :return: The x, y and z coordinates
+    :raises: ValueError if the text is not a 3D point
+    """
+    match = _REPR_3D.fullmatch(text) or _TUPLE_3D.fullmatch(text)
+    if not match:
+        raise ValueError("Not a Point3D representation")
+
+    x, y, z = match.groups()
+    return float(x), float(y), float(z)
+
+
+def _detect_dimension(text: str) -> int:
+    """
+    Detect the dimension of the point represented by a line.
+
+    :param text: A stripped line
+    :return: 2 or 3
+    :raises: ValueError if the line is not a point representation
+    """
+    if text.startswith("Point2D("):
+        return 2
+
+    if text.startswith("Point3D("):
+        return 3
+
+    if text.startswith("(") and text.count(",") in (1, 2):
+        return text.count(",") + 1
+
+    raise ValueError("Unknown point representation")
+
+
+def _parse_any(text: str) -> Any:
+    return _PARSERS[_detect_dimension(text)](text)
+
+
+_PARSERS: Dict[int, Callable[[str], Any]] = {2: _parse_2d, 3: _parse_3d}
+
+
+def _parse_block(texts: List[str], dimension: int) -> Optional[PointArray]:
+    """
+    Parse a batch of lines in one regular expression pass.
+
+    This is the fast path for batches in which every non-blank line uses
+    the same representation.
+
+    :param texts: The stripped lines of the batch
+    :param dimension: The dimension of the stream
+    :return: The parsed points, or None if the batch must be parsed line by
+        line
+    """
+    block = "\n".join(texts)
+    expected = len(texts) - texts.count("")
+
+    for pattern in _BLOCK_PATTERNS[dimension]:
+        found = pattern.findall(block)
+        if len(found) == expected:
+            break
+    else:
+        return None
+
+    try:
+        columns = [
+            to_column(map(float, map(itemgetter(i), found)))
+            for i in range(dimension)
+        ]
+    except ValueError:
+        return None
+
+    if dimension == 3:
+        return PointArray3D(*columns)
+
+    names = None
+    if pattern.groups == 3:
+        raw_names = list(map(itemgetter(2), found))
+        if raw_names.count("None") != len(raw_names):
+            names = list(map(_to_name, raw_names))
+
+    return PointArray2D(*columns, names=names)
+
+
+def _parse_lines(
+    texts: List[str], dimension: int, first_line: int
+) -> PointChunk:
+    """
+    Parse a batch of lines one at a time, reporting malformed lines.
+
+    :param texts: The stripped lines of the batch
+    :param dimension: The dimension of the stream, or 0 if still unknown
+    :param first_line: The line number of the first line of the batch
+    :return: The parsed chunk
+    """
+    parse = _PARSERS.get(dimension, _parse_any)
+    rows = []
+    errors = []
+
+    for line_number, text in enumerate(texts, start=first_line):
+        if not text:
+            continue
+
+        try:
+            rows.append(parse(text))
+        except ValueError as err:
+            errors.append(MalformedLine(line_number, text, str(err)))
+
+    if dimension == 2:
+        xs, ys, names = zip(*rows) if rows else ((), (), ())
+        has_names = any(name is not None for name in names)
+        points = PointArray2D(xs, ys, names=names if has_names else None)
+    elif dimension == 3:
+        points = PointArray3D(*zip(*rows)) if rows else PointArray3D()
+    else:
+        points = None
+
+    return PointChunk(points, errors)
+
+
+def _detect_stream_dimension(texts: List[str]) -> int:
+    """
+    Detect the dimension of a stream from its first valid line.
+
+    :param texts: The stripped lines
+    :return: 2 or 3, or 0 if none of the lines is a valid point
+    """
+    for text in texts:
+        try:
+            dimension = _detect_dimension(text)
+            _PARSERS[dimension](text)
+            return dimension
+        except ValueError:
+            continue
+
+    return 0
+
+
+def iter_point_chunks(
+    lines: Iterable[str], chunk_size: int = 65536
+) -> Iterator[PointChunk]:
+    """
+    Parse lines of point representations into columnar chunks.
+
+    :param lines: The lines to parse, consumed lazily
+    :param chunk_size: The number of lines per chunk
+    :return: An iterator over the parsed chunks
+    :raises: ValueError if chunk_size is smaller than 1
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    iterator = iter(lines)
+    first_line = 1
+    dimension = 0
+
+    while batch := list(islice(iterator, chunk_size)):
+        texts = list(map(str.strip, batch))
+        dimension = dimension or _detect_stream_dimension(texts)
+
+        points = _parse_block(texts, dimension) if dimension else None
+        if points is not None:
+            chunk = PointChunk(points)
+        else:
+            chunk = _parse_lines(texts, dimension, first_line)
+
+        first_line += len(batch)
+        if chunk.errors or (chunk.points is not None and len(chunk.points)):
+            yield chunk
+
+
+def read_point_chunks(
+    path: Union[str, os.PathLike],
+    chunk_size: int = 65536,
+    encoding: str = "utf-8",
+) -> Iterator[PointChunk]:
+    """
+    Parse a text file of point representations into columnar chunks.
+
+    :param path: The path of the file
+    :param chunk_size: The maximum number of points per chunk
+    :param encoding: The encoding of the file
+    :return: An iterator over the parsed chunks
+    """
+    with open(path, encoding=encoding) as stream:
+        yield from iter_point_chunks(stream, chunk_size)
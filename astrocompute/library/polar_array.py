@@ -0,0 +1,255 @@
+"""
+This module provides a columnar container for polar coordinates.
+
+A PolarArray stores radii and angles in float64 columns together with a
+Cartesian shadow of the same points.  Each form is computed from the other
+only when it is first needed and is then kept until the array is written
+to.  The batch operations work in whichever form is cheapest: add and
+subtract in Cartesian form, scale and rotate in either, so a chain of
+operations pays the trigonometry only when converting at its ends instead
+of twice per operation as the functions in the polar module do.
+
+Wherever a second array is expected, a single Polar may be passed instead;
+it is then combined with every row.  As with polar.rotate, angles are not
+normalized.
+"""
+
+import math
+from itertools import repeat
+from operator import add, mul, sub
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from astrocompute.library import polar
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.models.polar import Polar
+
+
+class PolarArray:
+    """
+    A structure-of-arrays container for polar coordinates.
+
+    The columns returned by r, theta, x and y are caches and must not be
+    modified in place; use item assignment or append instead.
+    """
+
+    __slots__ = ("_r", "_theta", "_x", "_y")
+
+    def __init__(self, r: ColumnLike = (), theta: ColumnLike = ()):
+        self._r: Optional[Column] = to_column(r)
+        self._theta: Optional[Column] = to_column(theta)
+        validate_lengths(self._r, self._theta)
+        self._x: Optional[Column] = None
+        self._y: Optional[Column] = None
+
+    @staticmethod
+    def from_cartesian(x: ColumnLike, y: ColumnLike) -> "PolarArray":
+        """
+        Create a PolarArray from Cartesian coordinates.
+
+        The polar form is computed when it is first needed.
+
+        :param x: The x-coordinates
+        :param y: The y-coordinates
+        :return: The polar array
+        """
+        result = PolarArray()
+        result._set_cartesian(to_column(x), to_column(y))
+        validate_lengths(result._x, result._y)
+
+        return result
+
+    @staticmethod
+    def from_polars(polars: Iterable[Polar]) -> "PolarArray":
+        """
+        Create a PolarArray from Polar instances.
+
+        :param polars: The polar coordinates
+        :return: The polar array
+        """
+        result = PolarArray()
+        for value in polars:
+            result.append(value)
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self._r if self._r is not None else self._x)
+
+    def __getitem__(self, index: int) -> Polar:
+        return Polar(self.r[index], self.theta[index])
+
+    def __setitem__(self, index: int, value: Polar) -> None:
+        self.r[index] = value.r
+        self.theta[index] = value.theta
+        self._x = self._y = None
+
+    def __iter__(self) -> Iterator[Polar]:
+        return map(Polar, self.r, self.theta)
+
+    def __repr__(self) -> str:
+        return f"PolarArray(size={len(self)})"
+
+    def _ensure_polar(self) -> None:
+        if self._r is None:
+            self._r = to_column(map(math.hypot, self._x, self._y))
+            self._theta = to_column(map(math.atan2, self._y, self._x))
+
+    def _ensure_cartesian(self) -> None:
+        if self._x is None:
+            self._x = to_column(map(mul, self._r, map(math.cos, self._theta)))
+            self._y = to_column(map(mul, self._r, map(math.sin, self._theta)))
+
+    @property
+    def r(self) -> Column:
+        """
+        The radii.
+        """
+        self._ensure_polar()
+        return self._r
+
+    @property
+    def theta(self) -> Column:
+        """
+        The angles in radians.
+        """
+        self._ensure_polar()
+        return self._theta
+
+    @property
+    def x(self) -> Column:
+        """
+        The x-coordinates of the Cartesian form.
+        """
+        self._ensure_cartesian()
+        return self._x
+
+    @property
+    def y(self) -> Column:
+        """
+        The y-coordinates of the Cartesian form.
+        """
+        self._ensure_cartesian()
+        return self._y
+
+    @property
+    def has_polar(self) -> bool:
+        return self._r is not None
+
+    @property
+    def has_cartesian(self) -> bool:
+        return self._x is not None
+
+    def _set_cartesian(self, x: Column, y: Column) -> None:
+        self._r = self._theta = None
+        self._x, self._y = x, y
+
+    def append(self, value: Polar) -> None:
+        """
+        Append polar coordinates to the array.
+
+        :param value: The polar coordinates to append
+        """
+        self.r.append(value.r)
+        self.theta.append(value.theta)
+        self._x = self._y = None
+
+    @staticmethod
+    def _cartesian_columns(
+        q: Union["PolarArray", Polar], size: int
+    ) -> Tuple[Iterable[float], Iterable[float]]:
+        if isinstance(q, Polar):
+            x, y = polar.to_cartesian(q.r, q.theta)
+            return repeat(x, size), repeat(y, size)
+
+        if len(q) != size:
+            raise ValueError(
+                f"Polar arrays must have the same length, got {size} and {len(q)}"
+            )
+
+        return q.x, q.y
+
+    @staticmethod
+    def add(p: "PolarArray", q: Union["PolarArray", Polar]) -> "PolarArray":
+        """
+        Add polar coordinates row by row.
+
+        :param p: The first polar coordinates
+        :param q: The second polar coordinates
+        :return: The sums
+        """
+        qx, qy = PolarArray._cartesian_columns(q, len(p))
+        return PolarArray.from_cartesian(map(add, p.x, qx), map(add, p.y, qy))
+
+    @staticmethod
+    def subtract(
+        p: "PolarArray", q: Union["PolarArray", Polar]
+    ) -> "PolarArray":
+        """
+        Subtract polar coordinates row by row.
+
+        :param p: The first polar coordinates
+        :param q: The polar coordinates to subtract
+        :return: The differences
+        """
+        qx, qy = PolarArray._cartesian_columns(q, len(p))
+        return PolarArray.from_cartesian(map(sub, p.x, qx), map(sub, p.y, qy))
+
+    @staticmethod
+    def scale(p: "PolarArray", scalar: float) -> "PolarArray":
+        """
+        Multiply every row by a scalar.
+
+        A negative scalar turns the angles by pi.
+
+        :param p: The polar coordinates
+        :param scalar: The scalar to multiply by
+        :return: The scaled polar coordinates
+        """
+        result = PolarArray()
+        result._r = result._theta = None
+
+        if p.has_cartesian:
+            result._x = to_column(map(mul, p._x, repeat(scalar)))
+            result._y = to_column(map(mul, p._y, repeat(scalar)))
+
+        if p.has_polar:
+            result._r = to_column(map(mul, p._r, repeat(abs(scalar))))
+            result._theta = (
+                to_column(map(add, p._theta, repeat(math.pi)))
+                if scalar < 0
+                else p._theta[:]
+            )
+
+        return result
+
+    @staticmethod
+    def rotate(p: "PolarArray", angle: float) -> "PolarArray":
+        """
+        Rotate every row by an angle.
+
+        :param p: The polar coordinates
+        :param angle: The angle in radians
+        :return: The rotated polar coordinates
+        """
+        result = PolarArray()
+        result._r = result._theta = None
+
+        if p.has_cartesian:
+            cos, sin = math.cos(angle), math.sin(angle)
+            result._x = to_column(
+                [x * cos - y * sin for x, y in zip(p._x, p._y)]
+            )
+            result._y = to_column(
+                [x * sin + y * cos for x, y in zip(p._x, p._y)]
+            )
+
+        if p.has_polar:
+            result._r = p._r[:]
+            result._theta = to_column(map(add, p._theta, repeat(angle)))
+
+        return result
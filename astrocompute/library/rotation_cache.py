@@ -0,0 +1,132 @@
+"""
+This module provides a cache for composed chains of rotation matrices.
+
+Transformations between reference frames are usually products of several
+rotations (for example nutation x precession x frame bias), and the same
+chain is evaluated for the same epoch over and over.  A RotationChainCache
+composes each chain once per set of parameters and keeps the resulting
+matrix, evicting the least recently used entries when it is full.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, NamedTuple, Tuple
+
+from astrocompute.library.matrix3d import Mat3D, multiply
+
+MatrixFactory = Callable[..., Mat3D]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RotationChainCache:
+    """
+    An LRU cache of composed rotation chains.
+
+    A chain is registered under a name as a sequence of factories.  Every
+    factory is called with the same parameters and the resulting matrices
+    are multiplied in registration order, so registering
+    ``("npb", nutation, precession, bias)`` yields N x P x B.
+
+    Cached matrices are shared between callers and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the RotationChainCache
+
+        :param maxsize: The maximum number of composed matrices to keep
+        :raises: ValueError if maxsize is smaller than 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._chains: Dict[str, Tuple[MatrixFactory, ...]] = {}
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Mat3D]" = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def register(self, name: str, *factories: MatrixFactory) -> None:
+        """
+        Register a chain of matrix factories under a name.
+
+        Registering a name again replaces the chain and drops its cached
+        matrices.
+
+        :param name: The name of the chain
+        :param factories: The factories, leftmost matrix first
+        :raises: ValueError if no factories are given
+        """
+        if not factories:
+            raise ValueError("A chain needs at least one factory")
+
+        with self._lock:
+            self._chains[name] = factories
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+
+    def matrix(self, name: str, *params: Hashable) -> Mat3D:
+        """
+        Get the composed matrix of a chain for the given parameters.
+
+        :param name: The name of the chain
+        :param params: The parameters passed to every factory
+        :return: The composed matrix
+        :raises: KeyError if no chain is registered under the name
+        """
+        key = (name, *params)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+
+            factories = self._chains[name]
+            self._misses += 1
+
+        composed = factories[0](*params)
+        for factory in factories[1:]:
+            composed = multiply(composed, factory(*params))
+
+        with self._lock:
+            # The chain may have been registered again while it was being
+            # composed; the matrix of the old chain must not be cached under
+            # the name of the new one.
+            if self._chains.get(name) is factories:
+                self._entries[key] = composed
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        return composed
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report the cache statistics.
+
+        :return: The hits, misses, maximum size and current size
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries)
+            )
+
+    def cache_clear(self) -> None:
+        """
+        Drop all cached matrices and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,319 @@
+"""
+This module provides angular separations and position angles on the sphere.
+
+Separations are computed with the Vincenty formula, which stays accurate for
+coincident, nearby and antipodal positions alike, unlike the arc cosine of
+a dot product.  Position angles are measured from the direction of
+decreasing theta (north, towards the +z axis) through increasing phi (east)
+and lie in [0, 2*pi).
+
+As in the spherical module theta is the polar angle measured from the
+z-axis and phi the azimuthal angle, both in radians; radii are ignored.
+Positions are given as Spherical (or SphericalPosition) instances or as
+columns of thetas and phis.  The sin/cos terms of theta are computed once
+per position, not once per pair.
+"""
+
+import math
+from itertools import islice
+from typing import Iterator, List, Tuple, Union
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.spherical import SphericalPosition
+from astrocompute.models.spherical import Spherical
+
+Position = Union[Spherical, SphericalPosition]
+
+TWO_PI = 2 * math.pi
+
+
+def _trig(thetas: ColumnLike) -> Tuple[List[float], List[float]]:
+    return list(map(math.sin, thetas)), list(map(math.cos, thetas))
+
+
+def _one_to_many(
+    theta: float,
+    phi: float,
+    sin_thetas: List[float],
+    cos_thetas: List[float],
+    phis: ColumnLike,
+) -> Column:
+    sin_t1, cos_t1 = math.sin(theta), math.cos(theta)
+    sin, cos, hypot, atan2 = math.sin, math.cos, math.hypot, math.atan2
+
+    return to_column(
+        [
+            atan2(
+                hypot(
+                    sin_t2 * sin(phi2 - phi),
+                    sin_t1 * cos_t2 - cos_t1 * sin_t2 * cos(phi2 - phi),
+                ),
+                cos_t1 * cos_t2 + sin_t1 * sin_t2 * cos(phi2 - phi),
+            )
+            for sin_t2, cos_t2, phi2 in zip(sin_thetas, cos_thetas, phis)
+        ]
+    )
+
+
+def separation(p: Position, q: Position) -> float:
+    """
+    Calculate the angular separation between two positions.
+
+    :param p: The first position
+    :param q: The second position
+    :return: The separation in radians, in [0, pi]
+    """
+    return _one_to_many(
+        p.theta, p.phi, [math.sin(q.theta)], [math.cos(q.theta)], [q.phi]
+    )[0]
+
+
+def position_angle(p: Position, q: Position) -> float:
+    """
+    Calculate the position angle of a position as seen from another.
+
+    :param p: The reference position
+    :param q: The position whose direction is measured
+    :return: The position angle in radians, in [0, 2*pi)
+    """
+    return position_angle_one_to_many(p, [q.theta], [q.phi])[0]
+
+
+def separation_one_to_many(
+    p: Position, thetas: ColumnLike, phis: ColumnLike
+) -> Column:
+    """
+    Calculate the separations between one position and many.
+
+    :param p: The position
+    :param thetas: The polar angles of the other positions
+    :param phis: The azimuthal angles of the other positions
+    :return: The separations in radians
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(thetas, phis)
+    return _one_to_many(p.theta, p.phi, *_trig(thetas), phis)
+
+
+def separation_paired(
+    thetas1: ColumnLike,
+    phis1: ColumnLike,
+    thetas2: ColumnLike,
+    phis2: ColumnLike,
+) -> Column:
+    """
+    Calculate the separations between two sets of positions row by row.
+
+    :param thetas1: The polar angles of the first positions
+    :param phis1: The azimuthal angles of the first positions
+    :param thetas2: The polar angles of the second positions
+    :param phis2: The azimuthal angles of the second positions
+    :return: The separations in radians
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(thetas1, phis1, thetas2, phis2)
+    sin, cos, hypot, atan2 = math.sin, math.cos, math.hypot, math.atan2
+
+    result = []
+    for theta1, phi1, theta2, phi2 in zip(thetas1, phis1, thetas2, phis2):
+        sin_t1, cos_t1 = sin(theta1), cos(theta1)
+        sin_t2, cos_t2 = sin(theta2), cos(theta2)
+        sin_dphi, cos_dphi = sin(phi2 - phi1), cos(phi2 - phi1)
+        result.append(
+            atan2(
+                hypot(
+                    sin_t2 * sin_dphi,
+                    sin_t1 * cos_t2 - cos_t1 * sin_t2 * cos_dphi,
+                ),
+                cos_t1 * cos_t2 + sin_t1 * sin_t2 * cos_dphi,
+            )
+        )
+
+    return to_column(result)
+
+
+def _position_angles(
+    theta: float,
+    phi: float,
+    sin_thetas: List[float],
+    cos_thetas: List[float],
+    phis: ColumnLike,
+) -> Column:
+    sin_t1, cos_t1 = math.sin(theta), math.cos(theta)
+    sin, cos, atan2 = math.sin, math.cos, math.atan2
+
+    return to_column(
+        [
+            atan2(
+                sin(phi2 - phi) * sin_t2,
+                sin_t1 * cos_t2 - cos_t1 * sin_t2 * cos(phi2 - phi),
+            )
+            % TWO_PI
+            for sin_t2, cos_t2, phi2 in zip(sin_thetas, cos_thetas, phis)
+        ]
+    )
+
+
+def position_angle_one_to_many(
+    p: Position, thetas: ColumnLike, phis: ColumnLike
+) -> Column:
+    """
+    Calculate the position angles of many positions as seen from one.
+
+    :param p: The reference position
+    :param thetas: The polar angles of the other positions
+    :param phis: The azimuthal angles of the other positions
+    :return: The position angles in radians, in [0, 2*pi)
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(thetas, phis)
+    return _position_angles(p.theta, p.phi, *_trig(thetas), phis)
+
+
+def position_angle_paired(
+    thetas1: ColumnLike,
+    phis1: ColumnLike,
+    thetas2: ColumnLike,
+    phis2: ColumnLike,
+) -> Column:
+    """
+    Calculate the position angles between two sets of positions row by row.
+
+    :param thetas1: The polar angles of the reference positions
+    :param phis1: The azimuthal angles of the reference positions
+    :param thetas2: The polar angles of the measured positions
+    :param phis2: The azimuthal angles of the measured positions
+    :return: The position angles in radians, in [0, 2*pi)
+    :raises: ValueError if the columns have different lengths
+    """
+    validate_lengths(thetas1, phis1, thetas2, phis2)
+    sin, cos, atan2 = math.sin, math.cos, math.atan2
+
+    return to_column(
+        [
+            atan2(
+                sin(phi2 - phi1) * sin(theta2),
+                sin(theta1) * cos(theta2)
+                - cos(theta1) * sin(theta2) * cos(phi2 - phi1),
+            )
+            % TWO_PI
+            for theta1, phi1, theta2, phi2 in zip(
+                thetas1, phis1, thetas2, phis2
+            )
+        ]
+    )
+
+
+def iter_separation_blocks(
+    thetas1: ColumnLike,
+    phis1: ColumnLike,
+    thetas2: ColumnLike,
+    phis2: ColumnLike,
+    chunk_size: int = 256,
+) -> Iterator[Tuple[int, List[Column]]]:
+    """
+    Calculate the separations between every pair of two sets of positions.
+
+    The separation matrix is produced in blocks of chunk_size rows, so at
+    most chunk_size * len(thetas2) separations are held at a time.
+
+    :param thetas1: The polar angles of the first positions (the rows)
+    :param phis1: The azimuthal angles of the first positions
+    :param thetas2: The polar angles of the second positions (the columns)
+    :param phis2: The azimuthal angles of the second positions
+    :param chunk_size: The number of rows per block
+    :return: An iterator over (first row, rows) pairs, where every row holds
+        the separations of one first position to all second positions
+    :raises: ValueError if chunk_size is smaller than 1 or the columns of a
+        set have different lengths
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    validate_lengths(thetas1, phis1)
+    validate_lengths(thetas2, phis2)
+    sin_thetas, cos_thetas = _trig(thetas2)
+
+    rows = zip(thetas1, phis1)
+    start = 0
+    while block := list(islice(rows, chunk_size)):
+        yield start, [
+            _one_to_many(theta, phi, sin_thetas, cos_thetas, phis2)
+            for theta, phi in block
+        ]
+        start += len(block)
+
+
+def iter_position_angle_blocks(
+    thetas1: ColumnLike,
+    phis1: ColumnLike,
+    thetas2: ColumnLike,
+    phis2: ColumnLike,
+    chunk_size: int = 256,
+) -> Iterator[Tuple[int, List[Column]]]:
+    """
+    Calculate the position angles between every pair of two sets of
+    positions.
+
+    The matrix is produced in blocks of chunk_size rows, so at most
+    chunk_size * len(thetas2) position angles are held at a time.
+
+    :param thetas1: The polar angles of the reference positions (the rows)
+    :param phis1: The azimuthal angles of the reference positions
+    :param thetas2: The polar angles of the measured positions (the columns)
+    :param phis2: The azimuthal angles of the measured positions
+    :param chunk_size: The number of rows per block
+    :return: An iterator over (first row, rows) pairs, where every row holds
+        the position angles in [0, 2*pi) of all measured positions as seen
+        from one reference position
+    :raises: ValueError if chunk_size is smaller than 1 or the columns of a
+        set have different lengths
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    validate_lengths(thetas1, phis1)
+    validate_lengths(thetas2, phis2)
+    sin_thetas, cos_thetas = _trig(thetas2)
+
+    rows = zip(thetas1, phis1)
+    start = 0
+    while block := list(islice(rows, chunk_size)):
+        yield start, [
+            _position_angles(theta, phi, sin_thetas, cos_thetas, phis2)
+            for theta, phi in block
+        ]
+        start += len(block)
+
+
+def pairs_within(
+    thetas1: ColumnLike,
+    phis1: ColumnLike,
+    thetas2: ColumnLike,
+    phis2: ColumnLike,
+    radius: float,
+    chunk_size: int = 256,
+) -> Iterator[Tuple[int, int, float]]:
+    """
+    Find all pairs of two sets of positions that are close to each other.
+
+    :param thetas1: The polar angles of the first positions
+    :param phis1: The azimuthal angles of the first positions
+    :param thetas2: The polar angles of the second positions
+    :param phis2: The azimuthal angles of the second positions
+    :param radius: The largest separation of a pair in radians (inclusive)
+    :param chunk_size: The number of first positions processed at a time
+    :return: An iterator over (first index, second index, separation)
+    """
+    for start, block in iter_separation_blocks(
+        thetas1, phis1, thetas2, phis2, chunk_size
+    ):
+        for i, row in enumerate(block, start):
+            for j, value in enumerate(row):
+                if value <= radius:
+                    yield i, j, value
@@ -0,0 +1,532 @@
+"""
+This module provides a hierarchical sky pixelization for cone and polygon
+searches, based on the Hierarchical Triangular Mesh (HTM).
+
+The sphere is split into the eight faces of an octahedron, with pixel ids
+8 to 15.  Every pixel is a spherical triangle that is split into four
+children at each deeper level; the children of pixel ``t`` have the ids
+``4 * t`` to ``4 * t + 3``.  All pixels of one level therefore have ids of
+the same bit length, and every pixel covers a contiguous range of the ids
+of any deeper level, which keeps the pixel lists of a query short.
+
+A SkyIndex assigns every position to its pixel at a fixed depth in one
+bulk pass and sorts the positions by pixel id.  A query first covers its
+region with pixels of increasing depth, keeping pixels that lie fully
+inside the region at the coarsest possible level, and returns the covered
+id ranges.  Positions in fully covered ranges are accepted as they are;
+only those in partially covered ranges are tested exactly.
+
+As in the spherical module theta is the polar angle measured from the
+z-axis and phi the azimuthal angle, both in radians.  from_radec converts
+right ascension and declination in degrees.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from typing import Callable, List, NamedTuple, Sequence, Tuple
+
+from astrocompute.library.columns import ColumnLike, validate_lengths
+from astrocompute.library.spherical_array import SphericalArray
+from astrocompute.library.vector import Vector3D
+
+DEFAULT_DEPTH = 10
+MAX_DEPTH = 20
+
+PixelRange = Tuple[int, int]
+Triangle = Tuple[Vector3D, Vector3D, Vector3D]
+
+_OUTSIDE, _PARTIAL, _INSIDE = 0, 1, 2
+
+_V = (
+    (0.0, 0.0, 1.0),
+    (1.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0),
+    (-1.0, 0.0, 0.0),
+    (0.0, -1.0, 0.0),
+    (0.0, 0.0, -1.0),
+)
+
+# The octahedron faces, counterclockwise when seen from outside the sphere.
+_ROOTS: Tuple[Tuple[int, Triangle], ...] = (
+    (8, (_V[1], _V[5], _V[2])),
+    (9, (_V[2], _V[5], _V[3])),
+    (10, (_V[3], _V[5], _V[4])),
+    (11, (_V[4], _V[5], _V[1])),
+    (12, (_V[1], _V[0], _V[4])),
+    (13, (_V[4], _V[0], _V[3])),
+    (14, (_V[3], _V[0], _V[2])),
+    (15, (_V[2], _V[0], _V[1])),
+)
+
+
+class Cover(NamedTuple):
+    """
+    The pixels covering a region, as sorted [start, stop) id ranges at the
+    depth of the query.
+    """
+
+    inside: List[PixelRange]
+    partial: List[PixelRange]
+
+
+def _cross(a: Vector3D, b: Vector3D) -> Vector3D:
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _dot(a: Vector3D, b: Vector3D) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _normalize(v: Vector3D) -> Vector3D:
+    norm = math.hypot(*v)
+    return v[0] / norm, v[1] / norm, v[2] / norm
+
+
+def _midpoint(a: Vector3D, b: Vector3D) -> Vector3D:
+    return _normalize((a[0] + b[0], a[1] + b[1], a[2] + b[2]))
+
+
+def _children(triangle: Triangle) -> Tuple[Triangle, ...]:
+    v0, v1, v2 = triangle
+    w0, w1, w2 = _midpoint(v1, v2), _midpoint(v0, v2), _midpoint(v0, v1)
+    return (v0, w2, w1), (v1, w0, w2), (v2, w1, w0), (w0, w1, w2)
+
+
+def _unit(theta: float, phi: float) -> Vector3D:
+    sin_theta = math.sin(theta)
+    return sin_theta * math.cos(phi), sin_theta * math.sin(phi), math.cos(theta)
+
+
+def _validate_depth(depth: int) -> None:
+    if not 0 <= depth <= MAX_DEPTH:
+        raise ValueError(f"depth must be between 0 and {MAX_DEPTH}")
+
+
+def from_radec(ra: float, dec: float) -> Tuple[float, float]:
+    """
+    Convert right ascension and declination to theta and phi.
+
+    :param ra: The right ascension in degrees
+    :param dec: The declination in degrees
+    :return: The polar and azimuthal angles in radians
+    """
+    return math.radians(90.0 - dec), math.radians(ra)
+
+
+def pixel_level(pixel_id: int) -> int:
+    """
+    Get the depth of a pixel.
+
+    :param pixel_id: The pixel id
+    :return: The depth, 0 for the octahedron faces
+    """
+    return (pixel_id.bit_length() - 4) // 2
+
+
+def pixel_vertices(pixel_id: int) -> Triangle:
+    """
+    Get the corners of a pixel.
+
+    :param pixel_id: The pixel id
+    :return: The unit vectors of the corners, counterclockwise
+    :raises: ValueError if the id is not a valid pixel id
+    """
+    level = pixel_level(pixel_id)
+    root = pixel_id >> (2 * level)
+    if pixel_id < 8 or not 8 <= root <= 15:
+        raise ValueError(f"{pixel_id} is not a pixel id")
+
+    triangle = _ROOTS[root - 8][1]
+    for shift in range(2 * (level - 1), -1, -2):
+        triangle = _children(triangle)[(pixel_id >> shift) & 3]
+
+    return triangle
+
+
+def _assign(
+    triangle: Triangle,
+    pixel_id: int,
+    levels: int,
+    rows: List[int],
+    unit: Tuple[ColumnLike, ColumnLike, ColumnLike],
+    ids: array,
+) -> None:
+    """
+    Assign rows known to lie in a pixel to its descendants.
+
+    The rows are split among the four children by testing them against
+    the edges of the middle child, whose planes are computed once per
+    pixel rather than once per row.
+    """
+    # pylint: disable=too-many-arguments
+    if levels == 0:
+        for row in rows:
+            ids[row] = pixel_id
+        return
+
+    xs, ys, zs = unit
+    children = _children(triangle)
+    w0, w1, w2 = children[3]
+    planes = (_cross(w1, w2), _cross(w2, w0), _cross(w0, w1))
+    groups: List[List[int]] = [[], [], [], []]
+
+    for row in rows:
+        x, y, z = xs[row], ys[row], zs[row]
+        for k, (a, b, c) in enumerate(planes):
+            if a * x + b * y + c * z < 0:
+                groups[k].append(row)
+                break
+        else:
+            groups[3].append(row)
+
+    for k, group in enumerate(groups):
+        if group:
+            _assign(children[k], 4 * pixel_id + k, levels - 1, group, unit, ids)
+
+
+def pixel_ids(
+    thetas: ColumnLike, phis: ColumnLike, depth: int = DEFAULT_DEPTH
+) -> array:
+    """
+    Calculate the pixel ids of many positions.
+
+    :param thetas: The polar angles of the positions
+    :param phis: The azimuthal angles of the positions
+    :param depth: The depth of the pixels
+    :return: The pixel ids as an int64 column
+    :raises: ValueError if the columns have different lengths or the depth
+        is out of range
+    """
+    _validate_depth(depth)
+    size = validate_lengths(thetas, phis)
+    unit = SphericalArray(repeat(1.0, size), thetas, phis).unit
+    return _pixel_ids(unit, depth)
+
+
+def _pixel_ids(
+    unit: Tuple[ColumnLike, ColumnLike, ColumnLike], depth: int
+) -> array:
+    xs, ys, zs = unit
+    ids = array("q", bytes(8 * len(xs)))
+    roots: List[List[int]] = [[] for _ in _ROOTS]
+
+    for row, (x, y, z) in enumerate(zip(xs, ys, zs)):
+        face = 4 if z >= 0 else 0
+        if face == 4:
+            # The north faces run clockwise around +z: N0 is x >= 0, y <= 0.
+            if x >= 0:
+                face += 0 if y <= 0 else 3
+            else:
+                face += 1 if y <= 0 else 2
+        elif x >= 0:
+            face += 0 if y >= 0 else 3
+        else:
+            face += 1 if y >= 0 else 2
+        roots[face].append(row)
+
+    for (pixel_id, triangle), rows in zip(_ROOTS, roots):
+        if rows:
+            _assign(triangle, pixel_id, depth, rows, unit, ids)
+
+    return ids
+
+
+def _merge(ranges: List[PixelRange]) -> List[PixelRange]:
+    merged: List[PixelRange] = []
+    for start, stop in sorted(ranges):
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+
+    return merged
+
+
+def _cover(classify: Callable[[Triangle], int], depth: int) -> Cover:
+    """
+    Cover a region with pixels.
+
+    :param classify: Tells if a pixel is outside, partially inside or
+        inside the region; it may only err towards partially inside
+    :param depth: The depth of the returned ranges
+    :return: The cover
+    """
+    inside: List[PixelRange] = []
+    partial: List[PixelRange] = []
+    stack = [(pixel_id, triangle, 0) for pixel_id, triangle in _ROOTS]
+
+    while stack:
+        pixel_id, triangle, level = stack.pop()
+        status = classify(triangle)
+        if status == _OUTSIDE:
+            continue
+
+        shift = 2 * (depth - level)
+        if status == _INSIDE or level == depth:
+            target = inside if status == _INSIDE else partial
+            target.append((pixel_id << shift, (pixel_id + 1) << shift))
+            continue
+
+        stack.extend(
+            (4 * pixel_id + k, child, level + 1)
+            for k, child in enumerate(_children(triangle))
+        )
+
+    return Cover(_merge(inside), _merge(partial))
+
+
+def _bounding_cap(triangle: Triangle) -> Tuple[Vector3D, float]:
+    v0, v1, v2 = triangle
+    center = _normalize(
+        (v0[0] + v1[0] + v2[0], v0[1] + v1[1] + v2[1], v0[2] + v1[2] + v2[2])
+    )
+    cos_radius = min(_dot(center, v) for v in triangle)
+    return center, math.acos(max(-1.0, min(1.0, cos_radius)))
+
+
+def cone_cover(
+    theta: float, phi: float, radius: float, depth: int = DEFAULT_DEPTH
+) -> Cover:
+    """
+    Cover a cone with pixels.
+
+    :param theta: The polar angle of the center of the cone
+    :param phi: The azimuthal angle of the center of the cone
+    :param radius: The opening radius of the cone in radians
+    :param depth: The depth of the returned ranges
+    :return: The pixel ranges inside and partially inside the cone
+    :raises: ValueError if the depth is out of range
+    """
+    _validate_depth(depth)
+    center = _unit(theta, phi)
+    max_chord2 = _chord2(radius)
+
+    def classify(triangle: Triangle) -> int:
+        cap_center, cap_radius = _bounding_cap(triangle)
+        distance = math.acos(max(-1.0, min(1.0, _dot(center, cap_center))))
+        if distance > radius + cap_radius + 1e-12:
+            return _OUTSIDE
+
+        if radius <= math.pi / 2:
+            if all(_chord2_between(center, v) <= max_chord2 for v in triangle):
+                return _INSIDE
+        elif math.pi - distance > math.pi - radius + cap_radius + 1e-12:
+            # A cone wider than a hemisphere is not convex; a pixel is
+            # inside it if it is outside the complementary cone.
+            return _INSIDE
+
+        return _PARTIAL
+
+    return _cover(classify, depth)
+
+
+def _half_spaces(vertices: Sequence[Tuple[float, float]]) -> List[Vector3D]:
+    """
+    Get the unit normals of the edges of a convex polygon, pointing inside.
+
+    :param vertices: The (theta, phi) corners in order
+    :return: The normals
+    :raises: ValueError if the polygon has fewer than three corners or is
+        not convex
+    """
+    if len(vertices) < 3:
+        raise ValueError("A polygon needs at least three vertices")
+
+    corners = [_unit(theta, phi) for theta, phi in vertices]
+    normals = [
+        _normalize(_cross(a, b))
+        for a, b in zip(corners, corners[1:] + corners[:1])
+    ]
+    centroid = tuple(sum(c[i] for c in corners) for i in range(3))
+    sides = [_dot(n, centroid) for n in normals]
+
+    if all(side < 0 for side in sides):
+        return [(-a, -b, -c) for a, b, c in normals]
+
+    if all(side > 0 for side in sides):
+        return normals
+
+    raise ValueError("The polygon must be convex")
+
+
+def polygon_cover(
+    vertices: Sequence[Tuple[float, float]], depth: int = DEFAULT_DEPTH
+) -> Cover:
+    """
+    Cover a convex spherical polygon with pixels.
+
+    :param vertices: The (theta, phi) corners of the polygon, in either
+        direction
+    :param depth: The depth of the returned ranges
+    :return: The pixel ranges inside and partially inside the polygon
+    :raises: ValueError if the depth is out of range or the polygon is not
+        convex
+    """
+    _validate_depth(depth)
+    normals = _half_spaces(vertices)
+
+    def classify(triangle: Triangle) -> int:
+        cap_center, cap_radius = _bounding_cap(triangle)
+        limit = -math.sin(cap_radius)
+        if any(_dot(n, cap_center) < limit for n in normals):
+            return _OUTSIDE
+
+        if all(_dot(n, v) >= 0 for n in normals for v in triangle):
+            return _INSIDE
+
+        return _PARTIAL
+
+    return _cover(classify, depth)
+
+
+def _chord2(radius: float) -> float:
+    return (2 * math.sin(min(radius, math.pi) / 2)) ** 2
+
+
+def _chord2_between(a: Vector3D, b: Vector3D) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+class SkyIndex:
+    """
+    A pixel index over a fixed set of positions on the sphere.
+    """
+
+    def __init__(
+        self, thetas: ColumnLike, phis: ColumnLike, depth: int = DEFAULT_DEPTH
+    ):
+        """
+        Build the index.
+
+        :param thetas: The polar angles of the positions
+        :param phis: The azimuthal angles of the positions
+        :param depth: The depth of the pixels
+        :raises: ValueError if the columns have different lengths or the
+            depth is out of range
+        """
+        _validate_depth(depth)
+        size = validate_lengths(thetas, phis)
+
+        self.depth = depth
+        self._unit = SphericalArray(repeat(1.0, size), thetas, phis).unit
+        self.ids = _pixel_ids(self._unit, depth)
+        self._order = sorted(range(size), key=self.ids.__getitem__)
+        self._sorted_ids = array("q", map(self.ids.__getitem__, self._order))
+
+    @staticmethod
+    def from_radec(
+        ras: ColumnLike, decs: ColumnLike, depth: int = DEFAULT_DEPTH
+    ) -> "SkyIndex":
+        """
+        Build an index from right ascensions and declinations.
+
+        :param ras: The right ascensions in degrees
+        :param decs: The declinations in degrees
+        :param depth: The depth of the pixels
+        :return: The index
+        """
+        thetas = [math.radians(90.0 - dec) for dec in decs]
+        return SkyIndex(thetas, list(map(math.radians, ras)), depth)
+
+    @staticmethod
+    def from_spherical_array(
+        positions: SphericalArray, depth: int = DEFAULT_DEPTH
+    ) -> "SkyIndex":
+        """
+        Build an index from a SphericalArray; the radii are ignored.
+
+        :param positions: The positions
+        :param depth: The depth of the pixels
+        :return: The index
+        """
+        return SkyIndex(positions.theta, positions.phi, depth)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _cover_depth(self, radius: float) -> int:
+        """
+        Choose the depth of the cover of a region.
+
+        Pixels about an eighth of the size of the region keep the cover
+        short without adding many positions to be tested exactly.
+        """
+        if radius <= 0:
+            return self.depth
+
+        level = math.ceil(math.log2(4 * math.pi / radius))
+        return max(0, min(self.depth, level))
+
+    def _rows(self, ranges: List[PixelRange], depth: int) -> List[int]:
+        sorted_ids, order = self._sorted_ids, self._order
+        shift = 2 * (self.depth - depth)
+        rows = []
+        for start, stop in ranges:
+            lo = bisect_left(sorted_ids, start << shift)
+            hi = bisect_left(sorted_ids, stop << shift, lo)
+            rows.extend(order[lo:hi])
+
+        return rows
+
+    def query_cone(self, theta: float, phi: float, radius: float) -> List[int]:
+        """
+        Find all positions within an angular distance of a position.
+
+        :param theta: The polar angle of the center of the cone
+        :param phi: The azimuthal angle of the center of the cone
+        :param radius: The opening radius of the cone in radians (inclusive)
+        :return: The indices of the positions, in ascending order
+        """
+        depth = self._cover_depth(radius)
+        cover = cone_cover(theta, phi, radius, depth)
+        cx, cy, cz = _unit(theta, phi)
+        max_chord2 = _chord2(radius)
+        xs, ys, zs = self._unit
+
+        rows = self._rows(cover.inside, depth)
+        rows.extend(
+            row
+            for row in self._rows(cover.partial, depth)
+            if (xs[row] - cx) ** 2 + (ys[row] - cy) ** 2 + (zs[row] - cz) ** 2
+            <= max_chord2
+        )
+
+        return sorted(rows)
+
+    def query_polygon(
+        self, vertices: Sequence[Tuple[float, float]]
+    ) -> List[int]:
+        """
+        Find all positions inside a convex spherical polygon.
+
+        :param vertices: The (theta, phi) corners of the polygon, in either
+            direction
+        :return: The indices of the positions, in ascending order
+        """
+        normals = _half_spaces(vertices)
+        corners = [_unit(theta, phi) for theta, phi in vertices]
+        center = _normalize(tuple(sum(c[i] for c in corners) for i in range(3)))
+        radius = max(
+            math.acos(max(-1.0, min(1.0, _dot(center, c)))) for c in corners
+        )
+        depth = self._cover_depth(radius)
+        cover = polygon_cover(vertices, depth)
+        xs, ys, zs = self._unit
+
+        rows = self._rows(cover.inside, depth)
+        rows.extend(
+            row
+            for row in self._rows(cover.partial, depth)
+            if all(
+                a * xs[row] + b * ys[row] + c * zs[row] >= 0
+                for a, b, c in normals
+            )
+        )
+
+        return sorted(rows)
@@ -1,5 +1,9 @@
 import math
+from typing import Optional, Union
 
+from astrocompute.library import matrix3d
+from astrocompute.library.matrix3d import Mat3D
+from astrocompute.library.vector import Vector3D
 from astrocompute.models.spherical import Spherical
 
 
@@ -84,3 +88,206 @@ def rotate(s: Spherical, dtheta: float, dphi: float) -> Spherical:
     :return: Rotated spherical coordinate
     """
     return Spherical(s.r, s.theta + dtheta, s.phi + dphi)
+
+
+def _angles(unit: Vector3D) -> tuple:
+    """
+    Calculates the polar and azimuthal angles of a unit vector.
+
+    :param unit: Unit vector
+    :return: The angles as a tuple (theta, phi)
+    """
+    ux, uy, uz = unit
+    return math.acos(max(-1.0, min(1.0, uz))), math.atan2(uy, ux)
+
+
+class SphericalPosition:
+    """
+    Spherical coordinates with a cached unit vector.
+
+    The unit vector, and with it the sin/cos terms of the angles, is
+    computed once and reused by to_cartesian and the arithmetic until
+    theta or phi is changed; changing r keeps it.  Positions created from
+    Cartesian coordinates compute their angles only when they are read.
+    The position of the origin has theta and phi zero.
+    """
+
+    __slots__ = ("_r", "_theta", "_phi", "_unit")
+
+    def __init__(self, r: float = 0.0, theta: float = 0.0, phi: float = 0.0):
+        self._r = r
+        self._theta: Optional[float] = theta
+        self._phi: Optional[float] = phi
+        self._unit: Optional[Vector3D] = None
+
+    @staticmethod
+    def from_spherical(s: Spherical) -> "SphericalPosition":
+        """
+        Creates a position from spherical coordinates.
+
+        :param s: Spherical coordinates
+        :return: The position
+        """
+        return SphericalPosition(s.r, s.theta, s.phi)
+
+    @staticmethod
+    def from_cartesian(x: float, y: float, z: float) -> "SphericalPosition":
+        """
+        Creates a position from Cartesian coordinates.
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param z: z-coordinate
+        :return: The position
+        """
+        result = SphericalPosition(math.hypot(x, y, z))
+        result._theta = result._phi = None
+        result._unit = (
+            (x / result._r, y / result._r, z / result._r)
+            if result._r
+            else (0.0, 0.0, 1.0)
+        )
+
+        return result
+
+    def __repr__(self) -> str:
+        return (
+            f"SphericalPosition(r={self.r}, theta={self.theta}, "
+            f"phi={self.phi})"
+        )
+
+    def _ensure_angles(self) -> None:
+        if self._theta is None:
+            self._theta, self._phi = _angles(self._unit)
+
+    @property
+    def r(self) -> float:
+        return self._r
+
+    @r.setter
+    def r(self, value: float) -> None:
+        self._r = value
+
+    @property
+    def theta(self) -> float:
+        self._ensure_angles()
+        return self._theta
+
+    @theta.setter
+    def theta(self, value: float) -> None:
+        self._ensure_angles()
+        self._theta = value
+        self._unit = None
+
+    @property
+    def phi(self) -> float:
+        self._ensure_angles()
+        return self._phi
+
+    @phi.setter
+    def phi(self, value: float) -> None:
+        self._ensure_angles()
+        self._phi = value
+        self._unit = None
+
+    @property
+    def unit(self) -> Vector3D:
+        """
+        The unit vector in the direction of the position.
+        """
+        if self._unit is None:
+            sin_theta = math.sin(self._theta)
+            self._unit = (
+                sin_theta * math.cos(self._phi),
+                sin_theta * math.sin(self._phi),
+                math.cos(self._theta),
+            )
+
+        return self._unit
+
+    def to_cartesian(self) -> Vector3D:
+        """
+        Converts the position to Cartesian coordinates.
+
+        :return: Cartesian coordinates as a tuple (x, y, z)
+        """
+        ux, uy, uz = self.unit
+        return self._r * ux, self._r * uy, self._r * uz
+
+    def to_spherical(self) -> Spherical:
+        """
+        Converts the position to a Spherical model.
+
+        :return: Spherical coordinates
+        """
+        return Spherical(self.r, self.theta, self.phi)
+
+    @staticmethod
+    def add(
+        p: "SphericalPosition", q: Union["SphericalPosition", Spherical]
+    ) -> "SphericalPosition":
+        """
+        Adds two positions.
+
+        :param p: First position
+        :param q: Second position
+        :return: Sum of the two positions
+        """
+        x1, y1, z1 = p.to_cartesian()
+        x2, y2, z2 = _cartesian(q)
+        return SphericalPosition.from_cartesian(x1 + x2, y1 + y2, z1 + z2)
+
+    @staticmethod
+    def subtract(
+        p: "SphericalPosition", q: Union["SphericalPosition", Spherical]
+    ) -> "SphericalPosition":
+        """
+        Subtracts the second position from the first.
+
+        :param p: First position
+        :param q: Second position
+        :return: Difference of the two positions
+        """
+        x1, y1, z1 = p.to_cartesian()
+        x2, y2, z2 = _cartesian(q)
+        return SphericalPosition.from_cartesian(x1 - x2, y1 - y2, z1 - z2)
+
+    @staticmethod
+    def scale(p: "SphericalPosition", scalar: float) -> "SphericalPosition":
+        """
+        Multiplies a position by a scalar.
+
+        As with multiply, the angles are kept and r may become negative.
+
+        :param p: The position
+        :param scalar: Scalar value
+        :return: The scaled position
+        """
+        result = SphericalPosition(p._r * scalar, p._theta, p._phi)
+        result._unit = p._unit
+
+        return result
+
+    @staticmethod
+    def rotate(p: "SphericalPosition", matrix: Mat3D) -> "SphericalPosition":
+        """
+        Rotates a position with a rotation matrix.
+
+        Only the cached unit vector is rotated, r is kept.
+
+        :param p: The position
+        :param matrix: A rotation matrix, e.g. from matrix3d.rotation_z
+        :return: The rotated position
+        """
+        result = SphericalPosition(p._r)
+        result._theta = result._phi = None
+        result._unit = matrix3d.apply(matrix, p.unit)
+
+        return result
+
+
+def _cartesian(s: Union[SphericalPosition, Spherical]) -> Vector3D:
+    if isinstance(s, SphericalPosition):
+        return s.to_cartesian()
+
+    return to_cartesian(s)
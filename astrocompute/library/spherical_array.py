@@ -0,0 +1,324 @@
+"""
+This module provides a columnar container for spherical coordinates.
+
+A SphericalArray stores radii, polar angles and azimuthal angles in float64
+columns together with the unit vectors of the positions.  The unit vectors
+hold the sin/cos terms of the angles; they are computed once, when first
+needed, and are only recomputed for rows whose angles are written.  The
+batch operations work on the unit vectors: add and subtract go through the
+Cartesian form, scale only touches the radii and rotate applies a rotation
+matrix to the unit vectors, so transforming the same positions to many
+epochs costs no trigonometry at all.  Angles of results are computed from
+their unit vectors when they are first read.
+
+As in the spherical module theta is the polar angle measured from the
+z-axis.  Wherever a second array is expected, a single Spherical or
+SphericalPosition may be passed instead; it is then combined with every
+row.
+"""
+
+import math
+from itertools import repeat
+from operator import add, mul, sub, truediv
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from astrocompute.library.columns import (
+    Column,
+    ColumnLike,
+    to_column,
+    validate_lengths,
+)
+from astrocompute.library.matrix3d import Mat3D
+from astrocompute.library.spherical import SphericalPosition, _cartesian
+from astrocompute.models.spherical import Spherical
+
+Columns3 = Tuple[Column, Column, Column]
+
+
+def _clamped_acos(value: float) -> float:
+    return math.acos(max(-1.0, min(1.0, value)))
+
+
+class SphericalArray:
+    """
+    A structure-of-arrays container for spherical coordinates.
+
+    The columns returned by r, theta, phi and unit are caches and must not
+    be modified in place; use item assignment or append instead.
+    """
+
+    __slots__ = ("_r", "_theta", "_phi", "_unit")
+
+    def __init__(
+        self,
+        r: ColumnLike = (),
+        theta: ColumnLike = (),
+        phi: ColumnLike = (),
+    ):
+        self._r: Column = to_column(r)
+        self._theta: Optional[Column] = to_column(theta)
+        self._phi: Optional[Column] = to_column(phi)
+        validate_lengths(self._r, self._theta, self._phi)
+        self._unit: Optional[Columns3] = None
+
+    @staticmethod
+    def _from_unit(r: Column, unit: Columns3) -> "SphericalArray":
+        result = SphericalArray()
+        result._r = r
+        result._theta = result._phi = None
+        result._unit = unit
+
+        return result
+
+    @staticmethod
+    def from_cartesian(
+        x: ColumnLike, y: ColumnLike, z: ColumnLike
+    ) -> "SphericalArray":
+        """
+        Create a SphericalArray from Cartesian coordinates.
+
+        The angles are computed when they are first needed.  Positions at
+        the origin have theta and phi zero.
+
+        :param x: The x-coordinates
+        :param y: The y-coordinates
+        :param z: The z-coordinates
+        :return: The spherical array
+        """
+        x, y, z = to_column(x), to_column(y), to_column(z)
+        validate_lengths(x, y, z)
+
+        r = to_column(map(math.hypot, x, y, z))
+        if 0.0 in r:
+            unit = (
+                to_column([a / n if n else 0.0 for a, n in zip(x, r)]),
+                to_column([a / n if n else 0.0 for a, n in zip(y, r)]),
+                to_column([a / n if n else 1.0 for a, n in zip(z, r)]),
+            )
+        else:
+            unit = (
+                to_column(map(truediv, x, r)),
+                to_column(map(truediv, y, r)),
+                to_column(map(truediv, z, r)),
+            )
+
+        return SphericalArray._from_unit(r, unit)
+
+    @staticmethod
+    def from_sphericals(
+        positions: Iterable[Union[Spherical, SphericalPosition]],
+    ) -> "SphericalArray":
+        """
+        Create a SphericalArray from Spherical or SphericalPosition instances.
+
+        :param positions: The spherical coordinates
+        :return: The spherical array
+        """
+        result = SphericalArray()
+        for position in positions:
+            result.append(position)
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self._r)
+
+    def __getitem__(self, index: int) -> Spherical:
+        return Spherical(self._r[index], self.theta[index], self.phi[index])
+
+    def __setitem__(
+        self, index: int, value: Union[Spherical, SphericalPosition]
+    ) -> None:
+        self._ensure_angles()
+        self._r[index] = value.r
+        self._theta[index] = value.theta
+        self._phi[index] = value.phi
+
+        if self._unit is not None:
+            ux, uy, uz = SphericalPosition(1.0, value.theta, value.phi).unit
+            self._unit[0][index] = ux
+            self._unit[1][index] = uy
+            self._unit[2][index] = uz
+
+    def __iter__(self) -> Iterator[Spherical]:
+        return map(Spherical, self._r, self.theta, self.phi)
+
+    def __repr__(self) -> str:
+        return f"SphericalArray(size={len(self)})"
+
+    def _ensure_angles(self) -> None:
+        if self._theta is None:
+            ux, uy, uz = self._unit
+            self._theta = to_column(map(_clamped_acos, uz))
+            self._phi = to_column(map(math.atan2, uy, ux))
+
+    @property
+    def has_angles(self) -> bool:
+        return self._theta is not None
+
+    @property
+    def has_unit(self) -> bool:
+        return self._unit is not None
+
+    @property
+    def r(self) -> Column:
+        """
+        The radii.
+        """
+        return self._r
+
+    @property
+    def theta(self) -> Column:
+        """
+        The polar angles in radians.
+        """
+        self._ensure_angles()
+        return self._theta
+
+    @property
+    def phi(self) -> Column:
+        """
+        The azimuthal angles in radians.
+        """
+        self._ensure_angles()
+        return self._phi
+
+    @property
+    def unit(self) -> Columns3:
+        """
+        The x, y and z columns of the unit vectors.
+        """
+        if self._unit is None:
+            sin_theta = list(map(math.sin, self._theta))
+            self._unit = (
+                to_column(map(mul, sin_theta, map(math.cos, self._phi))),
+                to_column(map(mul, sin_theta, map(math.sin, self._phi))),
+                to_column(map(math.cos, self._theta)),
+            )
+
+        return self._unit
+
+    def to_cartesian(self) -> Columns3:
+        """
+        Convert the positions to Cartesian coordinates.
+
+        :return: The x, y and z columns
+        """
+        return tuple(to_column(map(mul, self._r, u)) for u in self.unit)
+
+    def append(self, value: Union[Spherical, SphericalPosition]) -> None:
+        """
+        Append a position to the array.
+
+        :param value: The spherical coordinates to append
+        """
+        self._ensure_angles()
+        self._r.append(value.r)
+        self._theta.append(value.theta)
+        self._phi.append(value.phi)
+
+        if self._unit is not None:
+            for column, u in zip(
+                self._unit, SphericalPosition(1.0, value.theta, value.phi).unit
+            ):
+                column.append(u)
+
+    @staticmethod
+    def _cartesian_columns(
+        q: Union["SphericalArray", Spherical, SphericalPosition], size: int
+    ) -> Tuple[Iterable[float], ...]:
+        if isinstance(q, (Spherical, SphericalPosition)):
+            return tuple(repeat(c, size) for c in _cartesian(q))
+
+        if len(q) != size:
+            raise ValueError(
+                "Spherical arrays must have the same length, "
+                f"got {size} and {len(q)}"
+            )
+
+        return q.to_cartesian()
+
+    @staticmethod
+    def add(
+        p: "SphericalArray",
+        q: Union["SphericalArray", Spherical, SphericalPosition],
+    ) -> "SphericalArray":
+        """
+        Add positions row by row.
+
+        :param p: The first positions
+        :param q: The second positions
+        :return: The sums
+        """
+        q_columns = SphericalArray._cartesian_columns(q, len(p))
+        return SphericalArray.from_cartesian(
+            *(map(add, a, b) for a, b in zip(p.to_cartesian(), q_columns))
+        )
+
+    @staticmethod
+    def subtract(
+        p: "SphericalArray",
+        q: Union["SphericalArray", Spherical, SphericalPosition],
+    ) -> "SphericalArray":
+        """
+        Subtract positions row by row.
+
+        :param p: The first positions
+        :param q: The positions to subtract
+        :return: The differences
+        """
+        q_columns = SphericalArray._cartesian_columns(q, len(p))
+        return SphericalArray.from_cartesian(
+            *(map(sub, a, b) for a, b in zip(p.to_cartesian(), q_columns))
+        )
+
+    @staticmethod
+    def scale(p: "SphericalArray", scalar: float) -> "SphericalArray":
+        """
+        Multiply every position by a scalar.
+
+        As with spherical.multiply, the angles are kept and r may become
+        negative.
+
+        :param p: The positions
+        :param scalar: The scalar to multiply by
+        :return: The scaled positions
+        """
+        result = SphericalArray()
+        result._r = to_column(map(mul, p._r, repeat(scalar)))
+        result._theta = result._phi = None
+        if p.has_angles:
+            result._theta, result._phi = p._theta[:], p._phi[:]
+        if p.has_unit:
+            result._unit = tuple(column[:] for column in p._unit)
+
+        return result
+
+    @staticmethod
+    def rotate(p: "SphericalArray", matrix: Mat3D) -> "SphericalArray":
+        """
+        Rotate every position with a rotation matrix.
+
+        Only the unit vectors are rotated, the radii are kept.
+
+        :param p: The positions
+        :param matrix: A rotation matrix, e.g. from matrix3d.rotation_z
+        :return: The rotated positions
+        """
+        (a11, a12, a13), (a21, a22, a23), (a31, a32, a33) = matrix.data
+        ux, uy, uz = p.unit
+
+        return SphericalArray._from_unit(
+            p._r[:],
+            (
+                to_column(
+                    [a11 * x + a12 * y + a13 * z for x, y, z in zip(ux, uy, uz)]
+                ),
+                to_column(
+                    [a21 * x + a22 * y + a23 * z for x, y, z in zip(ux, uy, uz)]
+                ),
+                to_column(
+                    [a31 * x + a32 * y + a33 * z for x, y, z in zip(ux, uy, uz)]
+                ),
+            ),
+        )
@@ -1,9 +1,14 @@
 import math
-from typing import Tuple, Union, overload
+import numbers
+from itertools import repeat, starmap
+from typing import Iterable, List, Sequence, Tuple, Union, overload
+
+from astrocompute.library.columns import Column, to_column
 
 Vector2D = Tuple[float, float]
 Vector3D = Tuple[float, float, float]
 Vector = Union[Vector2D, Vector3D]
+VectorBlock = Sequence[Vector]
 
 
 def dimension(v: Vector) -> int:
@@ -89,6 +94,41 @@ def normalize(v: Vector) -> Vector:
     return tuple(vi / n for vi in v)  # type: ignore
 
 
+def cross_product(u: Vector3D, v: Vector3D) -> Vector3D:
+    """
+    Calculates the cross product of two 3D vectors.
+
+    :param u: The first vector
+    :param v: The second vector
+    :return: The vector u x v
+    """
+    ux, uy, uz = u
+    vx, vy, vz = v
+    return (uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
+
+
+def triple_product(u: Vector3D, v: Vector3D, w: Vector3D) -> float:
+    """
+    Calculates the scalar triple product u . (v x w) of three 3D vectors.
+
+    Its absolute value is the volume of the parallelepiped spanned by the
+    vectors, which is zero if and only if they are coplanar.
+
+    :param u: The first vector
+    :param v: The second vector
+    :param w: The third vector
+    :return: The scalar triple product
+    """
+    ux, uy, uz = u
+    vx, vy, vz = v
+    wx, wy, wz = w
+    return (
+        ux * (vy * wz - vz * wy)
+        + uy * (vz * wx - vx * wz)
+        + uz * (vx * wy - vy * wx)
+    )
+
+
 @overload
 def are_orthogonal(u: Vector2D, v: Vector2D) -> bool:
     pass
@@ -132,3 +172,229 @@ def are_parallel(u: Vector, v: Vector) -> bool:
         and u[0] * v[2] == u[2] * v[0]
         and u[1] * v[2] == u[2] * v[1]
     )
+
+
+def _block_dimension(vectors: VectorBlock) -> int:
+    """
+    Get the dimension of a block of vectors from its first row.
+
+    Rows of another dimension fail to unpack with a ValueError later on.
+
+    :param vectors: A block of 2D or 3D vectors
+    :return: 2 or 3 (3 for an empty block)
+    :raises: ValueError if the dimension is not 2 or 3
+    """
+    # len rather than truthiness, so that NumPy (N, 2) or (N, 3) arrays work
+    if len(vectors) == 0:
+        return 3
+
+    block_dimension = len(vectors[0])
+    if block_dimension not in (2, 3):
+        raise ValueError(f"Unsupported dimension: {block_dimension}")
+
+    return block_dimension
+
+
+def _rows(vectors: Union[Vector, VectorBlock], size: int) -> Iterable[Vector]:
+    """
+    Get an iterable of vectors, repeating a single vector size times.
+
+    :param vectors: A vector or a block of vectors
+    :param size: The number of vectors to produce for a single vector
+    :return: An iterable over the vectors
+    :raises: ValueError if the block does not have size vectors
+    """
+    if len(vectors) and isinstance(vectors[0], numbers.Real):
+        return repeat(vectors, size)
+
+    if len(vectors) != size:
+        raise ValueError(f"Expected {size} vectors, got {len(vectors)}")
+
+    return vectors
+
+
+def add_batch(us: VectorBlock, vs: Union[Vector, VectorBlock]) -> List[Vector]:
+    """
+    Adds two blocks of vectors row by row.
+
+    :param us: A block of N vectors
+    :param vs: A block of N vectors, or a single vector added to every row
+    :return: The sums
+    :raises: ValueError if the blocks differ in length or dimension
+    """
+    rows = _rows(vs, len(us))
+
+    if _block_dimension(us) == 2:
+        return [(ux + vx, uy + vy) for (ux, uy), (vx, vy) in zip(us, rows)]
+
+    return [
+        (ux + vx, uy + vy, uz + vz)
+        for (ux, uy, uz), (vx, vy, vz) in zip(us, rows)
+    ]
+
+
+def scalar_multiply_batch(
+    s: Union[float, Sequence[float]], vs: VectorBlock
+) -> List[Vector]:
+    """
+    Multiplies a block of vectors by scalars.
+
+    :param s: A scalar, or one scalar per vector
+    :param vs: A block of N vectors
+    :return: The scaled vectors
+    :raises: ValueError if the scalars and the block differ in length
+    """
+    if isinstance(s, numbers.Real):
+        scalars = repeat(s, len(vs))
+    else:
+        if len(s) != len(vs):
+            raise ValueError(f"Expected {len(vs)} scalars, got {len(s)}")
+        scalars = s
+
+    if _block_dimension(vs) == 2:
+        return [(si * x, si * y) for si, (x, y) in zip(scalars, vs)]
+
+    return [(si * x, si * y, si * z) for si, (x, y, z) in zip(scalars, vs)]
+
+
+def dot_product_batch(
+    us: VectorBlock, vs: Union[Vector, VectorBlock]
+) -> Column:
+    """
+    Calculates the dot products of two blocks of vectors row by row.
+
+    :param us: A block of N vectors
+    :param vs: A block of N vectors, or a single vector dotted with every row
+    :return: The dot products
+    :raises: ValueError if the blocks differ in length or dimension
+    """
+    rows = _rows(vs, len(us))
+
+    if _block_dimension(us) == 2:
+        return to_column(
+            [ux * vx + uy * vy for (ux, uy), (vx, vy) in zip(us, rows)]
+        )
+
+    return to_column(
+        [
+            ux * vx + uy * vy + uz * vz
+            for (ux, uy, uz), (vx, vy, vz) in zip(us, rows)
+        ]
+    )
+
+
+def norm_batch(vs: VectorBlock) -> Column:
+    """
+    Calculates the norms of a block of vectors.
+
+    The norms are computed with math.hypot, which avoids overflow and may
+    differ from norm in the last bit.
+
+    :param vs: A block of vectors
+    :return: The norms
+    """
+    return to_column(starmap(math.hypot, vs))
+
+
+def normalize_batch(vs: VectorBlock) -> Tuple[List[Vector], List[int]]:
+    """
+    Normalizes a block of vectors.
+
+    Unlike normalize, zero vectors do not raise: they are kept as zero
+    vectors and their rows are reported, so one bad row does not abort the
+    whole block.
+
+    :param vs: A block of vectors
+    :return: The unit vectors and the indices of the zero vectors
+    :raises: ValueError if the rows differ in dimension
+    """
+    norms = list(starmap(math.hypot, vs))
+    zeros = [i for i, n in enumerate(norms) if n == 0.0]
+    for i in zeros:
+        norms[i] = 1.0
+
+    if _block_dimension(vs) == 2:
+        units = [(x / n, y / n) for (x, y), n in zip(vs, norms)]
+    else:
+        units = [(x / n, y / n, z / n) for (x, y, z), n in zip(vs, norms)]
+
+    return units, zeros
+
+
+def cross_product_batch(
+    us: Sequence[Vector3D], vs: Union[Vector3D, Sequence[Vector3D]]
+) -> List[Vector3D]:
+    """
+    Calculates the cross products of two blocks of 3D vectors row by row.
+
+    :param us: A block of N vectors
+    :param vs: A block of N vectors, or a single vector
+    :return: The cross products
+    :raises: ValueError if the blocks differ in length or a row is not 3D
+    """
+    return [
+        (uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx)
+        for (ux, uy, uz), (vx, vy, vz) in zip(us, _rows(vs, len(us)))
+    ]
+
+
+def triple_product_batch(
+    us: Sequence[Vector3D],
+    vs: Union[Vector3D, Sequence[Vector3D]],
+    ws: Union[Vector3D, Sequence[Vector3D]],
+) -> Column:
+    """
+    Calculates the scalar triple products u . (v x w) of blocks of vectors.
+
+    :param us: A block of N vectors
+    :param vs: A block of N vectors, or a single vector
+    :param ws: A block of N vectors, or a single vector
+    :return: The scalar triple products
+    :raises: ValueError if the blocks differ in length or a row is not 3D
+    """
+    size = len(us)
+    return to_column(
+        [
+            ux * (vy * wz - vz * wy)
+            + uy * (vz * wx - vx * wz)
+            + uz * (vx * wy - vy * wx)
+            for (ux, uy, uz), (vx, vy, vz), (wx, wy, wz) in zip(
+                us, _rows(vs, size), _rows(ws, size)
+            )
+        ]
+    )
+
+
+def are_orthogonal_batch(
+    us: VectorBlock, vs: Union[Vector, VectorBlock]
+) -> List[bool]:
+    """
+    Checks which pairs of vectors are orthogonal.
+
+    :param us: A block of N vectors
+    :param vs: A block of N vectors, or a single vector
+    :return: True for every orthogonal pair
+    """
+    return [d == 0.0 for d in dot_product_batch(us, vs)]
+
+
+def are_parallel_batch(
+    us: VectorBlock, vs: Union[Vector, VectorBlock]
+) -> List[bool]:
+    """
+    Checks which pairs of vectors are parallel.
+
+    :param us: A block of N vectors
+    :param vs: A block of N vectors, or a single vector
+    :return: True for every parallel pair
+    :raises: ValueError if the blocks differ in length or dimension
+    """
+    rows = _rows(vs, len(us))
+
+    if _block_dimension(us) == 2:
+        return [ux * vy == uy * vx for (ux, uy), (vx, vy) in zip(us, rows)]
+
+    return [
+        ux * vy == uy * vx and ux * vz == uz * vx and uy * vz == uz * vy
+        for (ux, uy, uz), (vx, vy, vz) in zip(us, rows)
+    ]
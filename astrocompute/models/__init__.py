@@ -1,6 +1,29 @@
-from astrocompute.models.point import Point2D, Point3D
-from astrocompute.models.polar import Polar
-from astrocompute.models.spherical import Spherical
-from astrocompute.models.vector import Vector2D, Vector3D
+from astrocompute.models.point import (
+    FrozenPoint2D,
+    FrozenPoint3D,
+    Point2D,
+    Point3D,
+)
+from astrocompute.models.polar import FrozenPolar, Polar
+from astrocompute.models.spherical import FrozenSpherical, Spherical
+from astrocompute.models.vector import (
+    FrozenVector2D,
+    FrozenVector3D,
+    Vector2D,
+    Vector3D,
+)
 
-__all__ = ["Point2D", "Point3D", "Vector2D", "Vector3D", "Polar", "Spherical"]
+__all__ = [
+    "Point2D",
+    "Point3D",
+    "Vector2D",
+    "Vector3D",
+    "Polar",
+    "Spherical",
+    "FrozenPoint2D",
+    "FrozenPoint3D",
+    "FrozenVector2D",
+    "FrozenVector3D",
+    "FrozenPolar",
+    "FrozenSpherical",
+]
@@ -2,14 +2,27 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Point2D:
     x: Optional[float] = float(0)
     y: Optional[float] = float(0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Point3D:
     x: Optional[float] = float(0)
     y: Optional[float] = float(0)
     z: Optional[float] = float(0)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenPoint2D:
+    x: float = float(0)
+    y: float = float(0)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenPoint3D:
+    x: float = float(0)
+    y: float = float(0)
+    z: float = float(0)
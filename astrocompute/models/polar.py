@@ -2,7 +2,13 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Polar:
     r: Optional[float] = 0.0
     theta: Optional[float] = 0.0  # Angle in radians
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenPolar:
+    r: float = 0.0
+    theta: float = 0.0  # Angle in radians
@@ -2,8 +2,15 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Spherical:
     r: Optional[float] = float(0)
     theta: Optional[float] = float(0)  # Polar angle in radians
     phi: Optional[float] = float(0)  # Azimuthal angle in radians
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSpherical:
+    r: float = float(0)
+    theta: float = float(0)  # Polar angle in radians
+    phi: float = float(0)  # Azimuthal angle in radians
@@ -0,0 +1,99 @@
+"""
+Memory and construction-time benchmark for the astrocompute models.
+
+Every model is compared against a plain dataclass with the same fields,
+which is how the models were declared before they were slotted.
+
+Usage:
+    python -m benchmarks.bench_models [--count 1000000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from astrocompute.models import (
+    FrozenPoint3D,
+    FrozenSpherical,
+    FrozenVector3D,
+    Point3D,
+    Spherical,
+    Vector3D,
+)
+
+
+@dataclass
+class PlainPoint3D:
+    x: Optional[float] = float(0)
+    y: Optional[float] = float(0)
+    z: Optional[float] = float(0)
+
+
+def measure(factory: Callable, count: int) -> Tuple[float, int]:
+    """
+    Construct count instances and measure the elapsed time and memory.
+
+    :param factory: The class to instantiate with three float arguments
+    :param count: The number of instances to construct
+    :return: The construction time in seconds and the bytes allocated
+    """
+    values = [float(i) for i in range(count)]
+
+    gc.collect()
+    start = time.perf_counter()
+    instances = [factory(v, v, v) for v in values]
+    elapsed = time.perf_counter() - start
+    del instances
+
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(v, v, v) for v in values]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+
+    return elapsed, allocated
+
+
+def run(count: int) -> List[Tuple[str, float, int]]:
+    """
+    Run the benchmark for every model.
+
+    :param count: The number of instances per model
+    :return: The name, construction time and allocated bytes for each model
+    """
+    factories = [
+        ("dataclass (baseline)", PlainPoint3D),
+        ("Point3D", Point3D),
+        ("Vector3D", Vector3D),
+        ("Spherical", Spherical),
+        ("FrozenPoint3D", FrozenPoint3D),
+        ("FrozenVector3D", FrozenVector3D),
+        ("FrozenSpherical", FrozenSpherical),
+    ]
+
+    return [(name, *measure(factory, count)) for name, factory in factories]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    results = run(args.count)
+    _, base_time, base_bytes = results[0]
+
+    print(f"{args.count} instances per model, relative to the baseline")
+    print(f"{'model':<22}{'time (s)':>10}{'MB':>10}{'time':>8}{'memory':>8}")
+    for name, elapsed, allocated in results:
+        print(
+            f"{name:<22}{elapsed:>10.3f}{allocated / 2**20:>10.1f}"
+            f"{elapsed / base_time:>8.0%}{allocated / base_bytes:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
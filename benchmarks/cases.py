@@ -0,0 +1,395 @@
+"""
+Benchmark cases for the astrocompute library modules.
+
+Inputs are generated from a fixed seed so every run times the same work.
+"""
+
+import io
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from typing import Any, Callable, List, Tuple
+
+from astrocompute.library import (
+    angle,
+    coordinate_transform,
+    kepler,
+    mathmatics,
+    matrix2d,
+    matrix3d,
+    polar,
+    separation,
+    spherical,
+    vector,
+)
+from astrocompute.library.angle_parser import parse_angles
+from astrocompute.library.apparent import (
+    apparent_positions_batch,
+    orbit_target,
+)
+from astrocompute.library.catalog import read_catalog, write_catalog
+from astrocompute.library.chebyshev import ChebyshevEphemeris
+from astrocompute.library.kdtree import KDTree
+from astrocompute.library.line import Line2D
+from astrocompute.library.pairwise import distances_within
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray3D
+from astrocompute.library.polar_array import PolarArray
+from astrocompute.library.sky_index import SkyIndex
+from astrocompute.library.spherical_array import SphericalArray
+from astrocompute.models import Point2D as Point2DModel, Polar, Spherical
+from benchmarks.registry import benchmark
+
+SEED = 20240307
+
+_IMPORT = "import astrocompute, astrocompute.backend"
+
+
+def _floats(size: int, low: float = -100.0, high: float = 100.0) -> List[float]:
+    rng = random.Random(SEED + size)
+    return [rng.uniform(low, high) for _ in range(size)]
+
+
+def _vectors(size: int) -> List[Tuple[float, float, float]]:
+    values = _floats(3 * size)
+    return list(zip(values[0::3], values[1::3], values[2::3]))
+
+
+def _matrices3d(size: int) -> List[matrix3d.Mat3D]:
+    values = _floats(9 * size)
+    return [
+        matrix3d.Mat3D(
+            [values[i : i + 3], values[i + 3 : i + 6], values[i + 6 : i + 9]]
+        )
+        for i in range(0, 9 * size, 9)
+    ]
+
+
+@benchmark("point.Point2D.distance")
+def point2d_distance(size: int) -> Callable[[], Any]:
+    values = _floats(4 * size)
+    pairs = [
+        (
+            Point2D(values[i], values[i + 1]),
+            Point2D(values[i + 2], values[i + 3]),
+        )
+        for i in range(0, 4 * size, 4)
+    ]
+    return lambda: [Point2D.distance(p, q) for p, q in pairs]
+
+
+@benchmark("point.Point3D.distance")
+def point3d_distance(size: int) -> Callable[[], Any]:
+    vectors = _vectors(2 * size)
+    points = [Point3D(*v) for v in vectors]
+    return lambda: [
+        Point3D.distance(p, q) for p, q in zip(points[::2], points[1::2])
+    ]
+
+
+@benchmark("point.PointArray3D.distance")
+def point_array3d_distance(size: int) -> Callable[[], Any]:
+    p = PointArray3D(_floats(size), _floats(size, 0, 1), _floats(size, 1, 2))
+    q = PointArray3D(_floats(size, 2, 3), _floats(size, 3, 4), _floats(size))
+    return lambda: PointArray3D.distance(p, q)
+
+
+@benchmark("point.Point2D.parse")
+def point2d_parse(size: int) -> Callable[[], Any]:
+    values = _floats(2 * size)
+    lines = [repr(Point2D(x, y)) for x, y in zip(values[::2], values[1::2])]
+    return lambda: [Point2D.parse(line) for line in lines]
+
+
+@benchmark("point.Point2D.y_intercept")
+def point2d_y_intercept(size: int) -> Callable[[], Any]:
+    p, q = Point2D(-1.0, -2.0), Point2D(3.0, 1.0)
+    return lambda: [Point2D.y_intercept(p, q) for _ in range(size)]
+
+
+@benchmark("line.Line2D.side_batch")
+def line2d_side_batch(size: int) -> Callable[[], Any]:
+    line = Line2D.from_points(Point2D(-1.0, -2.0), Point2D(3.0, 1.0))
+    xs, ys = _floats(size), _floats(size, -50, 50)
+    return lambda: line.side_batch(xs, ys)
+
+
+@benchmark("kdtree.KDTree.query_batch")
+def kdtree_query_batch(size: int) -> Callable[[], Any]:
+    tree = KDTree(_floats(size), _floats(size, 0, 1), _floats(size, 1, 2))
+    queries = _floats(100), _floats(100, 0, 1), _floats(100, 1, 2)
+    return lambda: tree.query_batch(*queries, k=4)
+
+
+@benchmark("pairwise.distances_within")
+def pairwise_distances_within(size: int) -> Callable[[], Any]:
+    points = PointArray3D(_floats(size), _floats(size), _floats(size))
+    return lambda: distances_within(points, threshold=10.0)
+
+
+@benchmark("catalog.read_catalog")
+def catalog_read_catalog(size: int) -> Callable[[], Any]:
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "points.bin")
+    write_catalog(
+        path, PointArray3D(_floats(size), _floats(size), _floats(size))
+    )
+    # The lambda keeps the directory alive until the case is dropped.
+    return lambda: (directory, read_catalog(path))
+
+
+@benchmark("vector.dot_product")
+def vector_dot_product(size: int) -> Callable[[], Any]:
+    us, vs = _vectors(size), _vectors(size)[::-1]
+    return lambda: [vector.dot_product(u, v) for u, v in zip(us, vs)]
+
+
+@benchmark("vector.dot_product_batch")
+def vector_dot_product_batch(size: int) -> Callable[[], Any]:
+    us, vs = _vectors(size), _vectors(size)[::-1]
+    return lambda: vector.dot_product_batch(us, vs)
+
+
+@benchmark("vector.normalize")
+def vector_normalize(size: int) -> Callable[[], Any]:
+    vectors = _vectors(size)
+    return lambda: [vector.normalize(v) for v in vectors]
+
+
+@benchmark("vector.normalize_batch")
+def vector_normalize_batch(size: int) -> Callable[[], Any]:
+    vectors = _vectors(size)
+    return lambda: vector.normalize_batch(vectors)
+
+
+@benchmark("vector.triple_product")
+def vector_triple_product(size: int) -> Callable[[], Any]:
+    us, vs, ws = _vectors(size), _vectors(size)[::-1], _vectors(size + 1)[1:]
+    return lambda: [
+        vector.triple_product(u, v, w) for u, v, w in zip(us, vs, ws)
+    ]
+
+
+@benchmark("vector.triple_product_batch")
+def vector_triple_product_batch(size: int) -> Callable[[], Any]:
+    us, vs, ws = _vectors(size), _vectors(size)[::-1], _vectors(size + 1)[1:]
+    return lambda: vector.triple_product_batch(us, vs, ws)
+
+
+@benchmark("polar.add")
+def polar_add(size: int) -> Callable[[], Any]:
+    rs, thetas = _floats(size, 0, 10), _floats(size, -math.pi, math.pi)
+    operands = list(zip(rs, thetas, rs[::-1], thetas[::-1]))
+    return lambda: [polar.add(*operand) for operand in operands]
+
+
+@benchmark("polar_array.PolarArray.chain")
+def polar_array_chain(size: int) -> Callable[[], Any]:
+    rs, thetas = _floats(size, 0, 10), _floats(size, -math.pi, math.pi)
+    offset = Polar(1.0, 0.5)
+
+    def chain() -> Any:
+        p = PolarArray(rs, thetas)
+        p = PolarArray.add(PolarArray.rotate(p, 0.25), offset)
+        return PolarArray.scale(PolarArray.subtract(p, offset), 2.0).r
+
+    return chain
+
+
+@benchmark("polar.chain")
+def polar_chain(size: int) -> Callable[[], Any]:
+    rs, thetas = _floats(size, 0, 10), _floats(size, -math.pi, math.pi)
+
+    def chain() -> Any:
+        result = []
+        for r, theta in zip(rs, thetas):
+            r, theta = polar.add(*polar.rotate(r, theta, 0.25), 1.0, 0.5)
+            r, theta = polar.subtract(r, theta, 1.0, 0.5)
+            result.append(polar.multiply(r, theta, 2.0))
+        return result
+
+    return chain
+
+
+@benchmark("spherical.to_cartesian")
+def spherical_to_cartesian(size: int) -> Callable[[], Any]:
+    rs, thetas = _floats(size, 0, 10), _floats(size, 0, math.pi)
+    phis = _floats(size, -math.pi, math.pi)
+    positions = [Spherical(*s) for s in zip(rs, thetas, phis)]
+    return lambda: [spherical.to_cartesian(s) for s in positions]
+
+
+@benchmark("spherical_array.SphericalArray.rotate")
+def spherical_array_rotate(size: int) -> Callable[[], Any]:
+    rs, thetas = _floats(size, 0, 10), _floats(size, 0, math.pi)
+    positions = SphericalArray(rs, thetas, _floats(size, -math.pi, math.pi))
+    rotation = matrix3d.rotation_z(0.5)
+    return lambda: SphericalArray.rotate(positions, rotation)
+
+
+@benchmark("separation.separation_one_to_many")
+def separation_one_to_many(size: int) -> Callable[[], Any]:
+    thetas, phis = _floats(size, 0, math.pi), _floats(size, -math.pi, math.pi)
+    p = Spherical(1.0, 0.5, 0.25)
+    return lambda: separation.separation_one_to_many(p, thetas, phis)
+
+
+@benchmark("sky_index.SkyIndex.query_cone")
+def sky_index_query_cone(size: int) -> Callable[[], Any]:
+    thetas = [math.acos(z) for z in _floats(size, -1, 1)]
+    index = SkyIndex(thetas, _floats(size, -math.pi, math.pi))
+    return lambda: index.query_cone(1.0, 0.5, 0.05)
+
+
+@benchmark("matrix2d.multiply")
+def matrix2d_multiply(size: int) -> Callable[[], Any]:
+    values = _floats(4 * size)
+    matrices = [
+        matrix2d.Mat2D([values[i : i + 2], values[i + 2 : i + 4]])
+        for i in range(0, 4 * size, 4)
+    ]
+    return lambda: [
+        matrix2d.multiply(a, b) for a, b in zip(matrices, matrices[1:])
+    ]
+
+
+@benchmark("matrix3d.multiply")
+def matrix3d_multiply(size: int) -> Callable[[], Any]:
+    matrices = _matrices3d(size)
+    return lambda: [
+        matrix3d.multiply(a, b) for a, b in zip(matrices, matrices[1:])
+    ]
+
+
+@benchmark("matrix3d.apply_batch")
+def matrix3d_apply_batch(size: int) -> Callable[[], Any]:
+    rotation = matrix3d.rotation_z(0.5)
+    vectors = _vectors(size)
+    return lambda: matrix3d.apply_batch(rotation, vectors)
+
+
+@benchmark("mathmatics.dms")
+def mathmatics_dms(size: int) -> Callable[[], Any]:
+    degrees = _floats(size, -90, 90)
+    return lambda: [mathmatics.dms(dd) for dd in degrees]
+
+
+@benchmark("mathmatics.ddd")
+def mathmatics_ddd(size: int) -> Callable[[], Any]:
+    parts = [mathmatics.dms(dd) for dd in _floats(size, -90, 90)]
+    return lambda: [mathmatics.ddd(d, m, s) for d, m, s in parts]
+
+
+@benchmark("mathmatics.dms_batch")
+def mathmatics_dms_batch(size: int) -> Callable[[], Any]:
+    degrees = _floats(size, -90, 90)
+    return lambda: mathmatics.dms_batch(degrees)
+
+
+@benchmark("mathmatics.ddd_batch")
+def mathmatics_ddd_batch(size: int) -> Callable[[], Any]:
+    parts = mathmatics.dms_batch(_floats(size, -90, 90))
+    return lambda: mathmatics.ddd_batch(*parts)
+
+
+@benchmark("angle.AngleSerializer.serialize")
+def angle_serialize(size: int) -> Callable[[], Any]:
+    serializer = angle.AngleSerializer()
+    angles = [
+        angle.Angle(alpha, angle.AngleFormat.DMMSSs)
+        for alpha in _floats(size, -90, 90)
+    ]
+    return lambda: [serializer.serialize(a) for a in angles]
+
+
+@benchmark("angle.AngleSerializer.write")
+def angle_write(size: int) -> Callable[[], Any]:
+    serializer = angle.AngleSerializer(width=16)
+    alphas = _floats(size, -90, 90)
+    return lambda: serializer.write(
+        alphas, angle.AngleFormat.DMMSSs, io.StringIO()
+    )
+
+
+@benchmark("angle_parser.parse_angles")
+def angle_parser_parse_angles(size: int) -> Callable[[], Any]:
+    serializer = angle.AngleSerializer(precision=3, width=16)
+    texts = "".join(
+        serializer.iter_records(
+            _floats(size, -90, 90), angle.AngleFormat.DMMSSs
+        )
+    ).splitlines()
+    return lambda: parse_angles(texts, angle.AngleFormat.DMMSSs)
+
+
+@benchmark("coordinate_transform.cartesian_to_polar")
+def coordinate_transform_cartesian_to_polar(size: int) -> Callable[[], Any]:
+    points = [
+        Point2DModel(x, y) for x, y in zip(_floats(size), _floats(size, 0, 1))
+    ]
+    return lambda: [coordinate_transform.cartesian_to_polar(p) for p in points]
+
+
+@benchmark("coordinate_transform.cartesian_to_polar_batch")
+def coordinate_transform_cartesian_to_polar_batch(
+    size: int,
+) -> Callable[[], Any]:
+    xs, ys = _floats(size), _floats(size, 0, 1)
+    return lambda: coordinate_transform.cartesian_to_polar_batch(xs, ys)
+
+
+@benchmark("coordinate_transform.spherical_to_cartesian_batch")
+def coordinate_transform_spherical_to_cartesian_batch(
+    size: int,
+) -> Callable[[], Any]:
+    rs, thetas = _floats(size, 0, 10), _floats(size, 0, math.pi)
+    phis = _floats(size, -math.pi, math.pi)
+    return lambda: coordinate_transform.spherical_to_cartesian_batch(
+        rs, thetas, phis
+    )
+
+
+@benchmark("kepler.propagate_batch")
+def kepler_propagate_batch(size: int) -> Callable[[], Any]:
+    # Mostly elliptic orbits with some near-parabolic and hyperbolic ones,
+    # all propagated to one epoch, as for a daily ephemeris run.
+    rng = random.Random(0)
+    es = [rng.choice((0.05, 0.2, 0.6, 0.99, 1.3)) for _ in range(size)]
+    angles = [_floats(size, 0, 2 * math.pi) for _ in range(3)]
+    elements = (_floats(size, 0.5, 5), es, *angles, _floats(size, -1e4, 1e4))
+    return lambda: kepler.propagate_batch(*elements, 0.0)
+
+
+@benchmark("chebyshev.ChebyshevEphemeris.position_batch")
+def chebyshev_position_batch(size: int) -> Callable[[], Any]:
+    elements = kepler.OrbitalElements(0.31, 0.2056, 0.12, 0.84, 0.5, 0.0)
+    ephemeris = ChebyshevEphemeris.fit(
+        lambda t: kepler.propagate(elements, t)[0], 0.0, 3650.0, 8.0
+    )
+    ts = _floats(size, 0.0, 3650.0)
+    return lambda: ephemeris.position_batch(ts)
+
+
+@benchmark("apparent.apparent_positions_batch")
+def apparent_positions(size: int) -> Callable[[], Any]:
+    # One observation epoch for a list of tracked objects, seen from Earth
+    rng = random.Random(0)
+    es = [rng.choice((0.05, 0.2, 0.6, 0.99, 1.3)) for _ in range(size)]
+    angles = [_floats(size, 0, 2 * math.pi) for _ in range(3)]
+    target = orbit_target(
+        _floats(size, 0.5, 5), es, *angles, _floats(size, -1e4, 1e4)
+    )
+    ts = [0.0] * size
+    earth, velocity = (0.98, 0.17, 0.0), (-0.003, 0.0168, 0.0)
+    return lambda: apparent_positions_batch(target, ts, earth, velocity)
+
+
+@benchmark("astrocompute.import", sizes=(1,))
+def astrocompute_import(size: int) -> Callable[[], Any]:
+    # A fresh interpreter per call, as for a short-lived worker process; the
+    # size is ignored.  Compare with "python -c pass" to isolate the import.
+    command = [sys.executable, "-c", _IMPORT]
+    return lambda: subprocess.run(command, check=True)
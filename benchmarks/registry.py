@@ -0,0 +1,46 @@
+"""
+Registry of the benchmark cases.
+
+A case is a setup function that receives an input size, prepares its inputs
+and returns the callable to time.  Setup work is therefore never included in
+the measurements.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+DEFAULT_SIZES: Tuple[int, ...] = (100, 10_000, 100_000)
+
+Setup = Callable[[int], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Setup
+    sizes: Tuple[int, ...]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, sizes: Sequence[int] = DEFAULT_SIZES
+) -> Callable[[Setup], Setup]:
+    """
+    Register a benchmark case.
+
+    :param name: The unique name of the case, prefixed with its module
+    :param sizes: The input sizes to run the case with
+    :return: A decorator registering the setup function
+    :raises: ValueError if the name is already registered
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark: {name}")
+
+        BENCHMARKS[name] = Benchmark(name, setup, tuple(sizes))
+        return setup
+
+    return decorator
@@ -0,0 +1,180 @@
+"""
+Run the benchmark suite, store the results and flag regressions.
+
+Every case is timed at each of its input sizes.  The reported time is the
+best of several repeats, which is the least noisy estimate of the cost of a
+call.  Results are written as JSON.  When a baseline file is given, or
+benchmarks/baseline.json exists, any case that is slower than the baseline by
+more than the threshold is reported as a regression and the runner exits
+with status 1.
+
+Usage:
+    python -m benchmarks.runner [--output results.json]
+                                [--baseline baseline.json]
+                                [--save-baseline] [--threshold 0.1]
+                                [--filter point.] [--sizes 100 1000]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Dict, List, Optional, Sequence
+
+import benchmarks.cases  # noqa: F401  pylint: disable=unused-import
+from benchmarks.registry import BENCHMARKS
+
+DEFAULT_OUTPUT = "benchmarks/results.json"
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+
+
+def _key(result: Dict[str, Any]) -> str:
+    return f"{result['name']}[{result['size']}]"
+
+
+def time_case(setup: Any, size: int, repeat: int) -> Dict[str, float]:
+    """
+    Time one benchmark case at one input size.
+
+    :param setup: The setup function of the case
+    :param size: The input size
+    :param repeat: The number of timing repeats
+    :return: The best and mean time per call in seconds
+    """
+    timer = timeit.Timer(setup(size))
+    number, _ = timer.autorange()
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "best": min(timings),
+        "mean": sum(timings) / len(timings),
+        "number": number,
+    }
+
+
+def run(
+    name_filter: str = "",
+    sizes: Optional[Sequence[int]] = None,
+    repeat: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Run the registered benchmark cases.
+
+    :param name_filter: Only run cases whose name contains this text
+    :param sizes: Override the input sizes of every case
+    :param repeat: The number of timing repeats
+    :return: One result per case and size
+    """
+    results = []
+    for name, case in sorted(BENCHMARKS.items()):
+        if name_filter not in name:
+            continue
+
+        for size in sizes or case.sizes:
+            timing = time_case(case.setup, size, repeat)
+            results.append({"name": name, "size": size, **timing})
+            print(
+                f"{name:<55}{size:>9}"
+                f"{timing['best'] * 1e3:>12.3f} ms"
+                f"{timing['best'] / size * 1e9:>10.1f} ns/item"
+            )
+
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    :param results: The current results
+    :param baseline: The baseline results
+    :param threshold: The allowed relative slowdown, e.g. 0.1 for 10%
+    :return: A description of every regression
+    """
+    reference = {_key(result): result["best"] for result in baseline}
+    regressions = []
+
+    for result in results:
+        expected = reference.get(_key(result))
+        if expected is None:
+            continue
+
+        ratio = result["best"] / expected
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{_key(result)}: {ratio:.2f}x slower than the baseline"
+            )
+
+    return regressions
+
+
+def _metadata() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def _write(path: str, results: List[Dict[str, Any]]) -> None:
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(
+            {"metadata": _metadata(), "results": results}, stream, indent=2
+        )
+        stream.write("\n")
+
+
+def _read(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as stream:
+        return json.load(stream)["results"]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--sizes", type=int, nargs="*", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.sizes, args.repeat)
+    _write(args.output, results)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        _write(args.baseline or DEFAULT_BASELINE, results)
+        print(f"Baseline written to {args.baseline or DEFAULT_BASELINE}")
+        return 0
+
+    baseline = args.baseline
+    if baseline is None and os.path.exists(DEFAULT_BASELINE):
+        baseline = DEFAULT_BASELINE
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, _read(baseline), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if regressions:
+        return 1
+
+    print(f"No regressions against {baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
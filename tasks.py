@@ -61,6 +61,34 @@ def lint(c: Context):
     c.run("flake8 astrocompute")
 
 
+@task(
+    aliases=["bm"],
+    help={
+        "baseline": "Baseline JSON file to compare against.",
+        "save_baseline": "Store the results as the new baseline.",
+        "threshold": "Allowed relative slowdown before flagging a regression.",
+        "filter": "Only run benchmarks whose name contains this text.",
+    },
+)
+def benchmark(
+    c: Context,
+    baseline: Optional[str] = None,
+    save_baseline: bool = False,
+    threshold: float = 0.1,
+    filter: str = "",  # pylint: disable=redefined-builtin
+):
+    """Run the benchmark suite and check for regressions."""
+    print("Running benchmarks...")
+    command = f"python -m benchmarks.runner --threshold {threshold}"
+    if baseline:
+        command += f" --baseline {baseline}"
+    if save_baseline:
+        command += " --save-baseline"
+    if filter:
+        command += f" --filter {filter}"
+    c.run(command)
+
+
 @task(aliases=["cl"])
 def commitlint(c: Context):
     """Check the most recent commit message against commitlint."""
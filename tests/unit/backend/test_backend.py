@@ -0,0 +1,206 @@
+import math
+import random
+import subprocess
+import sys
+
+import pytest
+
+from astrocompute import backend
+from astrocompute.backend import pure_python
+from astrocompute.library.matrix3d import Mat3D
+
+BACKENDS = [
+    pytest.param(
+        name,
+        marks=(
+            []
+            if name in backend.available_backends()
+            else [pytest.mark.skip(reason=f"{name} is not installed")]
+        ),
+    )
+    for name in ("python", "numpy")
+]
+
+
+def random_column(size, seed, low=-10.0, high=10.0):
+    rng = random.Random(seed)
+    return [rng.uniform(low, high) for _ in range(size)]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    active = backend._active
+    yield
+    backend._active = active
+
+
+def assert_columns_close(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.typecode == e.typecode
+        assert list(a) == pytest.approx(list(e), abs=1e-12)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize(
+    "function, columns",
+    [
+        ("cartesian_to_polar_batch", 2),
+        ("polar_to_cartesian_batch", 2),
+        ("cartesian_to_spherical_batch", 3),
+        ("spherical_to_cartesian_batch", 3),
+        ("separation_paired", 4),
+    ],
+)
+def test_kernels_match_library(name, function, columns):
+    # Arrange
+    inputs = [random_column(50, seed) for seed in range(columns)]
+    expected = getattr(pure_python, function)(*inputs)
+
+    # Act
+    backend.set_backend(name)
+    actual = getattr(backend, function)(*inputs)
+
+    # Assert
+    if not isinstance(expected, tuple):
+        actual, expected = (actual,), (expected,)
+    assert_columns_close(actual, expected)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_apply_columns(name):
+    # Arrange
+    matrix = Mat3D([[0, -1, 0], [1, 0, 0], [0, 0, 2]])
+    inputs = [random_column(20, seed) for seed in range(3)]
+
+    # Act
+    actual = backend.set_backend(name).apply_columns(matrix, *inputs)
+
+    # Assert
+    assert_columns_close(actual, pure_python.apply_columns(matrix, *inputs))
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_sexagesimal(name):
+    # Arrange
+    dds = [-0.5, -0.0001, 12.999999999, -12.5, 0.0, 359.25]
+    dds += random_column(50, 1, -90, 90)
+    # Seconds that step by a millisecond through a minute, so that many of
+    # them are halfway between two rounded values and some carry into the
+    # minutes and degrees.
+    dds += [d + 59 / 60 + s / 3.6e6 for d in (0, -7) for s in range(60000)]
+    selected = backend.set_backend(name)
+
+    # Act
+    rounded = [selected.dms_batch(dds, precision) for precision in range(4)]
+    actual = selected.ddd_batch(*rounded[2])
+
+    # Assert
+    assert rounded == [pure_python.dms_batch(dds, p) for p in range(4)]
+    assert_columns_close(
+        (actual,), (pure_python.ddd_batch(*pure_python.dms_batch(dds, 2)),)
+    )
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_propagate_batch(name):
+    # Arrange
+    rng = random.Random(7)
+    es = [0.0, 0.5, 0.97, 1 - 1e-9, 1.0, 1 + 1e-9, 1.5, 6.0] * 5
+    columns = [
+        random_column(len(es), 1, 0.1, 5.0),
+        es,
+        *(random_column(len(es), seed, -7.0, 7.0) for seed in (2, 3, 4)),
+        random_column(len(es), 5, -1e4, 1e4),
+    ]
+    times = [rng.uniform(-1e4, 1e4) for _ in es]
+
+    # Act
+    selected = backend.set_backend(name)
+    paired = selected.propagate_batch(*columns, times)
+    single = selected.propagate_batch(1.0, 0.3, 0.1, 0.2, 0.3, 0.0, 25.0)
+
+    # Assert
+    assert_columns_close(paired, pure_python.propagate_batch(*columns, times))
+    assert_columns_close(
+        single, pure_python.propagate_batch(1.0, 0.3, 0.1, 0.2, 0.3, 0.0, 25.0)
+    )
+    with pytest.raises(ValueError):
+        selected.propagate_batch(*columns[:-1], [1.0], times)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_cartesian_to_spherical_rejects_origin(name):
+    # Act & Assert
+    with pytest.raises(ZeroDivisionError):
+        backend.set_backend(name).cartesian_to_spherical_batch(
+            [1.0, 0.0], [0.0, 0.0], [0.0, 0.0]
+        )
+
+
+def test_get_backend_reads_environment(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(backend.BACKEND_ENV, "python")
+    backend._active = None
+
+    # Act
+    actual = backend.get_backend()
+
+    # Assert
+    assert actual.NAME == "python"
+    assert backend.ddd_batch is pure_python.ddd_batch
+
+
+def test_auto_prefers_numpy_when_installed():
+    # Act
+    actual = backend.set_backend("auto")
+
+    # Assert
+    expected = "numpy" if "numpy" in backend.available_backends() else "python"
+    assert actual.NAME == expected
+
+
+def test_set_backend_rejects_unknown_name():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        backend.set_backend("fortran")
+
+
+def test_unknown_attribute():
+    # Act & Assert
+    with pytest.raises(AttributeError):
+        backend.not_a_kernel
+
+
+def test_imports_are_lazy():
+    # Arrange
+    code = (
+        "import sys, astrocompute, astrocompute.backend\n"
+        "loaded = [m for m in sys.modules if m.startswith('astrocompute.')]\n"
+        "print(sorted(loaded), 'numpy' in sys.modules)\n"
+        "print(astrocompute.library.separation.__name__)\n"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.splitlines() == [
+        "['astrocompute.backend', 'astrocompute.constants'] False",
+        "astrocompute.library.separation",
+    ]
+
+
+def test_library_rejects_unknown_module():
+    # Arrange
+    import astrocompute.library
+
+    # Act & Assert
+    with pytest.raises(AttributeError):
+        astrocompute.library.no_such_module
+    assert math.isclose(astrocompute.library.separation.TWO_PI, 2 * math.pi)
@@ -0,0 +1,68 @@
+import io
+import random
+
+import pytest
+
+from astrocompute.library.angle import Angle, AngleFormat, AngleSerializer
+
+
+@pytest.fixture
+def alphas():
+    rng = random.Random(7)
+    return [rng.uniform(-90, 90) for _ in range(200)] + [0.0, -0.5, 45.0]
+
+
+@pytest.mark.parametrize("angle_format", list(AngleFormat))
+def test_records_match_serialize(alphas, angle_format: AngleFormat):
+    # Arrange
+    serializer = AngleSerializer(precision=3, width=16)
+
+    # Act
+    text = "".join(serializer.iter_records(alphas, angle_format, 64))
+
+    # Assert
+    expected = [
+        serializer.serialize(Angle(alpha, angle_format)).rjust(16)
+        for alpha in alphas
+    ]
+    assert text.splitlines() == expected
+
+
+def test_write_fixed_width_records(alphas):
+    # Arrange
+    serializer = AngleSerializer(width=16)
+    stream = io.StringIO()
+
+    # Act
+    count = serializer.write(alphas, AngleFormat.DMMSSs, stream, chunk_size=50)
+
+    # Assert
+    assert count == len(alphas)
+    assert all(len(line) == 16 for line in stream.getvalue().splitlines())
+    assert stream.getvalue().endswith("\n")
+
+
+def test_write_empty_input():
+    # Arrange
+    stream = io.StringIO()
+
+    # Act
+    count = AngleSerializer().write([], AngleFormat.Dd, stream)
+
+    # Assert
+    assert count == 0
+    assert stream.getvalue() == ""
+
+
+def test_rejects_values_wider_than_width():
+    # Arrange
+    serializer = AngleSerializer(width=10)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Angle 1"):
+        list(serializer.iter_records([1.0, -123.456789], AngleFormat.DMMSSs))
+
+
+def test_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(AngleSerializer().iter_records([1.0], AngleFormat.Dd, 0))
@@ -0,0 +1,119 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library.angle import AngleFormat, AngleSerializer
+from astrocompute.library.angle_parser import (
+    iter_angle_chunks,
+    parse_angle,
+    parse_angles,
+    read_angle_chunks,
+)
+from astrocompute.library.mathmatics import ddd
+
+
+@pytest.fixture
+def alphas():
+    rng = random.Random(3)
+    return [rng.uniform(-90, 90) for _ in range(300)] + [0.0, -0.5, -1.5]
+
+
+@pytest.mark.parametrize(
+    "text, angle_format, expected",
+    [
+        ("12.5", AngleFormat.Dd, 12.5),
+        ("-12 30", AngleFormat.DMM, -12.5),
+        ("0 -30", AngleFormat.DMM, -0.5),
+        ("-0 30", AngleFormat.DMM, -0.5),
+        ("12 30.5", AngleFormat.DMMm, ddd(12, 30.5, 0)),
+        ("12:30:36", AngleFormat.DMMSS, ddd(12, 30, 36)),
+        ("-1 02 03.25", AngleFormat.DMMSSs, ddd(-1, 2, 3.25)),
+        ("0 0 -03.25", AngleFormat.DMMSSs, ddd(0, 0, -3.25)),
+    ],
+)
+def test_parse_angle(text: str, angle_format: AngleFormat, expected: float):
+    # Act
+    actual = parse_angle(text, angle_format)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "text, angle_format",
+    [
+        ("12 30", AngleFormat.DMMSSs),
+        ("12 75", AngleFormat.DMM),
+        ("12 30 61.0", AngleFormat.DMMSSs),
+        ("twelve", AngleFormat.Dd),
+    ],
+)
+def test_parse_angle_rejects_malformed_text(text, angle_format):
+    with pytest.raises(ValueError):
+        parse_angle(text, angle_format)
+
+
+@pytest.mark.parametrize(
+    "angle_format", [f for f in AngleFormat if f != AngleFormat.DMM]
+)
+def test_round_trips_serializer_output(alphas, angle_format: AngleFormat):
+    # Arrange
+    serializer = AngleSerializer(precision=6, width=20)
+    texts = "".join(serializer.iter_records(alphas, angle_format))
+
+    # Act
+    chunks = list(iter_angle_chunks(texts.splitlines(), angle_format, 100))
+
+    # Assert
+    tolerance = 1 / 3600 if angle_format == AngleFormat.DMMSS else 1e-6
+    assert [len(chunk.values) for chunk in chunks] == [100, 100, 100, 3]
+    assert not any(chunk.errors for chunk in chunks)
+    actual = [value for chunk in chunks for value in chunk.values]
+    assert actual == pytest.approx(alphas, abs=tolerance)
+
+
+def test_block_and_per_value_parsing_agree():
+    # Arrange
+    texts = ["-12 30 15.5", "0 -1 2.25", "3 04 05"]
+
+    # Act
+    fast = parse_angles(texts, AngleFormat.DMMSSs)
+    slow = parse_angles(texts + ["bad"], AngleFormat.DMMSSs)
+
+    # Assert
+    assert list(fast.values) == [
+        parse_angle(text, AngleFormat.DMMSSs) for text in texts
+    ]
+    assert list(slow.values)[:3] == list(fast.values)
+
+
+def test_reports_errors_per_row():
+    # Arrange
+    texts = ["10 20 30", "", "10 99 30", "-5 00 01.5"]
+
+    # Act
+    result = parse_angles(texts, AngleFormat.DMMSSs)
+
+    # Assert
+    assert len(result.values) == 4
+    assert math.isnan(result.values[1]) and math.isnan(result.values[2])
+    assert [error.line_number for error in result.errors] == [2, 3]
+    assert result.values[3] == ddd(-5, 0, 1.5)
+
+
+def test_read_angle_chunks(tmp_path):
+    # Arrange
+    path = tmp_path / "angles.txt"
+    path.write_text("1 30\n-2 15\n")
+
+    # Act
+    chunks = list(read_angle_chunks(path, AngleFormat.DMM))
+
+    # Assert
+    assert list(chunks[0].values) == [1.5, -2.25]
+
+
+def test_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(iter_angle_chunks(["1.0"], AngleFormat.Dd, 0))
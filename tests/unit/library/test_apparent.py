@@ -0,0 +1,209 @@
+import math
+
+import pytest
+
+from astrocompute.constants import C_LIGHT
+from astrocompute.library.apparent import (
+    aberration,
+    apparent_position,
+    apparent_positions_batch,
+    light_time,
+    orbit_target,
+)
+from astrocompute.library.kepler import OrbitalElements, propagate
+
+EARTH = (0.98, 0.17, 0.0)
+EARTH_VELOCITY = (-0.003, 0.0168, 0.0)
+
+
+def moving(t):
+    return 3.0 + 0.01 * t, -1.0, 0.5 - 0.02 * t
+
+
+def moving_light_time(t, observer):
+    # |p0 - o + v (t - tau)| = c tau is a quadratic in tau
+    p0, v = moving(0.0), (0.01, 0.0, -0.02)
+    d = [p + vi * t - o for p, vi, o in zip(p0, v, observer)]
+    a = C_LIGHT**2 - sum(vi * vi for vi in v)
+    b = 2 * sum(di * vi for di, vi in zip(d, v))
+    c = -sum(di * di for di in d)
+    return (-b + math.sqrt(b * b - 4 * a * c)) / (2 * a)
+
+
+def test_light_time_of_moving_target():
+    # Act
+    relative, tau = light_time(moving, EARTH, 10.0)
+
+    # Assert
+    expected = moving_light_time(10.0, EARTH)
+    assert tau == pytest.approx(expected, abs=1e-12)
+    assert relative == pytest.approx(
+        [p - o for p, o in zip(moving(10.0 - expected), EARTH)], abs=1e-12
+    )
+
+
+def test_light_time_of_fixed_target():
+    # Act
+    relative, tau = light_time(lambda t: (1.0, 2.0, 2.0), (1.0, 0.0, 0.0), 0.0)
+
+    # Assert
+    assert relative == (0.0, 2.0, 2.0)
+    assert tau == 2.0 * math.sqrt(2.0) / C_LIGHT
+
+
+def test_light_time_reports_no_convergence():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        light_time(moving, EARTH, 0.0, max_iterations=1)
+
+
+@pytest.mark.parametrize(
+    "position", [(1.0, 0.0, 0.0), (0.0, 2.0, 0.0), (1.0, -1.0, 0.5)]
+)
+def test_aberration(position):
+    # Arrange
+    beta = 1e-4
+    velocity = (0.0, 0.0, beta * C_LIGHT)
+
+    # Act
+    actual = aberration(position, velocity)
+
+    # Assert
+    distance = math.hypot(*position)
+    assert math.hypot(*actual) == pytest.approx(distance, rel=1e-15)
+    # The direction moves towards the velocity: sin of the polar angle
+    # from +z changes from s to s', with cos' = (cos + beta) / (1 + beta cos)
+    cosine = position[2] / distance
+    assert actual[2] / distance == pytest.approx(
+        (cosine + beta) / (1 + beta * cosine), rel=1e-15
+    )
+
+
+def test_aberration_of_earth_is_about_20_arcseconds():
+    # Arrange
+    position = (0.0, 0.0, 5.0)
+    speed = math.hypot(*EARTH_VELOCITY)
+
+    # Act
+    actual = aberration(position, EARTH_VELOCITY)
+
+    # Assert
+    # Perpendicular to the velocity, the shift is asin(v / c)
+    angle = math.atan2(math.hypot(actual[0], actual[1]), actual[2])
+    assert angle == pytest.approx(math.asin(speed / C_LIGHT), rel=1e-12)
+    assert 20.0 < math.degrees(angle) * 3600 < 21.0
+    assert aberration(position, (0.0, 0.0, 0.0)) == position
+
+
+def test_apparent_position():
+    # Act
+    actual = apparent_position(moving, EARTH, EARTH_VELOCITY, 10.0)
+
+    # Assert
+    relative, _ = light_time(moving, EARTH, 10.0)
+    assert actual == aberration(relative, EARTH_VELOCITY)
+
+
+def test_batch_matches_scalar():
+    # Arrange
+    offsets = [0.0, 1.0, -2.0, 0.5]
+    ts = [10.0, 20.0, -5.0, 0.0]
+    calls = []
+
+    def target(rows, times):
+        calls.append(list(rows))
+        positions = [
+            moving(t) if offsets[i] else (2.0, 2.0, 1.0)
+            for i, t in zip(rows, times)
+        ]
+        return tuple(
+            [p[axis] + offsets[i] for i, p in zip(rows, positions)]
+            for axis in range(3)
+        )
+
+    # Act
+    actual = apparent_positions_batch(target, ts, EARTH, EARTH_VELOCITY)
+
+    # Assert
+    for i, t in enumerate(ts):
+
+        def scalar(time, i=i):
+            return tuple(target([i], [time])[axis][0] for axis in range(3))
+
+        relative, tau = light_time(scalar, EARTH, t)
+        assert (actual.x[i], actual.y[i], actual.z[i]) == aberration(
+            relative, EARTH_VELOCITY
+        )
+        assert actual.light_times[i] == tau
+    # The fixed target converges after two evaluations, the moving ones
+    # need more, and only unconverged rows are evaluated again.
+    assert actual.iterations[0] == 2
+    assert min(actual.iterations[1:]) > 2
+    assert calls[0] == [0, 1, 2, 3]
+    assert calls[2] == [1, 2, 3]
+
+
+def test_batch_without_aberration_and_per_row_observers():
+    # Arrange
+    observers = ([0.0, 1.0], [0.0, 0.0], [0.0, 0.0])
+
+    def target(rows, times):
+        return (
+            [moving(t)[0] for t in times],
+            [-1.0] * len(rows),
+            [moving(t)[2] for t in times],
+        )
+
+    # Act
+    actual = apparent_positions_batch(target, [0.0, 0.0], observers)
+
+    # Assert
+    for i, observer in enumerate(zip(*observers)):
+        relative, tau = light_time(moving, observer, 0.0)
+        assert (actual.x[i], actual.y[i], actual.z[i]) == relative
+        assert actual.light_times[i] == tau
+
+
+def test_batch_rejects_bad_input():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        apparent_positions_batch(
+            lambda rows, ts: ([], [], []), [0.0, 1.0], ([0.0], 0.0, 0.0)
+        )
+    with pytest.raises(ValueError):
+        apparent_positions_batch(
+            lambda rows, ts: (
+                [t for t in ts],
+                [1.0] * len(ts),
+                [0.0] * len(ts),
+            ),
+            [0.0, 1.0],
+            EARTH,
+            max_iterations=1,
+        )
+
+
+def test_orbit_target():
+    # Arrange
+    elements = [
+        OrbitalElements(1.5, 0.1, 0.2, 0.3, 0.4, 0.0),
+        OrbitalElements(0.3, 0.95, 1.2, 2.3, 3.4, 50.0),
+        OrbitalElements(2.0, 1.0, 0.5, 0.6, 0.7, -30.0),
+    ]
+    target = orbit_target(*zip(*elements))
+    ts = [100.0, 100.0, 100.0]
+
+    # Act
+    actual = apparent_positions_batch(target, ts, EARTH, EARTH_VELOCITY)
+
+    # Assert
+    for i, el in enumerate(elements):
+        expected = apparent_position(
+            lambda t, el=el: propagate(el, t)[0], EARTH, EARTH_VELOCITY, 100.0
+        )
+        assert (actual.x[i], actual.y[i], actual.z[i]) == pytest.approx(
+            expected, abs=1e-13
+        )
+    assert list(target([1], [50.0])[0]) == pytest.approx(
+        [propagate(elements[1], 50.0)[0][0]], abs=1e-15
+    )
@@ -0,0 +1,237 @@
+import math
+
+import pytest
+
+from astrocompute.library.catalog import (
+    Catalog,
+    CatalogKind,
+    CatalogWriter,
+    read_catalog,
+    write_catalog,
+)
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+from astrocompute.library.polar_array import PolarArray
+from astrocompute.library.spherical_array import SphericalArray
+from astrocompute.models import Spherical, Vector3D
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "catalog.bin"
+
+
+def test_round_trip_point_array_3d(path):
+    # Arrange
+    points = PointArray3D(
+        [float(i) for i in range(10)],
+        [i / 3 for i in range(10)],
+        [-float(i) for i in range(10)],
+    )
+
+    # Act
+    rows = write_catalog(path, points, chunk_size=4)
+    actual = read_catalog(path)
+
+    # Assert
+    assert rows == 10
+    assert list(actual) == list(points)
+
+
+def test_round_trip_names(path):
+    # Arrange
+    points = PointArray2D([1, 2, 3], [4, 5, 6], names=["a", None, "α"])
+
+    # Act
+    write_catalog(path, points, chunk_size=2)
+
+    # Assert
+    with Catalog(path) as catalog:
+        assert catalog.has_names
+        assert catalog.names() == ["a", None, "α"]
+        assert catalog[2] == Point2D(3.0, 6.0, "α")
+        assert catalog.name(-2) is None
+    assert read_catalog(path).names == ["a", None, "α"]
+
+
+def test_round_trip_polar_and_spherical(path, tmp_path):
+    # Arrange
+    polars = PolarArray([1.0, 2.0], [0.5, -0.5])
+    sphericals = SphericalArray([1.0, 2.0], [0.1, 0.2], [0.3, 0.4])
+    other = tmp_path / "other.bin"
+
+    # Act
+    write_catalog(path, polars)
+    write_catalog(other, sphericals)
+
+    # Assert
+    assert list(read_catalog(path)) == list(polars)
+    assert list(read_catalog(other)) == list(sphericals)
+
+
+def test_random_access(path):
+    # Arrange
+    size = 1000
+    points = PointArray3D(
+        range(size), [2.0 * i for i in range(size)], [0.5] * size
+    )
+    write_catalog(path, points, chunk_size=64)
+
+    # Act & Assert
+    with Catalog(path) as catalog:
+        assert len(catalog) == size
+        assert catalog[0] == Point3D(0.0, 0.0, 0.5)
+        assert catalog[777] == Point3D(777.0, 1554.0, 0.5)
+        assert catalog[-1] == Point3D(999.0, 1998.0, 0.5)
+        with pytest.raises(IndexError):
+            catalog[size]
+
+
+def test_iter_chunks_returns_views(path):
+    # Arrange
+    write_catalog(path, PointArray2D(range(5), range(5, 10)), chunk_size=3)
+
+    # Act
+    with Catalog(path) as catalog:
+        chunks = [
+            (start, [view.tolist() for view in views])
+            for start, views in catalog.iter_chunks()
+        ]
+
+    # Assert
+    assert chunks == [
+        (0, [[0.0, 1.0, 2.0], [5.0, 6.0, 7.0]]),
+        (3, [[3.0, 4.0], [8.0, 9.0]]),
+    ]
+
+
+def test_append_in_chunks(path):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.VECTOR3D) as writer:
+        writer.write_chunk([1.0], [2.0], [3.0])
+
+    # Act
+    with CatalogWriter(path, CatalogKind.VECTOR3D, append=True) as writer:
+        writer.write_chunk([4.0, 7.0], [5.0, 8.0], [6.0, 9.0])
+
+    # Assert
+    with Catalog(path) as catalog:
+        assert list(catalog) == [
+            Vector3D(1.0, 2.0, 3.0),
+            Vector3D(4.0, 5.0, 6.0),
+            Vector3D(7.0, 8.0, 9.0),
+        ]
+        assert list(catalog.column("z")) == [3.0, 6.0, 9.0]
+
+
+def test_append_drops_incomplete_chunk(path):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.SPHERICAL) as writer:
+        writer.write_chunk([1.0], [2.0], [3.0])
+    with open(path, "ab") as stream:
+        stream.write(b"\x05\x00\x00")
+
+    # Act
+    with CatalogWriter(path, CatalogKind.SPHERICAL, append=True) as writer:
+        writer.write_chunk([4.0], [5.0], [6.0])
+
+    # Assert
+    with Catalog(path) as catalog:
+        assert list(catalog) == [
+            Spherical(1.0, 2.0, 3.0),
+            Spherical(4.0, 5.0, 6.0),
+        ]
+
+
+@pytest.mark.parametrize("names", [False, True])
+@pytest.mark.parametrize("cut", [8, 16, 24])
+def test_truncated_file_keeps_complete_chunks(path, names, cut):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.POINT3D, names=names) as writer:
+        writer.write_chunk([1.0], [2.0], [3.0])
+        writer.write_chunk([4.0], [5.0], [6.0])
+    size = path.stat().st_size
+    with open(path, "r+b") as stream:
+        stream.truncate(size - cut)
+
+    # Act & Assert
+    with Catalog(path) as catalog:
+        assert len(catalog) == 1
+        assert list(catalog.column("z")) == [3.0]
+        assert catalog[0] == Point3D(1.0, 2.0, 3.0)
+        with pytest.raises(IndexError):
+            catalog[1]
+
+
+def test_append_to_truncated_file_does_not_extend_it(path):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.POINT3D) as writer:
+        writer.write_chunk([1.0, 4.0], [2.0, 5.0], [3.0, 6.0])
+    with open(path, "r+b") as stream:
+        stream.truncate(path.stat().st_size - 16)
+
+    # Act
+    with CatalogWriter(path, CatalogKind.POINT3D, append=True) as writer:
+        assert path.stat().st_size == 32
+        writer.write_chunk([7.0], [8.0], [9.0])
+
+    # Assert
+    with Catalog(path) as catalog:
+        assert list(catalog) == [Point3D(7.0, 8.0, 9.0)]
+
+
+def test_append_rejects_different_layout(path):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.POLAR) as writer:
+        writer.write_chunk([1.0], [2.0])
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        CatalogWriter(path, CatalogKind.POLAR, dtype="f", append=True)
+
+
+def test_float32(path):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.POINT3D, dtype="f") as writer:
+        writer.write_chunk([0.1], [1.5], [-2.0])
+
+    # Act
+    with Catalog(path) as catalog:
+        column = catalog.column("x")
+        point = catalog[0]
+
+    # Assert
+    assert column.typecode == "d"
+    assert column[0] == pytest.approx(0.1, rel=1e-7)
+    assert point.y == 1.5 and point.z == -2.0
+    assert path.stat().st_size == 32 + 8 + 3 * 8
+
+
+@pytest.mark.parametrize(
+    "columns, names",
+    [(([1.0], [2.0]), None), (([1.0], [2.0], [3.0]), ["a"])],
+)
+def test_write_chunk_rejects_bad_input(path, columns, names):
+    # Act & Assert
+    with CatalogWriter(path, CatalogKind.POINT3D) as writer:
+        with pytest.raises(ValueError):
+            writer.write_chunk(*columns, names=names)
+
+
+def test_rejects_other_files(path):
+    # Arrange
+    path.write_bytes(b"Point3D(x=1.0, y=2.0, z=3.0)\n")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        Catalog(path)
+
+
+def test_vector_catalog_has_no_container(path):
+    # Arrange
+    with CatalogWriter(path, CatalogKind.VECTOR3D) as writer:
+        writer.write_chunk([math.pi], [0.0], [0.0])
+
+    # Act & Assert
+    with Catalog(path) as catalog, pytest.raises(ValueError):
+        catalog.to_array()
@@ -0,0 +1,182 @@
+import math
+
+import pytest
+
+from astrocompute.library.chebyshev import ChebyshevEphemeris, clenshaw
+from astrocompute.library.kepler import OrbitalElements, propagate
+
+
+def circle(t):
+    return math.cos(0.3 * t), math.sin(0.3 * t), 0.01 * t
+
+
+def circle_velocity(t):
+    return -0.3 * math.sin(0.3 * t), 0.3 * math.cos(0.3 * t), 0.01
+
+
+@pytest.fixture
+def ephemeris():
+    return ChebyshevEphemeris.fit(circle, -10.0, 30.0, 5.0, degree=14)
+
+
+@pytest.mark.parametrize("x", [-1.0, -0.4, 0.0, 0.7, 1.0])
+def test_clenshaw(x):
+    # Arrange
+    coefficients = [0.5, -1.0, 2.0, 0.25]
+    chebyshev = [1.0, x, 2 * x * x - 1, 4 * x**3 - 3 * x]
+    derivatives = [0.0, 1.0, 4 * x, 12 * x * x - 3]
+
+    # Act
+    value, derivative = clenshaw(coefficients, x)
+
+    # Assert
+    assert value == pytest.approx(
+        sum(map(float.__mul__, coefficients, chebyshev))
+    )
+    assert derivative == pytest.approx(
+        sum(map(float.__mul__, coefficients, derivatives))
+    )
+    assert clenshaw([9.0, *coefficients, 9.0], x, 1, 5) == (value, derivative)
+
+
+def test_fit_segments(ephemeris):
+    # Act & Assert
+    assert ephemeris.segments == 8
+    assert ephemeris.dimension == 3
+    assert (ephemeris.start, ephemeris.end) == (-10.0, 30.0)
+    assert len(ephemeris.coefficients) == 8 * 3 * 15
+
+
+def test_fit_rounds_up_to_whole_segments():
+    # Act
+    ephemeris = ChebyshevEphemeris.fit(math.exp, 0.0, 2.5, 1.0, degree=4)
+
+    # Assert
+    assert ephemeris.segments == 3
+    assert ephemeris.dimension == 1
+    assert ephemeris.position(2.9)[0] == pytest.approx(math.exp(2.9), rel=1e-4)
+
+
+@pytest.mark.parametrize(
+    "end, segments",
+    [(8.0, 1), (8.000000004, 1), (16.0 - 1e-12, 2), (16.000001, 3)],
+)
+def test_fit_covers_the_end(end, segments):
+    # Act
+    ephemeris = ChebyshevEphemeris.fit(math.sin, 0.0, end, 8.0, degree=16)
+
+    # Assert
+    assert ephemeris.segments == segments
+    assert ephemeris.position(end)[0] == pytest.approx(math.sin(end), abs=1e-9)
+    with pytest.raises(ValueError):
+        ephemeris.position(ephemeris.end + 1e-6)
+
+
+@pytest.mark.parametrize("t", [-10.0, -7.31, 0.0, 4.999999, 5.0, 17.2, 30.0])
+def test_state(ephemeris, t):
+    # Act
+    position, velocity = ephemeris.state(t)
+
+    # Assert
+    assert position == pytest.approx(circle(t), abs=1e-13)
+    assert velocity == pytest.approx(circle_velocity(t), abs=1e-12)
+    assert ephemeris.position(t) == position
+    assert ephemeris.velocity(t) == velocity
+
+
+def test_batch_matches_scalar(ephemeris):
+    # Arrange
+    ts = [-9.5, 0.25, 12.0, 29.75]
+
+    # Act
+    positions, velocities = ephemeris.state_batch(ts)
+
+    # Assert
+    assert list(zip(*positions)) == [ephemeris.position(t) for t in ts]
+    assert list(zip(*velocities)) == [ephemeris.velocity(t) for t in ts]
+    assert ephemeris.position_batch(ts) == positions
+    assert ephemeris.velocity_batch(ts) == velocities
+    assert ephemeris.position_batch([]) == (
+        positions[0][:0],
+        positions[0][:0],
+        positions[0][:0],
+    )
+
+
+@pytest.mark.parametrize("t", [-10.001, 30.001, math.nan])
+def test_rejects_epochs_outside_range(ephemeris, t):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ephemeris.position(t)
+
+
+def test_approximates_an_orbit():
+    # Arrange
+    elements = OrbitalElements(0.31, 0.2056, 0.12, 0.84, 0.5, 0.0)
+
+    # Act
+    ephemeris = ChebyshevEphemeris.fit(
+        lambda t: propagate(elements, t)[0], 0.0, 100.0, 8.0
+    )
+
+    # Assert
+    for t in (0.0, 3.3, 44.4, 99.9):
+        position, velocity = propagate(elements, t)
+        assert ephemeris.position(t) == pytest.approx(position, abs=1e-12)
+        assert ephemeris.velocity(t) == pytest.approx(velocity, abs=1e-10)
+
+
+def test_save_and_load(ephemeris, tmp_path):
+    # Arrange
+    path = tmp_path / "circle.cheb"
+
+    # Act
+    ephemeris.save(path)
+    loaded = ChebyshevEphemeris.load(path)
+
+    # Assert
+    assert path.stat().st_size == 40 + 8 * len(ephemeris.coefficients)
+    assert loaded.coefficients == ephemeris.coefficients
+    assert repr(loaded) == repr(ephemeris)
+    assert loaded.state(1.5) == ephemeris.state(1.5)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"ACCHEBY", b"NOTCHEBY" + bytes(32), "truncated"],
+)
+def test_load_rejects_other_files(ephemeris, tmp_path, content):
+    # Arrange
+    path = tmp_path / "other.bin"
+    if content == "truncated":
+        ephemeris.save(path)
+        content = path.read_bytes()[:-8]
+    path.write_bytes(content)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ChebyshevEphemeris.load(path)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [(0.0, 0.0, 1.0), (1.0, 0.0, 1.0), (0.0, 1.0, 0.0), (0.0, 1.0, 1.0, -1)],
+)
+def test_fit_rejects_bad_ranges(arguments):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ChebyshevEphemeris.fit(math.sin, *arguments)
+
+
+def test_fit_rejects_changing_dimension():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ChebyshevEphemeris.fit(
+            lambda t: (t,) if t < 1 else (t, t), 0.0, 2.0, 1.0, degree=2
+        )
+
+
+def test_rejects_partial_segments():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ChebyshevEphemeris(0.0, 1.0, 2, 3, [0.0] * 10)
@@ -0,0 +1,87 @@
+import math
+from array import array
+
+import pytest
+
+from astrocompute.library.coordinate_transform import (
+    cartesian_to_polar,
+    cartesian_to_polar_batch,
+    cartesian_to_spherical,
+    cartesian_to_spherical_batch,
+    polar_to_cartesian,
+    polar_to_cartesian_batch,
+    spherical_to_cartesian,
+    spherical_to_cartesian_batch,
+)
+from astrocompute.models import Point2D, Point3D, Polar, Spherical
+
+XS = [1.0, 0.0, -2.0, 3.5]
+YS = [0.0, 1.0, 2.0, -1.25]
+ZS = [1.0, -1.0, 0.5, 2.0]
+
+
+def test_cartesian_to_polar_batch_matches_scalar():
+    # Act
+    rs, thetas = cartesian_to_polar_batch(XS, YS)
+
+    # Assert
+    assert isinstance(rs, array) and isinstance(thetas, array)
+    for x, y, r, theta in zip(XS, YS, rs, thetas):
+        assert cartesian_to_polar(Point2D(x, y)) == Polar(r, theta)
+
+
+def test_polar_to_cartesian_batch_matches_scalar():
+    # Arrange
+    rs, thetas = [1.0, 2.0, 0.5], [0.0, math.pi / 3, -2.0]
+
+    # Act
+    xs, ys = polar_to_cartesian_batch(rs, thetas)
+
+    # Assert
+    for r, theta, x, y in zip(rs, thetas, xs, ys):
+        assert polar_to_cartesian(Polar(r, theta)) == Point2D(x, y)
+
+
+def test_cartesian_to_spherical_batch_matches_scalar():
+    # Act
+    rs, thetas, phis = cartesian_to_spherical_batch(XS, YS, ZS)
+
+    # Assert
+    for x, y, z, r, theta, phi in zip(XS, YS, ZS, rs, thetas, phis):
+        expected = Spherical(r, theta, phi)
+        assert cartesian_to_spherical(Point3D(x, y, z)) == expected
+
+
+def test_spherical_to_cartesian_batch_matches_scalar():
+    # Arrange
+    rs, thetas, phis = [1.0, 2.0], [0.25, -1.0], [3.0, 0.5]
+
+    # Act
+    xs, ys, zs = spherical_to_cartesian_batch(rs, thetas, phis)
+
+    # Assert
+    for r, theta, phi, x, y, z in zip(rs, thetas, phis, xs, ys, zs):
+        expected = Point3D(x, y, z)
+        assert spherical_to_cartesian(Spherical(r, theta, phi)) == expected
+
+
+def test_polar_round_trip():
+    # Act
+    xs, ys = polar_to_cartesian_batch(*cartesian_to_polar_batch(XS, YS))
+
+    # Assert
+    assert list(xs) == pytest.approx(XS)
+    assert list(ys) == pytest.approx(YS)
+
+
+def test_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        cartesian_to_polar_batch([1.0, 2.0], [1.0])
+
+
+def test_batch_accepts_empty_columns():
+    assert cartesian_to_spherical_batch([], [], []) == (
+        array("d"),
+        array("d"),
+        array("d"),
+    )
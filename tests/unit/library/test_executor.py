@@ -0,0 +1,130 @@
+import math
+import random
+from functools import partial
+
+import pytest
+
+from astrocompute.library.coordinate_transform import (
+    cartesian_to_polar_batch,
+    cartesian_to_spherical_batch,
+)
+from astrocompute.library.executor import BatchExecutor
+from astrocompute.library.mathmatics import dms_batch
+from astrocompute.library.matrix3d import Mat3D, apply_columns
+from astrocompute.library.separation import separation_paired
+
+
+def random_column(size, seed, low=-10.0, high=10.0):
+    rng = random.Random(seed)
+    return [rng.uniform(low, high) for _ in range(size)]
+
+
+def first_column(xs, ys):
+    return xs
+
+
+def wrong_length(xs):
+    return xs[1:]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with BatchExecutor(workers=2, chunk_size=7) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("size", [0, 5, 7, 50])
+def test_map_columns_matches_serial(executor, size):
+    # Arrange
+    xs, ys, zs = (random_column(size, seed) for seed in range(3))
+
+    # Act
+    actual = executor.map_columns(cartesian_to_spherical_batch, xs, ys, zs)
+
+    # Assert
+    assert actual == cartesian_to_spherical_batch(xs, ys, zs)
+
+
+def test_map_columns_with_partial(executor):
+    # Arrange
+    matrix = Mat3D([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+    columns = [random_column(30, seed) for seed in range(3)]
+
+    # Act
+    actual = executor.map_columns(partial(apply_columns, matrix), *columns)
+
+    # Assert
+    assert actual == apply_columns(matrix, *columns)
+
+
+def test_map_columns_single_output(executor):
+    # Arrange
+    columns = [
+        random_column(40, 1, 0, math.pi),
+        random_column(40, 2, -math.pi, math.pi),
+        random_column(40, 3, 0, math.pi),
+        random_column(40, 4, -math.pi, math.pi),
+    ]
+
+    # Act
+    actual = executor.map_columns(separation_paired, *columns)
+
+    # Assert
+    assert actual == separation_paired(*columns)
+
+
+def test_map_columns_keeps_output_typecodes(executor):
+    # Arrange
+    dds = random_column(30, 5, -90.0, 90.0)
+
+    # Act
+    actual = executor.map_columns(partial(dms_batch, precision=3), dds)
+
+    # Assert
+    expected = dms_batch(dds, precision=3)
+    assert [column.typecode for column in actual] == ["q", "q", "d"]
+    assert actual == expected
+
+
+def test_map_columns_does_not_depend_on_workers():
+    # Arrange
+    xs, ys = random_column(100, 1), random_column(100, 2)
+
+    # Act
+    with BatchExecutor(workers=1, chunk_size=9) as executor:
+        one = executor.map_columns(cartesian_to_polar_batch, xs, ys)
+    with BatchExecutor(workers=3, chunk_size=9) as executor:
+        three = executor.map_columns(cartesian_to_polar_batch, xs, ys)
+
+    # Assert
+    assert one == three == cartesian_to_polar_batch(xs, ys)
+
+
+def test_map_columns_keeps_row_order(executor):
+    # Arrange
+    xs = [float(i) for i in range(100)]
+
+    # Act
+    actual = executor.map_columns(first_column, xs, xs)
+
+    # Assert
+    assert list(actual) == xs
+
+
+def test_map_columns_rejects_misaligned_output(executor):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        executor.map_columns(wrong_length, [1.0] * 20)
+
+
+def test_map_columns_rejects_mismatched_columns(executor):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        executor.map_columns(first_column, [1.0], [])
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunk_size": 0}])
+def test_invalid_arguments(kwargs):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        BatchExecutor(**kwargs)
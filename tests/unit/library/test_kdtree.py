@@ -0,0 +1,100 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library.kdtree import KDTree
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray3D
+
+
+@pytest.fixture
+def columns_3d():
+    rng = random.Random(42)
+    return [[rng.uniform(-10, 10) for _ in range(500)] for _ in range(3)]
+
+
+def brute_force(columns, point):
+    return sorted((math.dist(p, point), i) for i, p in enumerate(zip(*columns)))
+
+
+@pytest.mark.parametrize("k", [1, 5, 50])
+def test_query_matches_brute_force(columns_3d, k):
+    # Arrange
+    tree = KDTree(*columns_3d, leaf_size=4)
+    point = (1.0, -2.0, 0.5)
+
+    # Act
+    actual = tree.query(point, k)
+
+    # Assert
+    assert actual == brute_force(columns_3d, point)[:k]
+
+
+def test_query_radius_matches_brute_force(columns_3d):
+    # Arrange
+    tree = KDTree(*columns_3d)
+    point = (0.0, 0.0, 0.0)
+
+    # Act
+    actual = tree.query_radius(point, 4.0)
+
+    # Assert
+    expected = sorted(i for d, i in brute_force(columns_3d, point) if d <= 4.0)
+    assert actual == expected
+
+
+def test_query_box(columns_3d):
+    # Arrange
+    tree = KDTree(*columns_3d, leaf_size=2)
+    lower, upper = (-2.0, -5.0, 0.0), (3.0, 1.0, 10.0)
+
+    # Act
+    actual = tree.query_box(lower, upper)
+
+    # Assert
+    expected = [
+        i
+        for i, p in enumerate(zip(*columns_3d))
+        if all(lo <= c <= hi for c, lo, hi in zip(p, lower, upper))
+    ]
+    assert actual == expected
+
+
+def test_batch_queries(columns_3d):
+    # Arrange
+    tree = KDTree.from_point_array(PointArray3D(*columns_3d))
+    queries = [[0.0, 5.0], [1.0, -5.0], [2.0, 0.0]]
+
+    # Act
+    nearest = tree.query_batch(*queries, k=3)
+    within = tree.query_radius_batch(*queries, radius=3.0)
+
+    # Assert
+    assert nearest == [tree.query(q, 3) for q in zip(*queries)]
+    assert within == [tree.query_radius(q, 3.0) for q in zip(*queries)]
+
+
+def test_from_points():
+    # Arrange
+    points_2d = [Point2D(0, 0), Point2D(5, 5), Point2D(1, 1)]
+    points_3d = [Point3D(0, 0, 0), Point3D(5, 5, 5)]
+
+    # Act
+    tree_2d = KDTree.from_points(points_2d)
+    tree_3d = KDTree.from_points(points_3d)
+
+    # Assert
+    assert tree_2d.dimension == 2 and len(tree_2d) == 3
+    assert tree_2d.query((4, 4)) == [(math.sqrt(2), 1)]
+    assert tree_3d.dimension == 3
+
+
+def test_rejects_wrong_dimension(columns_3d):
+    with pytest.raises(ValueError):
+        KDTree(*columns_3d).query((1.0, 2.0))
+
+
+def test_rejects_invalid_k(columns_3d):
+    with pytest.raises(ValueError):
+        KDTree(*columns_3d).query((1.0, 2.0, 3.0), k=0)
@@ -0,0 +1,227 @@
+import math
+
+import pytest
+
+from astrocompute.constants import GM_SUN
+from astrocompute.library.kepler import (
+    OrbitalElements,
+    eccentric_anomaly,
+    eccentric_anomaly_batch,
+    hyperbolic_anomaly,
+    hyperbolic_anomaly_batch,
+    parabolic_anomaly,
+    propagate,
+    propagate_batch,
+)
+
+YEAR = 2 * math.pi / math.sqrt(GM_SUN)
+
+
+@pytest.mark.parametrize("e", [0.0, 0.1, 0.5, 0.8, 0.95, 0.999999, 1 - 1e-12])
+@pytest.mark.parametrize("mean_anomaly", [-3.0, -1e-9, 0.0, 0.2, 2.5, 3.1])
+def test_eccentric_anomaly(mean_anomaly, e):
+    # Act
+    actual = eccentric_anomaly(mean_anomaly, e)
+
+    # Assert
+    assert (1 - e) * actual + e * (actual - math.sin(actual)) == pytest.approx(
+        mean_anomaly, rel=1e-12, abs=1e-15
+    )
+
+
+def test_eccentric_anomaly_reduces_mean_anomaly():
+    # Act & Assert
+    assert eccentric_anomaly(2.0 + 4 * math.pi, 0.3) == pytest.approx(
+        eccentric_anomaly(2.0, 0.3), abs=1e-12
+    )
+
+
+@pytest.mark.parametrize("e", [1 + 1e-9, 1.01, 1.5, 3.0, 100.0])
+@pytest.mark.parametrize("mean_anomaly", [-50.0, -1e-6, 0.0, 0.3, 5.0, 1e4])
+def test_hyperbolic_anomaly(mean_anomaly, e):
+    # Act
+    actual = hyperbolic_anomaly(mean_anomaly, e)
+
+    # Assert
+    assert e * math.sinh(actual) - actual == pytest.approx(
+        mean_anomaly, rel=1e-9, abs=1e-15
+    )
+
+
+@pytest.mark.parametrize("mean_anomaly", [-20.0, -1e-8, 0.0, 0.5, 1e6])
+def test_parabolic_anomaly(mean_anomaly):
+    # Act
+    actual = parabolic_anomaly(mean_anomaly)
+
+    # Assert
+    assert actual + actual**3 / 3 == pytest.approx(mean_anomaly, rel=1e-12)
+
+
+@pytest.mark.parametrize(
+    "function, e",
+    [
+        (eccentric_anomaly, -0.1),
+        (eccentric_anomaly, 1.0),
+        (hyperbolic_anomaly, 1.0),
+        (hyperbolic_anomaly, 0.5),
+    ],
+)
+def test_anomaly_rejects_other_orbits(function, e):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        function(1.0, e)
+
+
+def test_eccentric_anomaly_reports_no_convergence():
+    # Act & Assert
+    with pytest.raises(ValueError, match="did not converge"):
+        eccentric_anomaly(1.0, 0.5, max_iterations=1)
+
+
+def test_anomaly_batch():
+    # Arrange
+    ms = [-1.0, 0.0, 0.5, 3.0]
+    es = [0.1, 0.5, 0.9, 0.99]
+
+    # Act & Assert
+    assert list(eccentric_anomaly_batch(ms, es)) == list(
+        map(eccentric_anomaly, ms, es)
+    )
+    assert list(eccentric_anomaly_batch(ms, 0.3)) == [
+        eccentric_anomaly(m, 0.3) for m in ms
+    ]
+    assert list(hyperbolic_anomaly_batch(ms, 2.0)) == [
+        hyperbolic_anomaly(m, 2.0) for m in ms
+    ]
+    with pytest.raises(ValueError):
+        eccentric_anomaly_batch(ms, es[:2])
+
+
+def test_propagate_circular_orbit():
+    # Arrange
+    elements = OrbitalElements(1.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    # Act
+    position, velocity = propagate(elements, YEAR / 4)
+
+    # Assert
+    assert position == pytest.approx((0.0, 1.0, 0.0), abs=1e-12)
+    assert velocity == pytest.approx((-math.sqrt(GM_SUN), 0.0, 0.0))
+
+
+def test_propagate_at_perihelion_points_along_p():
+    # Arrange
+    inclination, node, perihelion_argument = 0.4, 1.2, 2.0
+    elements = OrbitalElements(
+        0.5, 1.7, inclination, node, perihelion_argument, 100.0
+    )
+    cos_w, sin_w = math.cos(perihelion_argument), math.sin(perihelion_argument)
+    expected = (
+        0.5
+        * (
+            cos_w * math.cos(node)
+            - sin_w * math.cos(inclination) * math.sin(node)
+        ),
+        0.5
+        * (
+            cos_w * math.sin(node)
+            + sin_w * math.cos(inclination) * math.cos(node)
+        ),
+        0.5 * sin_w * math.sin(inclination),
+    )
+
+    # Act
+    position, _ = propagate(elements, 100.0)
+
+    # Assert
+    assert position == pytest.approx(expected, abs=1e-15)
+
+
+@pytest.mark.parametrize(
+    "e", [0.0, 0.3, 0.97, 1 - 1e-9, 1.0, 1 + 1e-9, 1.2, 4.0]
+)
+def test_propagate_conserves_energy_and_matches_derivative(e):
+    # Arrange
+    q, t, h = 1.3, 80.0, 1e-3
+    elements = OrbitalElements(q, e, 0.3, 1.0, 2.0, 10.0)
+
+    # Act
+    position, velocity = propagate(elements, t)
+    before, _ = propagate(elements, t - h)
+    after, _ = propagate(elements, t + h)
+
+    # Assert
+    r, v = math.hypot(*position), math.hypot(*velocity)
+    assert v * v / 2 - GM_SUN / r == pytest.approx(
+        -GM_SUN * (1 - e) / (2 * q), abs=1e-15
+    )
+    assert velocity == pytest.approx(
+        [(a - b) / (2 * h) for a, b in zip(after, before)], abs=1e-11
+    )
+
+
+def test_propagate_is_continuous_through_parabolic_orbits():
+    # Arrange
+    states = [
+        propagate(OrbitalElements(2.0, e, 0.1, 0.2, 0.3, 0.0), -300.0)
+        for e in (1 - 1e-10, 1.0, 1 + 1e-10)
+    ]
+
+    # Act & Assert
+    for position, velocity in states:
+        assert position == pytest.approx(states[1][0], abs=1e-9)
+        assert velocity == pytest.approx(states[1][1], abs=1e-11)
+
+
+def test_propagate_returns_after_one_period():
+    # Arrange
+    a, e = 2.5, 0.6
+    elements = OrbitalElements(a * (1 - e), e, 0.2, 0.3, 0.4, 12.0)
+    period = YEAR * a**1.5
+
+    # Act
+    start, _ = propagate(elements, 50.0)
+    end, _ = propagate(elements, 50.0 + 3 * period)
+
+    # Assert
+    assert end == pytest.approx(start, abs=1e-12)
+
+
+def test_propagate_batch_broadcasts():
+    # Arrange
+    elements = [
+        OrbitalElements(1.0, 0.2, 0.1, 0.2, 0.3, 0.0),
+        OrbitalElements(0.5, 1.0, 1.1, 1.2, 1.3, 5.0),
+        OrbitalElements(3.0, 2.5, 2.1, 2.2, 2.3, -5.0),
+    ]
+    columns = [list(column) for column in zip(*elements)]
+    times = [-40.0, 0.0, 40.0]
+
+    # Act
+    bodies = propagate_batch(*columns, 20.0)
+    epochs = propagate_batch(*elements[0], times)
+    paired = propagate_batch(*columns, times)
+
+    # Assert
+    for state, expected in [
+        (bodies, [propagate(el, 20.0) for el in elements]),
+        (epochs, [propagate(elements[0], t) for t in times]),
+        (paired, list(map(propagate, elements, times))),
+    ]:
+        assert len(state.x) == 3
+        assert [row[:3] for row in zip(*state)] == [p for p, _ in expected]
+        assert [row[3:] for row in zip(*state)] == [v for _, v in expected]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        ([1.0, 2.0], 0.5, 0.0, 0.0, 0.0, 0.0, [1.0, 2.0, 3.0]),
+        (0.0, 0.5, 0.0, 0.0, 0.0, 0.0, 1.0),
+        (1.0, -0.5, 0.0, 0.0, 0.0, 0.0, 1.0),
+    ],
+)
+def test_propagate_batch_rejects_bad_input(arguments):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        propagate_batch(*arguments)
@@ -0,0 +1,124 @@
+import math
+
+import pytest
+
+from astrocompute.library.line import Line2D
+from astrocompute.library.point import Point2D
+
+
+@pytest.mark.parametrize(
+    "p, q",
+    [
+        (Point2D(0, 0), Point2D(1, 2)),
+        (Point2D(-1, 3), Point2D(4, -2)),
+        (Point2D(1, 1), Point2D(5, 1)),
+    ],
+)
+def test_matches_point2d_queries(p: Point2D, q: Point2D):
+    # Act
+    line = Line2D.from_points(p, q)
+
+    # Assert
+    assert line.slope == pytest.approx(Point2D.slope(p, q))
+    assert line.y_intercept == pytest.approx(Point2D.y_intercept(p, q))
+
+
+def test_vertical_line_intercepts():
+    # Act
+    y_axis = Line2D.from_points(Point2D(0, 0), Point2D(0, 1))
+    other = Line2D.from_points(Point2D(2, 0), Point2D(2, 1))
+
+    # Assert
+    assert y_axis.is_vertical
+    assert math.isnan(y_axis.slope)
+    assert y_axis.y_intercept == float("inf")
+    assert math.isnan(other.y_intercept)
+    assert other.x_intercept == 2.0
+
+
+def test_horizontal_line_intercepts():
+    # Act
+    line = Line2D.from_points(Point2D(0, 3), Point2D(1, 3))
+
+    # Assert
+    assert line.is_horizontal
+    assert line.slope == 0.0
+    assert math.isnan(line.x_intercept)
+
+
+def test_from_points_rejects_identical_points():
+    with pytest.raises(ValueError):
+        Line2D.from_points(Point2D(1, 1), Point2D(1, 1))
+
+
+def test_side_and_distance():
+    # Arrange
+    line = Line2D.from_points(Point2D(0, 0), Point2D(1, 0))
+
+    # Act & Assert
+    assert line.side(Point2D(5, 2)) == 1
+    assert line.side(Point2D(5, -2)) == -1
+    assert line.side(Point2D(5, 0)) == 0
+    assert line.distance(Point2D(3, -4)) == 4.0
+    assert line.contains(Point2D(-7, 0))
+
+
+def test_distance_tests_scale_with_coordinates():
+    # Arrange
+    p = Point2D(1e6 + 0.1, 1e6 + 0.3)
+    q = Point2D(2e6 + 0.7, 3e6 + 0.9)
+    line = Line2D.from_points(p, q)
+    off = Point2D(p.x, p.y + 1e-3)
+
+    # Act & Assert
+    assert line.contains(p) and line.contains(q)
+    assert line.side(p) == 0 and line.side(off) == 1
+    assert line.side_batch([p.x, off.x], [p.y, off.y]) == [0, 1]
+    assert line.same_line(Line2D.from_points(p, Point2D.midpoint(p, q)))
+    assert not line.same_line(Line2D.from_points(off, q))
+
+
+def test_parallel_perpendicular_and_same_line():
+    # Arrange
+    line = Line2D.from_slope_intercept(2.0, 1.0)
+    parallel = Line2D.from_points(Point2D(0, 0), Point2D(1, 2))
+    perpendicular = Line2D.from_slope_intercept(-0.5, 3.0)
+    reversed_line = Line2D.from_points(Point2D(1, 3), Point2D(0, 1))
+
+    # Act & Assert
+    assert line.is_parallel(parallel)
+    assert not line.is_parallel(perpendicular)
+    assert line.is_perpendicular(perpendicular)
+    assert line.same_line(reversed_line)
+    assert not line.same_line(parallel)
+
+
+def test_intersection():
+    # Arrange
+    line = Line2D.from_slope_intercept(1.0, 0.0)
+    other = Line2D.from_slope_intercept(-1.0, 2.0)
+
+    # Act
+    actual = line.intersection(other)
+
+    # Assert
+    assert actual.x == pytest.approx(1.0)
+    assert actual.y == pytest.approx(1.0)
+    assert line.intersection(Line2D.from_slope_intercept(1.0, 5.0)) is None
+
+
+def test_batch_queries_match_scalar():
+    # Arrange
+    line = Line2D.from_points(Point2D(-1, -2), Point2D(3, 1))
+    xs, ys = [0.0, 3.0, -1.0, 10.0], [5.0, 1.0, -2.0, -3.0]
+
+    # Act
+    signed = line.signed_distance_batch(xs, ys)
+    distances = line.distance_batch(xs, ys)
+    sides = line.side_batch(xs, ys)
+
+    # Assert
+    points = [Point2D(x, y) for x, y in zip(xs, ys)]
+    assert list(signed) == [line.signed_distance(p) for p in points]
+    assert list(distances) == [line.distance(p) for p in points]
+    assert sides == [line.side(p) for p in points]
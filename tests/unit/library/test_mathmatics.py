@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from astrocompute.library.mathmatics import ddd, ddd_batch, dms, dms_batch
+
+EDGE_CASES = [0.0, -0.0, -0.5, -1 / 3600, 0.5 / 3600, -0.9999999999, 89.99999]
+
+
+@pytest.fixture
+def degrees():
+    rng = random.Random(11)
+    return [rng.uniform(-180, 180) for _ in range(1000)] + EDGE_CASES
+
+
+@pytest.mark.parametrize(
+    "dd, expected",
+    [
+        (-0.5, (0, -30, 0.0)),
+        (-1.5, (-1, 30, 0.0)),
+        (-1 / 240, (0, 0, -15.0)),
+        (12.5, (12, 30, 0.0)),
+    ],
+)
+def test_dms_sign_on_first_non_zero_component(dd, expected):
+    # Act
+    d, m, s = dms(dd)
+
+    # Assert
+    assert (d, m) == expected[:2]
+    assert s == pytest.approx(expected[2], abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "dd, precision, expected",
+    [
+        (59.9999 / 3600, 2, (0, 1, 0.0)),
+        (-(59 + 59.996 / 60) / 60, 2, (-1, 0, 0.0)),
+        (10 + 59.5 / 3600, 0, (10, 1, 0.0)),
+        (-(0.4 / 3600), 0, (0, 0, -0.0)),
+    ],
+)
+def test_dms_rounding_carry(dd, precision, expected):
+    # Act
+    actual = dms(dd, precision)
+
+    # Assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize("precision", [None, 0, 3])
+def test_dms_batch_matches_scalar(degrees, precision):
+    # Act
+    ds, ms, ss = dms_batch(degrees, precision)
+
+    # Assert
+    assert list(zip(ds, ms, ss)) == [dms(dd, precision) for dd in degrees]
+
+
+def test_ddd_batch_matches_scalar(degrees):
+    # Arrange
+    ds, ms, ss = dms_batch(degrees)
+
+    # Act
+    actual = ddd_batch(ds, ms, ss)
+
+    # Assert
+    assert list(actual) == [ddd(*parts) for parts in zip(ds, ms, ss)]
+    assert list(actual) == pytest.approx(degrees)
+
+
+def test_ddd_batch_rejects_different_lengths():
+    with pytest.raises(ValueError):
+        ddd_batch([1, 2], [0], [0.0, 0.0])
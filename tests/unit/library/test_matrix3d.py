@@ -0,0 +1,110 @@
+import math
+
+import pytest
+
+from astrocompute.library.matrix3d import (
+    Mat3D,
+    apply,
+    apply_batch,
+    apply_columns,
+    determinant,
+    determinant_batch,
+    multiply,
+    multiply_batch,
+    transpose,
+    transpose_batch,
+)
+
+
+def rotation_z(angle: float) -> Mat3D:
+    c, s = math.cos(angle), math.sin(angle)
+    return Mat3D([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+A = Mat3D([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+B = Mat3D([[2, 0, 1], [1, 3, 0], [0, 1, 4]])
+
+
+def test_multiply():
+    # Act
+    actual = multiply(A, B)
+
+    # Assert
+    assert actual.data == [[4, 9, 13], [13, 21, 28], [22, 34, 47]]
+
+
+def test_apply():
+    assert apply(A, (1, 0, -1)) == (-2, -2, -3)
+
+
+def test_apply_batch_single_matrix():
+    # Arrange
+    vectors = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (1.0, 1.0, 1.0)]
+
+    # Act
+    actual = apply_batch(rotation_z(math.pi / 2), vectors)
+
+    # Assert
+    expected = [(0.0, 1.0, 0.0), (-1.0, 0.0, 0.0), (-1.0, 1.0, 1.0)]
+    for v, e in zip(actual, expected):
+        assert v == pytest.approx(e)
+
+
+def test_apply_batch_matrix_stack():
+    # Arrange
+    vectors = [(1, 2, 3), (4, 5, 6)]
+
+    # Act
+    actual = apply_batch([A, B], vectors)
+
+    # Assert
+    assert actual == [apply(A, vectors[0]), apply(B, vectors[1])]
+
+
+def test_apply_batch_rejects_mismatched_stack():
+    with pytest.raises(ValueError):
+        apply_batch([A], [(1, 2, 3), (4, 5, 6)])
+
+
+def test_apply_columns():
+    # Arrange
+    vectors = [(1, 0, -1), (0, 2, 0), (3, 1, 2)]
+
+    # Act
+    xs, ys, zs = apply_columns(A, *zip(*vectors))
+
+    # Assert
+    assert list(zip(xs, ys, zs)) == apply_batch(A, vectors)
+
+
+def test_apply_columns_rejects_mismatched_columns():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        apply_columns(A, [1.0], [2.0], [])
+
+
+def test_multiply_batch():
+    # Act
+    stacked = multiply_batch([A, B], [B, A])
+    broadcast = multiply_batch(A, [A, B])
+
+    # Assert
+    assert [m.data for m in stacked] == [
+        multiply(A, B).data,
+        multiply(B, A).data,
+    ]
+    assert [m.data for m in broadcast] == [
+        multiply(A, A).data,
+        multiply(A, B).data,
+    ]
+
+
+def test_determinant_batch():
+    assert list(determinant_batch([A, B])) == [determinant(A), determinant(B)]
+
+
+def test_transpose_batch():
+    assert [m.data for m in transpose_batch([A, B])] == [
+        transpose(A).data,
+        transpose(B).data,
+    ]
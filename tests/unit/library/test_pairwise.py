@@ -0,0 +1,174 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library.pairwise import (
+    condensed_distances,
+    distance_matrix,
+    distances_within,
+    iter_distance_tiles,
+    rows_per_tile,
+)
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+
+
+def random_points(size, seed):
+    rng = random.Random(seed)
+    return PointArray3D(
+        [rng.uniform(-10, 10) for _ in range(size)],
+        [rng.uniform(-10, 10) for _ in range(size)],
+        [rng.uniform(-10, 10) for _ in range(size)],
+    )
+
+
+def brute_force(p, q):
+    return [[math.dist((a.x, a.y, a.z), (b.x, b.y, b.z)) for b in q] for a in p]
+
+
+@pytest.fixture
+def p():
+    return random_points(37, 1)
+
+
+@pytest.fixture
+def q():
+    return random_points(23, 2)
+
+
+@pytest.mark.parametrize("memory_budget", [1, 8 * 23 * 5, 2**20])
+def test_distance_matrix_matches_brute_force(p, q, memory_budget):
+    # Act
+    actual = distance_matrix(p, q, memory_budget=memory_budget)
+
+    # Assert
+    expected = brute_force(p, q)
+    assert len(actual) == len(p)
+    for row, expected_row in zip(actual, expected):
+        assert list(row) == pytest.approx(expected_row)
+
+
+def test_iter_distance_tiles_respects_memory_budget(p, q):
+    # Act
+    tiles = list(iter_distance_tiles(p, q, memory_budget=8 * 23 * 5))
+
+    # Assert
+    assert [start for start, _ in tiles] == list(range(0, 37, 5))
+    assert all(len(rows) <= 5 for _, rows in tiles)
+
+
+def test_iter_distance_tiles_divides_memory_budget_among_workers(p, q):
+    # Act
+    tiles = list(iter_distance_tiles(p, q, memory_budget=8 * 23 * 8, workers=2))
+
+    # Assert
+    assert [start for start, _ in tiles] == list(range(0, 37, 2))
+    assert [row for _, rows in tiles for row in rows] == distance_matrix(p, q)
+
+
+def test_distance_matrix_accepts_points():
+    # Arrange
+    points = [Point3D(0, 0, 0), Point3D(3, 4, 0), Point3D(0, 0, 2)]
+
+    # Act
+    actual = distance_matrix(points)
+
+    # Assert
+    assert [list(row) for row in actual] == [
+        [0.0, 5.0, 2.0],
+        [5.0, 0.0, math.sqrt(29)],
+        [2.0, math.sqrt(29), 0.0],
+    ]
+
+
+def test_distance_matrix_2d():
+    # Arrange
+    points = PointArray2D([0, 3], [0, 4])
+
+    # Act
+    actual = distance_matrix(points, [Point2D(0, 0)])
+
+    # Assert
+    assert [list(row) for row in actual] == [[0.0], [5.0]]
+
+
+def test_distance_matrix_rejects_mixed_dimensions(p):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        distance_matrix(p, PointArray2D([0], [0]))
+
+
+@pytest.mark.parametrize("memory_budget", [1, 64, 2**20])
+def test_condensed_distances_matches_upper_triangle(p, memory_budget):
+    # Act
+    actual = condensed_distances(p, memory_budget=memory_budget)
+
+    # Assert
+    matrix = brute_force(p, p)
+    n = len(p)
+    expected = [matrix[i][j] for i in range(n) for j in range(i + 1, n)]
+    assert list(actual) == pytest.approx(expected)
+    i, j = 4, 9
+    assert actual[n * i - i * (i + 1) // 2 + j - i - 1] == pytest.approx(
+        matrix[i][j]
+    )
+
+
+def test_distances_within_between_sets(p, q):
+    # Act
+    actual = distances_within(p, q, threshold=8.0, memory_budget=100)
+
+    # Assert
+    matrix = brute_force(p, q)
+    expected = [
+        (i, j)
+        for i, row in enumerate(matrix)
+        for j, value in enumerate(row)
+        if value <= 8.0
+    ]
+    assert list(zip(actual.rows, actual.columns)) == expected
+    assert list(actual.distances) == pytest.approx(
+        [matrix[i][j] for i, j in expected]
+    )
+
+
+def test_distances_within_same_set_reports_each_pair_once(p):
+    # Act
+    actual = distances_within(p, threshold=8.0)
+
+    # Assert
+    matrix = brute_force(p, p)
+    expected = [
+        (i, j)
+        for i in range(len(p))
+        for j in range(i + 1, len(p))
+        if matrix[i][j] <= 8.0
+    ]
+    assert list(zip(actual.rows, actual.columns)) == expected
+
+
+def test_workers_match_serial(p, q):
+    # Act
+    serial = distances_within(p, q, threshold=10.0, memory_budget=400)
+    parallel = distances_within(
+        p, q, threshold=10.0, memory_budget=400, workers=2
+    )
+
+    # Assert
+    assert parallel == serial
+    assert condensed_distances(p, 64, workers=2) == condensed_distances(p)
+
+
+@pytest.mark.parametrize("kwargs", [{"memory_budget": 0}, {"workers": 0}])
+def test_invalid_arguments(p, kwargs):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        distance_matrix(p, **kwargs)
+
+
+def test_rows_per_tile():
+    # Act & Assert
+    assert rows_per_tile(1000, 80_000) == 10
+    assert rows_per_tile(1000, 1) == 1
+    assert rows_per_tile(0, 80) == 10
@@ -3,7 +3,7 @@ from typing import Optional
 
 import pytest
 
-from astrocompute.library.point import Point2D
+from astrocompute.library.point import Point2D, Point3D
 
 
 @pytest.mark.point2d
@@ -241,3 +241,47 @@ def test_slope_vertical():
 
     # Assert
     assert math.isnan(m), f"Expected: NaN, Actual: {m}"
+
+
+def test_point3d_are_collinear_with_tolerance():
+    # Arrange
+    p, q = Point3D(0, 0, 0), Point3D(1, 1, 1)
+    r = Point3D(2, 2, 2 + 1e-9)
+
+    # Act & Assert
+    assert Point3D.are_collinear(p, q, Point3D(2, 2, 2))
+    assert not Point3D.are_collinear(p, q, r)
+    assert Point3D.are_collinear(p, q, r, tol=1e-6)
+
+
+def test_point3d_are_collinear_measures_angle_at_first_point():
+    # Arrange
+    p, q = Point3D(0, 0, 0), Point3D(1, 0, 0)
+    r = Point3D(1.001, 1e-4, 0)
+
+    # Act & Assert
+    assert Point3D.are_collinear(p, q, r, tol=1e-3)
+    assert not Point3D.are_collinear(p, q, r, tol=1e-5)
+
+
+def test_point2d_are_collinear_with_tolerance():
+    # Arrange
+    p, q = Point2D(0, 0), Point2D(1e6, 1e6)
+    r = Point2D(2e6, 2e6 + 1e-3)
+
+    # Act & Assert
+    assert Point2D.are_collinear(p, q, Point2D(2e6, 2e6))
+    assert not Point2D.are_collinear(p, q, r)
+    assert Point2D.are_collinear(p, q, r, tol=1e-6)
+    assert not Point2D.are_collinear(p, q, r, tol=1e-12)
+
+
+def test_point3d_are_coplanar_with_tolerance():
+    # Arrange
+    p, q, r = Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(0, 1, 0)
+    s = Point3D(1, 1, 1e-9)
+
+    # Act & Assert
+    assert Point3D.are_coplanar(p, q, r, Point3D(5, -3, 0))
+    assert not Point3D.are_coplanar(p, q, r, s)
+    assert Point3D.are_coplanar(p, q, r, s, tol=1e-6)
@@ -0,0 +1,201 @@
+import math
+
+import pytest
+
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+
+
+@pytest.fixture
+def points_2d():
+    return [Point2D(0, 0), Point2D(1, 2, "a"), Point2D(-3, 4), Point2D(2, 2)]
+
+
+@pytest.fixture
+def points_3d():
+    return [Point3D(0, 0, 0), Point3D(1, 2, 3), Point3D(-3, 4, 0.5)]
+
+
+def test_2d_from_points_round_trip(points_2d):
+    # Act
+    array_2d = PointArray2D.from_points(points_2d)
+
+    # Assert
+    assert len(array_2d) == 4
+    assert list(array_2d) == points_2d
+    assert array_2d[1].name == "a"
+    assert array_2d.nbytes == 64
+
+
+def test_2d_rejects_mismatched_columns():
+    with pytest.raises(ValueError):
+        PointArray2D([1.0, 2.0], [1.0])
+
+
+def test_2d_rejects_mismatched_names():
+    with pytest.raises(ValueError):
+        PointArray2D([1.0], [1.0], names=["a", "b"])
+
+
+def test_2d_distance_matches_scalar(points_2d):
+    # Arrange
+    p = PointArray2D.from_points(points_2d)
+    q = PointArray2D.from_points(reversed(points_2d))
+
+    # Act
+    actual = PointArray2D.distance(p, q)
+
+    # Assert
+    expected = [Point2D.distance(a, b) for a, b in zip(p, q)]
+    assert list(actual) == pytest.approx(expected)
+
+
+def test_2d_distance_to_single_point(points_2d):
+    # Act
+    actual = PointArray2D.distance(
+        PointArray2D.from_points(points_2d), Point2D(0, 0)
+    )
+
+    # Assert
+    assert list(actual) == pytest.approx([0.0, math.sqrt(5), 5.0, math.sqrt(8)])
+
+
+def test_2d_midpoint(points_2d):
+    # Act
+    actual = PointArray2D.midpoint(
+        PointArray2D.from_points(points_2d), Point2D(1, 0)
+    )
+
+    # Assert
+    assert list(actual.x) == [0.5, 1.0, -1.0, 1.5]
+    assert list(actual.y) == [0.0, 1.0, 2.0, 1.0]
+
+
+def test_2d_slope_and_y_intercept():
+    # Arrange
+    p = PointArray2D([0, 1, 2, 0], [0, 1, 0, 0])
+    q = PointArray2D([1, 1, 4, 0], [2, 3, 1, 5])
+
+    # Act
+    slopes = PointArray2D.slope(p, q)
+    intercepts = PointArray2D.y_intercept(p, q)
+
+    # Assert
+    assert slopes[0] == 2.0 and slopes[2] == 0.5
+    assert math.isnan(slopes[1]) and math.isnan(slopes[3])
+    assert intercepts[0] == 0.0 and intercepts[2] == -1.0
+    assert math.isnan(intercepts[1])
+    assert intercepts[3] == float("inf")
+
+
+def test_2d_are_collinear():
+    # Arrange
+    p = PointArray2D([0, 0], [0, 0])
+    q = PointArray2D([1, 1], [1, 1])
+    r = PointArray2D([2, 2], [2, 3])
+
+    # Act & Assert
+    assert PointArray2D.are_collinear(p, q, r) == [True, False]
+
+
+def test_3d_distance_matches_scalar(points_3d):
+    # Arrange
+    p = PointArray3D.from_points(points_3d)
+    q = PointArray3D.from_points(reversed(points_3d))
+
+    # Act
+    actual = PointArray3D.distance(p, q)
+
+    # Assert
+    expected = [Point3D.distance(a, b) for a, b in zip(p, q)]
+    assert list(actual) == pytest.approx(expected)
+
+
+def test_3d_midpoint(points_3d):
+    # Act
+    actual = PointArray3D.midpoint(
+        PointArray3D.from_points(points_3d), Point3D(1, 0, 1)
+    )
+
+    # Assert
+    assert list(actual) == [
+        Point3D(0.5, 0.0, 0.5),
+        Point3D(1.0, 1.0, 2.0),
+        Point3D(-1.0, 2.0, 0.75),
+    ]
+
+
+def test_3d_are_collinear():
+    # Arrange
+    p = PointArray3D([0, 0], [0, 0], [0, 0])
+    q = PointArray3D([1, 1], [1, 1], [1, 1])
+    r = PointArray3D([2, 2], [2, 2], [2, 3])
+
+    # Act & Assert
+    assert PointArray3D.are_collinear(p, q, r) == [True, False]
+
+
+def test_3d_are_coplanar():
+    # Arrange
+    p = PointArray3D([0, 0], [0, 0], [0, 0])
+    q = PointArray3D([1, 1], [0, 0], [0, 0])
+    r = PointArray3D([0, 0], [1, 1], [0, 0])
+    s = PointArray3D([1, 1], [1, 1], [0, 1])
+
+    # Act & Assert
+    assert PointArray3D.are_coplanar(p, q, r, s) == [True, False]
+
+
+def test_are_collinear_with_tolerance():
+    # Arrange
+    p = PointArray3D([0, 0, 0], [0, 0, 0], [0, 0, 0])
+    q = PointArray3D([1e6, 1, 1], [0, 0, 0], [0, 0, 0])
+    r = PointArray3D([2e6, 2, 2], [1, 1e-9, 0.1], [0, 0, 0])
+
+    # Act
+    exact = PointArray3D.are_collinear(p, q, r)
+    tolerant = PointArray3D.are_collinear(p, q, r, tol=1e-6)
+
+    # Assert
+    assert exact == [False, False, False]
+    assert tolerant == [True, True, False]
+
+
+def test_are_coplanar_with_tolerance():
+    # Arrange
+    p = PointArray3D([0, 0], [0, 0], [0, 0])
+    q = PointArray3D([1, 100], [0, 0], [0, 0])
+    r = PointArray3D([0, 0], [1, 100], [0, 0])
+    s = PointArray3D([1, 100], [1, 100], [1e-8, 1])
+
+    # Act
+    exact = PointArray3D.are_coplanar(p, q, r, s)
+    tolerant = PointArray3D.are_coplanar(p, q, r, s, tol=1e-6)
+
+    # Assert
+    assert exact == [False, False]
+    assert tolerant == [True, False]
+
+
+def test_2d_are_collinear_with_tolerance():
+    # Arrange
+    p = PointArray2D([0, 0], [0, 0])
+    q = PointArray2D([1, 1], [1, 1])
+    r = PointArray2D([2, 2], [2 + 1e-9, 3])
+
+    # Act & Assert
+    assert PointArray2D.are_collinear(p, q, r) == [False, False]
+    assert PointArray2D.are_collinear(p, q, r, tol=1e-6) == [True, False]
+
+
+def test_3d_names():
+    # Arrange
+    array_3d = PointArray3D()
+
+    # Act
+    array_3d.append(Point3D(1, 2, 3))
+    array_3d.append(Point3D(4, 5, 6), name="b")
+
+    # Assert
+    assert array_3d.name(0) is None
+    assert array_3d.name(1) == "b"
@@ -0,0 +1,119 @@
+import pytest
+
+from astrocompute.library.point import Point2D, Point3D
+from astrocompute.library.point_array import PointArray2D, PointArray3D
+from astrocompute.library.point_parser import (
+    iter_point_chunks,
+    read_point_chunks,
+)
+
+
+def test_parses_2d_representations():
+    # Arrange
+    lines = [
+        repr(Point2D(1.0, 2.0)),
+        "",
+        "(3.5, -4.0)",
+        repr(Point2D(5.0, 6.0, "star")),
+    ]
+
+    # Act
+    chunks = list(iter_point_chunks(lines))
+
+    # Assert
+    assert len(chunks) == 1
+    points = chunks[0].points
+    assert isinstance(points, PointArray2D)
+    assert list(points) == [
+        Point2D(1.0, 2.0),
+        Point2D(3.5, -4.0),
+        Point2D(5.0, 6.0, "star"),
+    ]
+    assert not chunks[0].errors
+
+
+def test_parses_3d_representations():
+    # Arrange
+    lines = [repr(Point3D(1.0, 2.0, 3.0)), "(4, 5, 6)\n"]
+
+    # Act
+    (chunk,) = iter_point_chunks(lines)
+
+    # Assert
+    assert isinstance(chunk.points, PointArray3D)
+    assert list(chunk.points) == [Point3D(1, 2, 3), Point3D(4, 5, 6)]
+
+
+def test_reports_malformed_lines_without_aborting():
+    # Arrange
+    lines = ["garbage", "(1, 2)", "(1, 2, 3)", "(x, 2)", "(5, 6)"]
+
+    # Act
+    (chunk,) = iter_point_chunks(lines)
+
+    # Assert
+    assert list(chunk.points.x) == [1.0, 5.0]
+    assert [error.line_number for error in chunk.errors] == [1, 3, 4]
+    assert chunk.errors[0].text == "garbage"
+
+
+def test_dimension_is_detected_from_first_valid_line():
+    # Arrange
+    lines = ["(1, 2", "(1, 2, 3)"]
+
+    # Act
+    (chunk,) = iter_point_chunks(lines)
+
+    # Assert
+    assert isinstance(chunk.points, PointArray3D)
+    assert len(chunk.errors) == 1
+
+
+def test_splits_into_chunks():
+    # Arrange
+    lines = [f"({i}, {i})" for i in range(5)]
+
+    # Act
+    chunks = list(iter_point_chunks(lines, chunk_size=2))
+
+    # Assert
+    assert [len(chunk.points) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[2].points.x) == [4.0]
+
+
+def test_no_valid_lines():
+    # Act
+    (chunk,) = iter_point_chunks(["nothing here"])
+
+    # Assert
+    assert chunk.points is None
+    assert len(chunk.errors) == 1
+
+
+def test_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(iter_point_chunks([], chunk_size=0))
+
+
+def test_read_point_chunks(tmp_path):
+    # Arrange
+    path = tmp_path / "points.txt"
+    path.write_text("(1.0, 2.0)\n(3.0, 4.0)\n", encoding="utf-8")
+
+    # Act
+    chunks = list(read_point_chunks(path))
+
+    # Assert
+    assert list(chunks[0].points.y) == [2.0, 4.0]
+
+
+def test_uniform_batch_keeps_names():
+    # Arrange
+    lines = [repr(Point2D(1, 2, "a")), repr(Point2D(3, 4)), ""]
+
+    # Act
+    (chunk,) = iter_point_chunks(lines)
+
+    # Assert
+    assert chunk.points.names == ["a", None]
+    assert list(chunk.points.y) == [2.0, 4.0]
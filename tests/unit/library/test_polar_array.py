@@ -0,0 +1,142 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library import polar
+from astrocompute.library.polar_array import PolarArray
+from astrocompute.models import Polar
+
+
+@pytest.fixture
+def polars():
+    rng = random.Random(5)
+    return [
+        Polar(rng.uniform(0, 10), rng.uniform(-math.pi, math.pi))
+        for _ in range(50)
+    ]
+
+
+def assert_same_points(actual: PolarArray, expected):
+    for value, (r, theta) in zip(actual, expected):
+        x, y = polar.to_cartesian(r, theta)
+        assert value.r * math.cos(value.theta) == pytest.approx(x, abs=1e-9)
+        assert value.r * math.sin(value.theta) == pytest.approx(y, abs=1e-9)
+
+
+def test_add_and_subtract_match_polar_module(polars):
+    # Arrange
+    p = PolarArray.from_polars(polars)
+    q = PolarArray.from_polars(reversed(polars))
+
+    # Act
+    total = PolarArray.add(p, q)
+    difference = PolarArray.subtract(p, q)
+
+    # Assert
+    pairs = list(zip(polars, reversed(polars)))
+    assert_same_points(
+        total, [polar.add(a.r, a.theta, b.r, b.theta) for a, b in pairs]
+    )
+    assert_same_points(
+        difference,
+        [polar.subtract(a.r, a.theta, b.r, b.theta) for a, b in pairs],
+    )
+
+
+def test_add_broadcasts_a_single_polar(polars):
+    # Arrange
+    p = PolarArray.from_polars(polars)
+    offset = Polar(2.0, 0.5)
+
+    # Act
+    actual = PolarArray.add(p, offset)
+
+    # Assert
+    assert_same_points(
+        actual, [polar.add(a.r, a.theta, 2.0, 0.5) for a in polars]
+    )
+
+
+@pytest.mark.parametrize("scalar", [2.5, -0.5, 0.0])
+def test_scale_matches_polar_module(polars, scalar):
+    # Arrange
+    p = PolarArray.from_polars(polars)
+    shifted = PolarArray.add(PolarArray.from_polars(polars), Polar(1.0, 1.0))
+
+    # Act
+    from_polar = PolarArray.scale(p, scalar)
+    from_cartesian = PolarArray.scale(shifted, scalar)
+
+    # Assert
+    assert from_polar.has_polar and not from_polar.has_cartesian
+    assert from_cartesian.has_cartesian and not from_cartesian.has_polar
+    assert_same_points(
+        from_polar, [polar.multiply(a.r, a.theta, scalar) for a in polars]
+    )
+    assert_same_points(
+        from_cartesian,
+        [polar.multiply(a.r, a.theta, scalar) for a in shifted],
+    )
+
+
+def test_rotate_keeps_both_forms(polars):
+    # Arrange
+    p = PolarArray.from_polars(polars)
+    p.x  # pylint: disable=pointless-statement
+
+    # Act
+    actual = PolarArray.rotate(p, 0.75)
+
+    # Assert
+    assert actual.has_polar and actual.has_cartesian
+    assert list(actual.theta) == [a.theta + 0.75 for a in polars]
+    assert list(actual.x) == pytest.approx(
+        [a.r * math.cos(a.theta + 0.75) for a in polars]
+    )
+
+
+def test_chained_operations_stay_cartesian(polars):
+    # Arrange
+    p = PolarArray.from_polars(polars)
+
+    # Act
+    actual = PolarArray.rotate(
+        PolarArray.scale(PolarArray.add(p, p), 0.5), math.pi / 2
+    )
+
+    # Assert
+    assert not actual.has_polar
+    assert list(actual.r) == pytest.approx([a.r for a in polars])
+
+
+def test_write_invalidates_cartesian_shadow():
+    # Arrange
+    p = PolarArray([1.0, 2.0], [0.0, math.pi / 2])
+    p.x  # pylint: disable=pointless-statement
+
+    # Act
+    p[0] = Polar(3.0, math.pi)
+    p.append(Polar(1.0, 0.0))
+
+    # Assert
+    assert not p.has_cartesian
+    assert list(p.x) == pytest.approx([-3.0, 0.0, 1.0], abs=1e-12)
+    assert len(p) == 3
+
+
+def test_operations_do_not_share_columns():
+    # Arrange
+    p = PolarArray([1.0], [0.0])
+
+    # Act
+    q = PolarArray.rotate(p, 0.0)
+    q[0] = Polar(5.0, 1.0)
+
+    # Assert
+    assert p[0] == Polar(1.0, 0.0)
+
+
+def test_rejects_different_lengths():
+    with pytest.raises(ValueError):
+        PolarArray.add(PolarArray([1.0], [0.0]), PolarArray([1.0, 2.0], [0, 0]))
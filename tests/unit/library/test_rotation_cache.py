@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+
+from astrocompute.library.matrix3d import (
+    compose,
+    rotation_x,
+    rotation_y,
+    rotation_z,
+)
+from astrocompute.library.rotation_cache import CacheInfo, RotationChainCache
+
+
+def test_matrix_composes_in_registration_order():
+    # Arrange
+    cache = RotationChainCache()
+    cache.register("chain", rotation_z, rotation_x, rotation_y)
+
+    # Act
+    actual = cache.matrix("chain", 0.3)
+
+    # Assert
+    expected = compose(rotation_z(0.3), rotation_x(0.3), rotation_y(0.3))
+    assert actual.data == expected.data
+
+
+def test_matrix_reports_hits_and_misses():
+    # Arrange
+    cache = RotationChainCache(maxsize=4)
+    cache.register("chain", rotation_x, rotation_z)
+
+    # Act
+    first = cache.matrix("chain", 0.1)
+    second = cache.matrix("chain", 0.1)
+    cache.matrix("chain", 0.2)
+
+    # Assert
+    assert first is second
+    assert cache.cache_info() == CacheInfo(
+        hits=1, misses=2, maxsize=4, currsize=2
+    )
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache = RotationChainCache(maxsize=2)
+    cache.register("chain", rotation_x)
+    cache.matrix("chain", 1.0)
+    cache.matrix("chain", 2.0)
+
+    # Act
+    cache.matrix("chain", 1.0)
+    cache.matrix("chain", 3.0)
+    cache.matrix("chain", 1.0)
+    cache.matrix("chain", 2.0)
+
+    # Assert
+    assert cache.cache_info() == CacheInfo(
+        hits=2, misses=4, maxsize=2, currsize=2
+    )
+
+
+def test_register_replaces_cached_entries():
+    # Arrange
+    cache = RotationChainCache()
+    cache.register("chain", rotation_x)
+    cache.matrix("chain", 0.5)
+
+    # Act
+    cache.register("chain", rotation_y)
+    actual = cache.matrix("chain", 0.5)
+
+    # Assert
+    assert actual.data == rotation_y(0.5).data
+    assert cache.cache_info().hits == 0
+
+
+def test_register_during_a_miss_does_not_cache_the_old_chain():
+    # Arrange
+    cache = RotationChainCache()
+    started, proceed = threading.Event(), threading.Event()
+
+    def slow_rotation_x(angle):
+        started.set()
+        proceed.wait(5)
+        return rotation_x(angle)
+
+    cache.register("chain", slow_rotation_x)
+    results = []
+    miss = threading.Thread(
+        target=lambda: results.append(cache.matrix("chain", 0.5))
+    )
+
+    # Act
+    miss.start()
+    started.wait(5)
+    cache.register("chain", rotation_y)
+    proceed.set()
+    miss.join(5)
+    actual = cache.matrix("chain", 0.5)
+
+    # Assert
+    assert results[0].data == rotation_x(0.5).data
+    assert actual.data == rotation_y(0.5).data
+    assert cache.cache_info().currsize == 1
+
+
+def test_cache_clear():
+    # Arrange
+    cache = RotationChainCache()
+    cache.register("chain", rotation_x)
+    cache.matrix("chain", 0.5)
+
+    # Act
+    cache.cache_clear()
+
+    # Assert
+    assert cache.cache_info() == CacheInfo(0, 0, 128, 0)
+
+
+def test_unknown_chain_raises():
+    with pytest.raises(KeyError):
+        RotationChainCache().matrix("missing", 0.0)
+
+
+def test_invalid_maxsize_raises():
+    with pytest.raises(ValueError):
+        RotationChainCache(maxsize=0)
@@ -0,0 +1,165 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library import separation as sep
+from astrocompute.library.spherical import SphericalPosition
+from astrocompute.models import Spherical
+
+
+@pytest.fixture
+def positions():
+    rng = random.Random(13)
+    thetas = [math.acos(rng.uniform(-1, 1)) for _ in range(40)]
+    phis = [rng.uniform(-math.pi, math.pi) for _ in range(40)]
+    return thetas, phis
+
+
+def dot_separation(theta1, phi1, theta2, phi2):
+    u = (
+        math.sin(theta1) * math.cos(phi1),
+        math.sin(theta1) * math.sin(phi1),
+        math.cos(theta1),
+    )
+    v = (
+        math.sin(theta2) * math.cos(phi2),
+        math.sin(theta2) * math.sin(phi2),
+        math.cos(theta2),
+    )
+    return math.acos(max(-1.0, min(1.0, sum(a * b for a, b in zip(u, v)))))
+
+
+@pytest.mark.parametrize(
+    "p, q, expected",
+    [
+        (Spherical(1, math.pi / 2, 0), Spherical(1, math.pi / 2, 0), 0.0),
+        (Spherical(1, 0, 0), Spherical(1, math.pi, 0), math.pi),
+        (Spherical(1, math.pi / 2, 0), Spherical(1, math.pi / 2, 1), 1.0),
+        (Spherical(1, 0.5, 0), Spherical(1, 0.75, 0), 0.25),
+    ],
+)
+def test_separation(p: Spherical, q: Spherical, expected: float):
+    # Act
+    actual = sep.separation(p, q)
+
+    # Assert
+    assert actual == pytest.approx(expected, abs=1e-15)
+
+
+def test_separation_is_accurate_at_tiny_angles():
+    # Arrange
+    p = Spherical(1.0, 1.0, 0.3)
+    q = Spherical(1.0, 1.0 + 1e-10, 0.3)
+
+    # Act
+    actual = sep.separation(p, q)
+
+    # Assert
+    assert actual == pytest.approx(1e-10, rel=1e-6)
+
+
+@pytest.mark.parametrize(
+    "q, expected",
+    [
+        (Spherical(1, 0.9, 0.0), 0.0),
+        (Spherical(1, 1.0, 0.01), math.pi / 2),
+        (Spherical(1, 1.1, 0.0), math.pi),
+        (Spherical(1, 1.0, -0.01), 3 * math.pi / 2),
+    ],
+)
+def test_position_angle(q: Spherical, expected: float):
+    # Act
+    actual = sep.position_angle(SphericalPosition(1.0, 1.0, 0.0), q)
+
+    # Assert
+    assert actual == pytest.approx(expected, abs=1e-2)
+
+
+def test_one_to_many_and_paired_agree(positions):
+    # Arrange
+    thetas, phis = positions
+    p = Spherical(1.0, thetas[0], phis[0])
+    n = len(thetas)
+
+    # Act
+    one_to_many = sep.separation_one_to_many(p, thetas, phis)
+    paired = sep.separation_paired([p.theta] * n, [p.phi] * n, thetas, phis)
+    angles = sep.position_angle_one_to_many(p, thetas, phis)
+    paired_angles = sep.position_angle_paired(
+        [p.theta] * n, [p.phi] * n, thetas, phis
+    )
+
+    # Assert
+    assert list(one_to_many) == pytest.approx(list(paired), abs=1e-15)
+    assert list(one_to_many) == pytest.approx(
+        [dot_separation(p.theta, p.phi, t, f) for t, f in zip(thetas, phis)],
+        abs=1e-7,
+    )
+    assert list(angles) == pytest.approx(list(paired_angles), abs=1e-12)
+    assert all(0 <= a < 2 * math.pi for a in angles)
+
+
+def test_blocks_cover_the_whole_matrix(positions):
+    # Arrange
+    thetas, phis = positions
+
+    # Act
+    blocks = list(sep.iter_separation_blocks(thetas, phis, thetas, phis, 16))
+
+    # Assert
+    assert [start for start, _ in blocks] == [0, 16, 32]
+    rows = [row for _, block in blocks for row in block]
+    assert len(rows) == 40 and all(len(row) == 40 for row in rows)
+    for i, row in enumerate(rows):
+        assert row[i] == 0.0
+        p = Spherical(1.0, thetas[i], phis[i])
+        assert list(row) == list(sep.separation_one_to_many(p, thetas, phis))
+
+
+def test_position_angle_blocks_cover_the_whole_matrix(positions):
+    # Arrange
+    thetas, phis = positions
+
+    # Act
+    blocks = list(
+        sep.iter_position_angle_blocks(thetas, phis, thetas, phis, 16)
+    )
+
+    # Assert
+    assert [start for start, _ in blocks] == [0, 16, 32]
+    rows = [row for _, block in blocks for row in block]
+    assert len(rows) == 40 and all(len(row) == 40 for row in rows)
+    for i, row in enumerate(rows):
+        p = Spherical(1.0, thetas[i], phis[i])
+        assert list(row) == list(
+            sep.position_angle_one_to_many(p, thetas, phis)
+        )
+
+
+def test_position_angle_blocks_reject_empty_chunks(positions):
+    thetas, phis = positions
+    with pytest.raises(ValueError):
+        next(sep.iter_position_angle_blocks(thetas, phis, thetas, phis, 0))
+
+
+def test_pairs_within(positions):
+    # Arrange
+    thetas, phis = positions
+
+    # Act
+    pairs = list(sep.pairs_within(thetas, phis, thetas, phis, 0.5, 7))
+
+    # Assert
+    expected = [
+        (i, j)
+        for i in range(40)
+        for j in range(40)
+        if dot_separation(thetas[i], phis[i], thetas[j], phis[j]) <= 0.5
+    ]
+    assert [(i, j) for i, j, _ in pairs] == expected
+
+
+def test_rejects_different_lengths():
+    with pytest.raises(ValueError):
+        sep.separation_paired([0.1], [0.2], [0.3, 0.4], [0.5, 0.6])
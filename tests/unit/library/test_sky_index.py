@@ -0,0 +1,128 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library import sky_index
+from astrocompute.library.separation import separation_one_to_many
+from astrocompute.library.sky_index import SkyIndex
+from astrocompute.models import Spherical
+
+
+@pytest.fixture(scope="module")
+def positions():
+    rng = random.Random(17)
+    thetas = [math.acos(rng.uniform(-1, 1)) for _ in range(3000)]
+    phis = [rng.uniform(-math.pi, math.pi) for _ in range(3000)]
+    return thetas, phis
+
+
+@pytest.fixture(scope="module")
+def index(positions):
+    return SkyIndex(*positions, depth=8)
+
+
+def inside(triangle, point):
+    return all(
+        sky_index._dot(sky_index._cross(a, b), point) >= -1e-12
+        for a, b in zip(triangle, triangle[1:] + triangle[:1])
+    )
+
+
+def test_pixel_ids_contain_their_positions(positions):
+    # Act
+    ids = sky_index.pixel_ids(*positions, depth=6)
+
+    # Assert
+    for theta, phi, pixel_id in zip(*positions, ids):
+        assert sky_index.pixel_level(pixel_id) == 6
+        point = sky_index._unit(theta, phi)
+        assert inside(sky_index.pixel_vertices(pixel_id), point)
+
+
+def test_pixel_vertices_rejects_invalid_ids():
+    with pytest.raises(ValueError):
+        sky_index.pixel_vertices(5)
+
+
+@pytest.mark.parametrize("radius", [0.0, 0.02, 0.2, 1.0, 2.5])
+def test_query_cone_matches_full_scan(positions, index, radius):
+    # Arrange
+    thetas, phis = positions
+    center = Spherical(1.0, 1.2, -2.0)
+
+    # Act
+    actual = index.query_cone(center.theta, center.phi, radius)
+
+    # Assert
+    separations = separation_one_to_many(center, thetas, phis)
+    assert actual == [i for i, s in enumerate(separations) if s <= radius]
+
+
+def test_query_cone_finds_exact_position(positions, index):
+    # Arrange
+    thetas, phis = positions
+
+    # Act
+    actual = index.query_cone(thetas[42], phis[42], 0.0)
+
+    # Assert
+    assert actual == [42]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_query_polygon_matches_full_scan(positions, index, reverse):
+    # Arrange
+    thetas, phis = positions
+    vertices = [(0.8, 0.1), (0.8, 0.9), (1.4, 0.9), (1.4, 0.1)]
+    normals = sky_index._half_spaces(vertices)
+
+    # Act
+    actual = index.query_polygon(vertices[::-1] if reverse else vertices)
+
+    # Assert
+    expected = [
+        i
+        for i, (theta, phi) in enumerate(zip(thetas, phis))
+        if all(
+            sky_index._dot(n, sky_index._unit(theta, phi)) >= 0 for n in normals
+        )
+    ]
+    assert actual == expected
+
+
+def test_query_polygon_rejects_non_convex_polygons(index):
+    with pytest.raises(ValueError):
+        index.query_polygon([(1, 0), (1, 1), (1.2, 0.5), (1.4, 1), (1.4, 0)])
+
+
+def test_cover_ranges_are_compressed():
+    # Act
+    cover = sky_index.cone_cover(1.0, 0.5, 0.3, depth=10)
+
+    # Assert
+    ranges = sorted(cover.inside + cover.partial)
+    assert all(a[1] <= b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(a[1] != b[0] for a, b in zip(cover.inside, cover.inside[1:]))
+    covered = sum(stop - start for start, stop in cover.inside)
+    assert covered > 4 * len(cover.inside)
+
+
+def test_from_radec(positions):
+    # Arrange
+    thetas, phis = positions
+    ras = [math.degrees(phi) % 360 for phi in phis]
+    decs = [90 - math.degrees(theta) for theta in thetas]
+
+    # Act
+    index = SkyIndex.from_radec(ras, decs, depth=5)
+
+    # Assert
+    theta, phi = sky_index.from_radec(ras[7], decs[7])
+    assert 7 in index.query_cone(theta, phi, 1e-9)
+    assert list(index.ids) == list(sky_index.pixel_ids(thetas, phis, 5))
+
+
+def test_rejects_invalid_depth(positions):
+    with pytest.raises(ValueError):
+        SkyIndex(*positions, depth=sky_index.MAX_DEPTH + 1)
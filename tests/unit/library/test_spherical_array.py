@@ -0,0 +1,159 @@
+import math
+import random
+
+import pytest
+
+from astrocompute.library import matrix3d, spherical
+from astrocompute.library.spherical import SphericalPosition
+from astrocompute.library.spherical_array import SphericalArray
+from astrocompute.models import Spherical
+
+
+@pytest.fixture
+def positions():
+    rng = random.Random(9)
+    return [
+        Spherical(
+            rng.uniform(0.5, 10),
+            rng.uniform(0.1, math.pi - 0.1),
+            rng.uniform(-math.pi, math.pi),
+        )
+        for _ in range(50)
+    ]
+
+
+def assert_same_positions(actual, expected):
+    for a, e in zip(actual, expected):
+        assert spherical.to_cartesian(a) == pytest.approx(
+            spherical.to_cartesian(e), abs=1e-9
+        )
+
+
+def test_add_and_subtract_match_spherical_module(positions):
+    # Arrange
+    p = SphericalArray.from_sphericals(positions)
+    q = SphericalArray.from_sphericals(reversed(positions))
+
+    # Act
+    total = SphericalArray.add(p, q)
+    difference = SphericalArray.subtract(p, q)
+
+    # Assert
+    pairs = list(zip(positions, reversed(positions)))
+    assert not total.has_angles
+    assert_same_positions(total, [spherical.add(a, b) for a, b in pairs])
+    assert_same_positions(
+        difference, [spherical.subtract(a, b) for a, b in pairs]
+    )
+
+
+def test_add_broadcasts_a_single_position(positions):
+    # Arrange
+    p = SphericalArray.from_sphericals(positions)
+    offset = Spherical(1.0, 0.5, 0.25)
+
+    # Act
+    actual = SphericalArray.add(p, SphericalPosition.from_spherical(offset))
+
+    # Assert
+    assert_same_positions(actual, [spherical.add(a, offset) for a in positions])
+
+
+def test_scale_keeps_cached_unit_vectors(positions):
+    # Arrange
+    p = SphericalArray.from_sphericals(positions)
+    unit = p.unit
+
+    # Act
+    actual = SphericalArray.scale(p, -2.0)
+
+    # Assert
+    assert actual.has_unit and actual.has_angles
+    assert actual.unit == unit and actual.unit[0] is not unit[0]
+    assert list(actual) == [spherical.multiply(a, -2.0) for a in positions]
+
+
+def test_rotate_matches_matrix_application(positions):
+    # Arrange
+    p = SphericalArray.from_sphericals(positions)
+    rotation = matrix3d.compose(
+        matrix3d.rotation_x(0.3), matrix3d.rotation_z(-1.2)
+    )
+
+    # Act
+    actual = SphericalArray.rotate(p, rotation)
+
+    # Assert
+    assert list(actual.r) == list(p.r)
+    expected = [
+        matrix3d.apply(rotation, spherical.to_cartesian(a)) for a in positions
+    ]
+    for x, y, z, e in zip(*actual.to_cartesian(), expected):
+        assert (x, y, z) == pytest.approx(e, abs=1e-9)
+
+
+def test_write_recomputes_only_the_written_row(positions):
+    # Arrange
+    p = SphericalArray.from_sphericals(positions[:3])
+    p.unit  # pylint: disable=pointless-statement
+
+    # Act
+    p[1] = Spherical(2.0, math.pi / 2, 0.0)
+    p.append(Spherical(1.0, 0.0, 0.0))
+
+    # Assert
+    assert p.has_unit
+    assert (p.unit[0][1], p.unit[1][1]) == pytest.approx((1.0, 0.0))
+    assert p.unit[2][3] == 1.0
+    assert [u[0] for u in p.unit] == pytest.approx(
+        SphericalPosition.from_spherical(positions[0]).unit
+    )
+
+
+def test_from_cartesian_handles_the_origin():
+    # Act
+    actual = SphericalArray.from_cartesian([0.0, 0.0], [0.0, 2.0], [0.0, 0.0])
+
+    # Assert
+    assert list(actual) == [
+        Spherical(0.0, 0.0, 0.0),
+        Spherical(2.0, math.pi / 2, math.pi / 2),
+    ]
+
+
+def test_position_caches_unit_vector_until_angles_change():
+    # Arrange
+    position = SphericalPosition(2.0, math.pi / 2, 0.0)
+    unit = position.unit
+
+    # Act
+    position.r = 3.0
+    kept = position.unit
+    position.phi = math.pi / 2
+
+    # Assert
+    assert kept is unit
+    assert position.to_cartesian() == pytest.approx((0.0, 3.0, 0.0), abs=1e-12)
+
+
+def test_position_arithmetic_matches_spherical_module(positions):
+    # Arrange
+    a, b = positions[0], positions[1]
+    p, q = SphericalPosition.from_spherical(a), SphericalPosition(b.r)
+    q.theta, q.phi = b.theta, b.phi
+
+    # Act
+    total = SphericalPosition.add(p, q)
+    difference = SphericalPosition.subtract(p, b)
+    scaled = SphericalPosition.scale(p, 3.0)
+    rotated = SphericalPosition.rotate(p, matrix3d.rotation_z(0.5))
+
+    # Assert
+    assert_same_positions(
+        [total.to_spherical(), difference.to_spherical()],
+        [spherical.add(a, b), spherical.subtract(a, b)],
+    )
+    assert scaled.to_spherical() == spherical.multiply(a, 3.0)
+    assert rotated.to_cartesian() == pytest.approx(
+        matrix3d.apply(matrix3d.rotation_z(0.5), spherical.to_cartesian(a))
+    )
@@ -5,15 +5,31 @@ import pytest
 from astrocompute.library.vector import (
     Vector,
     add,
+    add_batch,
     are_orthogonal,
+    are_orthogonal_batch,
     are_parallel,
+    are_parallel_batch,
     are_same_dimension,
+    cross_product,
+    cross_product_batch,
     dot_product,
+    dot_product_batch,
     norm,
+    norm_batch,
     normalize,
+    normalize_batch,
     scalar_multiply,
+    scalar_multiply_batch,
+    triple_product,
+    triple_product_batch,
 )
 
+US_2D = [(1, 2), (-1, -2), (0, 0), (1.5, 2.5), (1, 0)]
+VS_2D = [(3, 4), (-3, -4), (0, 0), (3.5, 4.5), (0, 1)]
+US_3D = [(1, 2, 3), (1, 0, 0), (0, 0, 0), (1, 2, 3), (-2, 0.5, 4)]
+VS_3D = [(4, 5, 6), (0, 1, 0), (0, 0, 0), (2, 4, 6), (1, 1, 1)]
+
 
 @pytest.mark.parametrize(
     "u, v, expected",
@@ -141,3 +157,172 @@ def test_are_parallel(u: Vector, v: Vector, expected: bool):
 )
 def test_are_same_dimension(u: Vector, v: Vector, expected: bool):
     assert are_same_dimension(u, v) == expected
+
+
+@pytest.mark.parametrize("us, vs", [(US_2D, VS_2D), (US_3D, VS_3D)])
+def test_batch_functions_match_scalar_functions(us, vs):
+    # Act & Assert
+    assert add_batch(us, vs) == list(map(add, us, vs))
+    assert scalar_multiply_batch(2.5, us) == [
+        scalar_multiply(2.5, u) for u in us
+    ]
+    assert list(dot_product_batch(us, vs)) == list(map(dot_product, us, vs))
+    assert list(norm_batch(us)) == pytest.approx(list(map(norm, us)))
+    assert are_orthogonal_batch(us, vs) == list(map(are_orthogonal, us, vs))
+    assert are_parallel_batch(us, vs) == list(map(are_parallel, us, vs))
+
+
+def test_batch_functions_broadcast_single_vector():
+    # Act & Assert
+    assert add_batch(US_3D, (1, 1, 1)) == [add(u, (1, 1, 1)) for u in US_3D]
+    assert list(dot_product_batch(US_2D, (0, 1))) == [2, -2, 0, 2.5, 0]
+    assert are_parallel_batch(US_2D, (2, 4)) == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_scalar_multiply_batch_per_row_scalars():
+    # Act
+    actual = scalar_multiply_batch([1, 2, 3], [(1, 1), (1, 1), (1, 1)])
+
+    # Assert
+    assert actual == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_normalize_batch_reports_zero_vectors():
+    # Act
+    units, zeros = normalize_batch([(3, 4, 0), (0, 0, 0), (1, 2, 2), (0, 0, 0)])
+
+    # Assert
+    assert zeros == [1, 3]
+    assert units[1] == units[3] == (0.0, 0.0, 0.0)
+    assert units[0] == pytest.approx((0.6, 0.8, 0.0))
+    assert units[2] == pytest.approx(normalize((1, 2, 2)))
+
+
+def test_normalize_batch_2d():
+    # Act
+    units, zeros = normalize_batch([(3, 4), (-3, -4)])
+
+    # Assert
+    assert zeros == []
+    assert units == [pytest.approx((0.6, 0.8)), pytest.approx((-0.6, -0.8))]
+
+
+@pytest.mark.parametrize("us, vs", [(US_2D, VS_2D), (US_3D, VS_3D)])
+def test_batch_functions_accept_numpy_blocks(us, vs):
+    # Arrange
+    np = pytest.importorskip("numpy")
+    u_block, v_block = np.array(us, dtype=float), np.array(vs, dtype=float)
+
+    # Act & Assert
+    assert add_batch(u_block, v_block) == add_batch(us, vs)
+    assert add_batch(u_block, v_block[1]) == add_batch(us, vs[1])
+    assert list(dot_product_batch(u_block, v_block)) == list(
+        dot_product_batch(us, vs)
+    )
+    assert list(norm_batch(u_block)) == list(norm_batch(us))
+    assert normalize_batch(u_block) == normalize_batch(us)
+    assert are_orthogonal_batch(u_block, v_block) == are_orthogonal_batch(
+        us, vs
+    )
+    assert are_parallel_batch(u_block, v_block) == are_parallel_batch(us, vs)
+    assert add_batch(np.empty((0, 3)), np.empty((0, 3))) == []
+
+
+def test_scalar_multiply_batch_accepts_numpy_scalars():
+    # Arrange
+    np = pytest.importorskip("numpy")
+    block = np.array(US_3D, dtype=float)
+    scalars = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+    # Act & Assert
+    assert scalar_multiply_batch(scalars, block) == scalar_multiply_batch(
+        [1.0, 2.0, 3.0, 4.0, 5.0], US_3D
+    )
+    assert scalar_multiply_batch(np.float64(2.5), block) == (
+        scalar_multiply_batch(2.5, US_3D)
+    )
+    with pytest.raises(ValueError):
+        scalar_multiply_batch(scalars[:2], block)
+
+
+def test_batch_functions_handle_empty_blocks():
+    # Act & Assert
+    assert add_batch([], []) == []
+    assert len(norm_batch([])) == 0
+    assert normalize_batch([]) == ([], [])
+
+
+@pytest.mark.parametrize(
+    "us, vs",
+    [
+        ([(1, 2, 3)], [(1, 2, 3), (4, 5, 6)]),
+        ([(1, 2, 3)], [(1, 2)]),
+        ([(1, 2, 3, 4)], [(1, 2, 3, 4)]),
+    ],
+)
+def test_batch_functions_reject_mismatched_blocks(us, vs):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        dot_product_batch(us, vs)
+
+
+@pytest.mark.parametrize(
+    "u, v, expected",
+    [
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+        ((0, 1, 0), (1, 0, 0), (0, 0, -1)),
+        ((1, 2, 3), (4, 5, 6), (-3, 6, -3)),
+        ((1, 2, 3), (2, 4, 6), (0, 0, 0)),
+    ],
+)
+def test_cross_product(u: Vector, v: Vector, expected: Vector):
+    assert cross_product(u, v) == expected
+
+
+@pytest.mark.parametrize(
+    "u, v, w, expected",
+    [
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1), 1),
+        ((0, 1, 0), (1, 0, 0), (0, 0, 1), -1),
+        ((1, 2, 3), (4, 5, 6), (7, 8, 9), 0),
+        ((2, 0, 0), (0, 3, 0), (1, 1, 4), 24),
+    ],
+)
+def test_triple_product(u: Vector, v: Vector, w: Vector, expected: float):
+    assert triple_product(u, v, w) == expected
+    assert triple_product(u, v, w) == dot_product(u, cross_product(v, w))
+
+
+def test_cross_and_triple_product_batch():
+    # Arrange
+    ws = [(0, 0, 1), (1, 1, 1), (2, -1, 0), (3, 3, 3), (0.5, 0, -2)]
+
+    # Act & Assert
+    assert cross_product_batch(US_3D, VS_3D) == list(
+        map(cross_product, US_3D, VS_3D)
+    )
+    assert cross_product_batch(US_3D, (0, 0, 1)) == [
+        cross_product(u, (0, 0, 1)) for u in US_3D
+    ]
+    assert list(triple_product_batch(US_3D, VS_3D, ws)) == list(
+        map(triple_product, US_3D, VS_3D, ws)
+    )
+    assert list(triple_product_batch(US_3D, (1, 0, 0), (0, 1, 0))) == [
+        3,
+        0,
+        0,
+        3,
+        4,
+    ]
+
+
+def test_cross_product_batch_rejects_2d_vectors():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        cross_product_batch([(1, 2)], [(3, 4)])
@@ -0,0 +1,76 @@
+import dataclasses
+
+import pytest
+
+from astrocompute.models import (
+    FrozenPoint2D,
+    FrozenPoint3D,
+    FrozenPolar,
+    FrozenSpherical,
+    FrozenVector2D,
+    FrozenVector3D,
+    Point2D,
+    Point3D,
+    Polar,
+    Spherical,
+    Vector2D,
+    Vector3D,
+)
+
+MUTABLE_MODELS = [Point2D, Point3D, Vector2D, Vector3D, Polar, Spherical]
+FROZEN_MODELS = [
+    FrozenPoint2D,
+    FrozenPoint3D,
+    FrozenVector2D,
+    FrozenVector3D,
+    FrozenPolar,
+    FrozenSpherical,
+]
+
+
+@pytest.mark.parametrize("model", MUTABLE_MODELS + FROZEN_MODELS)
+def test_models_are_slotted(model):
+    # Arrange
+    instance = model()
+
+    # Assert
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        instance.extra = 1.0
+
+
+@pytest.mark.parametrize("model", MUTABLE_MODELS)
+def test_mutable_models_are_mutable(model):
+    # Arrange
+    instance = model()
+    field = dataclasses.fields(model)[0].name
+
+    # Act
+    setattr(instance, field, 2.0)
+
+    # Assert
+    assert getattr(instance, field) == 2.0
+
+
+@pytest.mark.parametrize("model", FROZEN_MODELS)
+def test_frozen_models_are_hashable(model):
+    # Arrange
+    count = len(dataclasses.fields(model))
+    a = model(*range(1, count + 1))
+    b = model(*range(1, count + 1))
+
+    # Act & Assert
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+@pytest.mark.parametrize("model", FROZEN_MODELS)
+def test_frozen_models_are_immutable(model):
+    # Arrange
+    instance = model()
+    field = dataclasses.fields(model)[0].name
+
+    # Act & Assert
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(instance, field, 2.0)